@@ -15,6 +15,13 @@ class Config:
         self.anim = True
         self.loading = 0
         self.cheats = True
+        # Log level of every module and overrides per dotted module path,
+        # e.g. {"lib.widgets": "INFO"}
+        self.logLevel = "DEBUG"
+        self.logModuleLevels = {}
+        # Also write LOG__<time>__.jsonl for the engine's log viewer
+        self.structuredLog = False
+        self.apply_log_settings()
         logger.warning("Config initialized")
 
     def to_dict(self):
@@ -23,7 +30,10 @@ class Config:
             'language': self.language,
             'anim': self.anim,
             'loading': self.loading,
-            'cheats': self.cheats
+            'cheats': self.cheats,
+            'logLevel': self.logLevel,
+            'logModuleLevels': self.logModuleLevels,
+            'structuredLog': self.structuredLog
         }
 
     def from_dict(self, data):
@@ -31,4 +41,16 @@ class Config:
         self.language = data['language']
         self.anim = data['anim']
         self.loading = data['loading']
-        self.cheats = data['cheats']
\ No newline at end of file
+        self.cheats = data['cheats']
+        # Missing in saves made before these settings existed
+        self.logLevel = data.get('logLevel', self.logLevel)
+        self.logModuleLevels = data.get('logModuleLevels', self.logModuleLevels)
+        self.structuredLog = data.get('structuredLog', self.structuredLog)
+        self.apply_log_settings()
+
+    def apply_log_settings(self):
+        logger.set_structured(self.structuredLog)
+        try:
+            logger.set_levels(self.logLevel, self.logModuleLevels)
+        except ValueError as e:
+            logger.warning(f"Invalid log level in config: {e}")
\ No newline at end of file
@@ -6,12 +6,39 @@ class Levels:
         def __init__(self, level_id: int, name: str, description: str):
             self.level_id = level_id
             self.name = name
+            self.description = description
 
             self.PlayerSpawnX = 0
             self.PlayerSpawnY = 0
 
             self.level_map = []
 
+        # Доступ к тайлам идет через эти методы, чтобы уровни могли хранить
+        # карту не только списком строк (см. lib/ChunkedLevel.py)
+        @property
+        def width(self) -> int:
+            return len(self.level_map[0]) if self.level_map else 0
+
+        @property
+        def height(self) -> int:
+            return len(self.level_map)
+
+        def get_tile(self, x: int, y: int):
+            """Символ тайла или None за пределами карты"""
+            if 0 <= y < len(self.level_map):
+                row = self.level_map[y]
+                if 0 <= x < len(row):
+                    return row[x]
+            return None
+
+        def get_row(self, y: int, start: int = 0, stop: int = None) -> str:
+            """Часть строки карты [start, stop)"""
+            return self.level_map[y][start:stop]
+
+        def iter_rows(self):
+            """Все строки карты по порядку, для обработки уровня целиком"""
+            return iter(self.level_map)
+
     class Level0(BaseLevel):
         def __init__(self):
             super().__init__(0, "Test Level", "This is a TEST!")
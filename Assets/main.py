@@ -1,10 +1,13 @@
+import argparse
 import curses
-import time
 
 from lib.ConsoleSettings import console_settings
 from lib.Logger import logger
 from lib.SaveManager import save_manager
 from lib.Localization import loc
+from lib.MainLoop import MainLoop
+from lib.EventSystem import event_system
+from lib.SessionRecorder import SessionRecorder
 
 from controller.MenuController import MenuController
 from controller.LibController import LibController
@@ -13,8 +16,10 @@ from controller.AudioController import AudioController
 from data.Config import Config
 
 class App():
-    def __init__(self):
+    def __init__(self, record_path=None):
         self.win = None
+        self.main_loop = None
+        self.record_path = record_path
         self.lib_controller = LibController.get_instance()
         self.config = Config.get_instance()
 
@@ -38,31 +43,53 @@ class App():
         self.run()
 
     def run(self):
+        self.boot()
+
+        recorder = None
+        if self.record_path:
+            recorder = SessionRecorder(self.record_path)
+            recorder.start(self.lib_controller.input_controller, event_system)
+        try:
+            self.main_loop.run()
+        finally:
+            if recorder is not None:
+                recorder.stop()
+
+    def boot(self):
+        """Load the game data and create the main loop, everything but running it"""
         save_manager.load_all_game_data()
         loc.set_language(self.config.language)
 
         if self.config.loading == 0:
-            self.lib_controller.consolas.loading_animation()
+            loading = self.lib_controller.consolas.loading_animation()
         else:
-            self.lib_controller.consolas.fast_loading()
+            loading = self.lib_controller.consolas.fast_loading()
 
         self.config.loading += 1
 
+        # The loading screen animates on the main loop, the menu waits for it
+        loading.animation.add_done_callback(self._show_main_menu)
+
+        self.main_loop = MainLoop(self.win, self.lib_controller.input_controller)
+        # Posted events are delivered once per frame, before the screen is flushed
+        self.main_loop.add_frame_callback(event_system.flush_posted)
+        self.main_loop.add_frame_callback(self.lib_controller.consolas.flush)
+        self.main_loop.add_resize_callback(self.lib_controller.consolas.resize)
+
+    def _show_main_menu(self):
         AudioController.get_instance().play_music("background")
         #MenuController.get_instance().show_world_map_test()
         MenuController.get_instance().show_main_menu()
 
-        while True:
-            c = self.win.getch()
-            if c != -1:
-                self.lib_controller.input_controller.handle_key(c)
-            time.sleep(0.01)
-
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="PATH", help="record keys and events of the session (see benchmarks/bench_replay.py)")
+    args = parser.parse_args()
+
     try:
         console_settings.open_terminal_fullscreen()
 
-        app = App()
+        app = App(record_path=args.record)
         curses.wrapper(app.start)
 
     except Exception as e:
@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Keep the game logger's records in memory, runs leave no LOG folder behind
+os.environ.setdefault("GAME_LOG_MODE", "memory")
+
+# Game modules import each other as `data.*`, like Assets/bootstrap.py sets up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS = os.path.join(ROOT, "Assets")
+if ASSETS not in sys.path:
+    sys.path.append(ASSETS)
@@ -0,0 +1,76 @@
+"""
+Per-frame coalescing benchmark: emit vs post + flush_posted
+
+Every frame fires --burst "player_moved" events and one "stats_changed"
+event per step. "emit" dispatches each one immediately; "batch" posts them
+with the "latest" and "sum" policies and delivers them once per frame with
+flush_posted, like the main loop does. Each handler call does --work
+iterations of busywork standing in for a redraw or a stats update; the
+last column is the frame time saved against "emit".
+
+    python -m benchmarks.bench_event_batch [--frames N] [--burst N] [--handlers N] [--work N]
+"""
+import argparse
+import logging
+import time
+from dataclasses import dataclass
+
+from lib.EventSystem import EventData, EventSystem
+
+
+@dataclass
+class StatsChanged(EventData):
+    health: int = 0
+
+
+def build(handlers, coalesce, work):
+    event_system = EventSystem()
+    calls = [0]
+
+    def handler(event):
+        calls[0] += 1
+        for _ in range(work):
+            pass
+
+    for _ in range(handlers):
+        event_system.subscribe("player_moved", handler)
+        event_system.subscribe("stats_changed", handler)
+    if coalesce:
+        event_system.set_coalescing("player_moved", "latest")
+        event_system.set_coalescing("stats_changed", "sum")
+    return event_system, calls
+
+
+def run(mode, frames, burst, handlers, work):
+    event_system, calls = build(handlers, mode == "batch", work)
+    send = event_system.post if mode == "batch" else event_system.emit
+    start = time.perf_counter()
+    for frame in range(frames):
+        for step in range(burst):
+            send("player_moved", source=(frame, step))
+            send("stats_changed", StatsChanged("stats_changed", time.time(), health=-1))
+        event_system.flush_posted()
+    return time.perf_counter() - start, calls[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=500)
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--handlers", type=int, default=5)
+    parser.add_argument("--work", type=int, default=50, help="busywork iterations per handler call")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{args.frames} frames, {args.burst * 2} events per frame, {args.handlers} handlers per event")
+    print(f"{'mode':<8} {'us/frame':>10} {'handler calls':>14} {'saved':>7}")
+    baseline = None
+    for mode in ("emit", "batch"):
+        elapsed, calls = run(mode, args.frames, args.burst, args.handlers, args.work)
+        per_frame = elapsed / args.frames * 1e6
+        baseline = baseline or per_frame
+        print(f"{mode:<8} {per_frame:>10.1f} {calls:>14} {1 - per_frame / baseline:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+EventSystem dispatch benchmark: emits per second with 1, 10 and 1000 handlers
+
+"copy" is the previous EventSystem: subscribe re-sorts the handler list,
+emit copies it under the lock. "tuple" is the current copy-on-write
+dispatch. Also times subscribing all the handlers. With --profile a
+"profiled" row adds the tuple dispatch with handler profiling enabled.
+
+    python -m benchmarks.bench_event_dispatch [--emits N] [--threading] [--profile]
+"""
+import argparse
+import logging
+import time
+
+from lib.EventSystem import EventData, EventHandler, EventPriority, EventSystem
+
+PRIORITIES = list(EventPriority)
+
+
+class CopyingEventSystem(EventSystem):
+    """subscribe and emit as they were before the dispatch tuples"""
+    def subscribe(self, event_name, callback, priority=EventPriority.NORMAL, once=False, weak_ref=False):
+        with self._get_lock():
+            if event_name not in self._handlers:
+                self._handlers[event_name] = []
+            handler = EventHandler(callback, priority, once, weak_ref)
+            self._handlers[event_name].append(handler)
+            self._handlers[event_name].sort(key=lambda h: h.priority.value, reverse=True)
+            self._logger.debug(f"Handler subscribed to event '{event_name}'")
+            return handler
+
+    def emit(self, event_name, event_data=None, **kwargs):
+        if event_data is None:
+            event_data = EventData(event_name=event_name, timestamp=time.time(), **kwargs)
+        for filter_func in self._global_filters:
+            if not filter_func(event_data):
+                return []
+        self._add_to_history(event_data)
+
+        results = []
+        handlers_to_remove = []
+        with self._get_lock():
+            if event_name not in self._handlers:
+                return results
+            handlers = self._handlers[event_name].copy()
+        for handler in handlers:
+            if not handler.is_valid():
+                handlers_to_remove.append(handler)
+                continue
+            if event_data.cancelled:
+                break
+            try:
+                results.append(handler.call(event_data))
+                if handler.once:
+                    handlers_to_remove.append(handler)
+            except Exception as e:
+                self._logger.error(f"Error in handler for event '{event_name}': {e}")
+        if handlers_to_remove:
+            with self._get_lock():
+                for handler in handlers_to_remove:
+                    if handler in self._handlers[event_name]:
+                        self._handlers[event_name].remove(handler)
+        self._logger.debug(f"Event '{event_name}' handled by {len(results)} handlers")
+        return results
+
+
+def handler(event_data):
+    return None
+
+
+def bench(system_cls, handlers, emits, use_threading, profile=False):
+    system = system_cls(use_threading=use_threading)
+    if profile:
+        system.enable_profiling()
+    start = time.perf_counter()
+    for i in range(handlers):
+        system.subscribe("tick", handler, PRIORITIES[i % len(PRIORITIES)])
+    subscribe_ms = (time.perf_counter() - start) * 1e3
+
+    emit = system.emit
+    start = time.perf_counter()
+    for _ in range(emits):
+        emit("tick")
+    elapsed = time.perf_counter() - start
+    return emits / elapsed, subscribe_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--emits", type=int, default=100_000, help="emits with 1 handler, scaled down for more")
+    parser.add_argument("--threading", action="store_true", help="use EventSystem(use_threading=True)")
+    parser.add_argument("--profile", action="store_true", help="also run with handler profiling enabled")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'system':<8} {'handlers':>9} {'emits/s':>12} {'subscribe ms':>13}")
+    for handlers in (1, 10, 1000):
+        emits = max(200, args.emits // handlers)
+        systems = [("copy", CopyingEventSystem, False), ("tuple", EventSystem, False)]
+        if args.profile:
+            systems.append(("profiled", EventSystem, True))
+        for name, cls, profile in systems:
+            rate, subscribe_ms = bench(cls, handlers, emits, args.threading, profile)
+            print(f"{name:<8} {handlers:>9} {rate:>12.0f} {subscribe_ms:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+EventSystem history benchmark: list with pop(0) vs the EventHistory ring buffer
+
+Measures the cost of recording one event once the history is full, and
+queries for the last N events of one name and for a time range.
+
+    python -m benchmarks.bench_event_history [--capacity N] [--events N]
+"""
+import argparse
+import time
+
+from lib.EventSystem import EventData, EventHistory
+
+NAMES = [f"event_{i}" for i in range(50)]
+
+
+class ListHistory:
+    """The previous history: a list trimmed with pop(0), queried by scanning"""
+    def __init__(self, capacity):
+        self._events = []
+        self._capacity = capacity
+
+    def append(self, event_data):
+        self._events.append(event_data)
+        if len(self._events) > self._capacity:
+            self._events.pop(0)
+
+    def query(self, limit=None, event_name=None, since=None, until=None):
+        matched = [
+            e for e in self._events
+            if (event_name is None or e.event_name == event_name)
+            and (since is None or e.timestamp >= since)
+            and (until is None or e.timestamp <= until)
+        ]
+        return matched[-limit:] if limit else matched
+
+
+def bench(history_cls, capacity, events, queries):
+    history = history_cls(capacity)
+    data = [EventData(event_name=NAMES[i % len(NAMES)], timestamp=float(i)) for i in range(events)]
+    for event_data in data[:capacity]:
+        history.append(event_data)
+
+    start = time.perf_counter()
+    for event_data in data[capacity:]:
+        history.append(event_data)
+    append_ns = (time.perf_counter() - start) / max(1, events - capacity) * 1e9
+
+    start = time.perf_counter()
+    for i in range(queries):
+        history.query(limit=10, event_name=NAMES[i % len(NAMES)])
+    last_n_us = (time.perf_counter() - start) / queries * 1e6
+
+    newest = float(events - 1)
+    start = time.perf_counter()
+    for i in range(queries):
+        history.query(since=newest - 100 - i % 50, until=newest - i % 50)
+    range_us = (time.perf_counter() - start) / queries * 1e6
+    return append_ns, last_n_us, range_us
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--capacity", type=int, nargs="+", default=[1000, 100_000])
+    parser.add_argument("--events", type=int, default=300_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'history':<8} {'capacity':>9} {'append ns':>10} {'last 10 us':>11} {'range us':>9}")
+    for capacity in args.capacity:
+        for name, cls in (("list", ListHistory), ("ring", EventHistory)):
+            append_ns, last_n_us, range_us = bench(cls, capacity, max(args.events, capacity * 2), args.queries)
+            print(f"{name:<8} {capacity:>9} {append_ns:>10.1f} {last_n_us:>11.1f} {range_us:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
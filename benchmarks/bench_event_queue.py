@@ -0,0 +1,60 @@
+"""
+Queued dispatch benchmark: time the caller is blocked by a slow handler
+
+A handler sleeps --handler-ms (a save or an asset load). "emit" runs it on
+the caller's thread, "emit_queued" hands it to the dispatcher pool and only
+blocks once the bounded queue is full. Reports the caller's time per event
+and the time until every handler has run.
+
+    python -m benchmarks.bench_event_queue [--events N] [--handler-ms MS] [--queue N]
+"""
+import argparse
+import logging
+import time
+
+from lib.EventSystem import EventSystem
+
+
+def run(mode, events, handler_ms, queue_size):
+    event_system = EventSystem()
+    event_system.subscribe("save", lambda event: time.sleep(handler_ms / 1000))
+    if mode == "emit_queued":
+        event_system.start_dispatcher(workers=1, queue_size=queue_size)
+        emit = event_system.emit_queued
+    else:
+        emit = event_system.emit
+
+    caller = []
+    futures = []
+    start = time.perf_counter()
+    for _ in range(events):
+        emit_start = time.perf_counter()
+        futures.append(emit("save"))
+        caller.append(time.perf_counter() - emit_start)
+    if mode == "emit_queued":
+        for future in futures:
+            future.result()
+        event_system.shutdown_dispatcher()
+    total = time.perf_counter() - start
+
+    caller.sort()
+    return caller[len(caller) // 2], caller[-1], sum(caller), total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--handler-ms", type=float, default=2.0)
+    parser.add_argument("--queue", type=int, default=64)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    print(f"{args.events} events, {args.handler_ms} ms handler, queue of {args.queue}")
+    print(f"{'mode':<12} {'median us':>10} {'max ms':>8} {'caller ms':>10} {'total ms':>9}")
+    for mode in ("emit", "emit_queued"):
+        median, worst, blocked, total = run(mode, args.events, args.handler_ms, args.queue)
+        print(f"{mode:<12} {median * 1e6:>10.1f} {worst * 1e3:>8.2f} {blocked * 1e3:>10.1f} {total * 1e3:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Wildcard subscription benchmark: global filter vs topic trie
+
+A game with --families event families ("family3.event7") listens to whole
+families. "filter" is the old workaround: one global filter per listener
+testing the prefix of every emitted event. "trie" subscribes "family3.*"
+and lets the EventSystem resolve and cache the matching handlers.
+
+    python -m benchmarks.bench_event_topics [--emits N] [--families N] [--listeners N]
+"""
+import argparse
+import logging
+import random
+import time
+
+from lib.EventSystem import EventSystem
+
+
+def filter_system(listeners, calls):
+    event_system = EventSystem()
+
+    def make_filter(prefix):
+        def listener(event_data):
+            if event_data.event_name.startswith(prefix):
+                calls[0] += 1
+            return True
+        return listener
+
+    for family in range(listeners):
+        event_system.add_global_filter(make_filter(f"family{family}."))
+    return event_system
+
+
+def trie_system(listeners, calls):
+    event_system = EventSystem()
+
+    def listener(event_data):
+        calls[0] += 1
+
+    for family in range(listeners):
+        event_system.subscribe(f"family{family}.*", listener)
+    return event_system
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--emits", type=int, default=200_000)
+    parser.add_argument("--families", type=int, default=20)
+    parser.add_argument("--listeners", type=int, default=10, help="families with a wildcard listener")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    rng = random.Random(0)
+    names = [f"family{rng.randrange(args.families)}.event{rng.randrange(10)}" for _ in range(args.emits)]
+
+    print(f"{args.emits} emits over {args.families * 10} names, {args.listeners} family listeners")
+    print(f"{'method':<8} {'emits/s':>10} {'calls':>8}")
+    for method, build in (("filter", filter_system), ("trie", trie_system)):
+        calls = [0]
+        event_system = build(args.listeners, calls)
+        emit = event_system.emit
+        start = time.perf_counter()
+        for name in names:
+            emit(name)
+        elapsed = time.perf_counter() - start
+        print(f"{method:<8} {args.emits / elapsed:>10.0f} {calls[0]:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Weak handler churn benchmark: short-lived objects subscribing weakly
+
+Every wave spawns --npcs objects that subscribe a method with weak_ref=True
+to a rarely emitted event ("npc.rare") and to "frame", emits "frame" once
+and drops them, like NPCs of a map that is left, then runs the frame
+callback flush_posted. Reports the objects still
+alive, handlers left, Python heap held and the cost of emitting "frame".
+
+    python -m benchmarks.bench_event_weak [--npcs N] [--waves N]
+"""
+import argparse
+import gc
+import logging
+import time
+import tracemalloc
+
+from lib.EventSystem import EventSystem
+
+
+class NPC:
+    alive = 0
+
+    def __init__(self):
+        self.inventory = [0] * 32
+        NPC.alive += 1
+
+    def __del__(self):
+        NPC.alive -= 1
+
+    def on_event(self, event_data):
+        return None
+
+
+def run_waves(event_system, npcs_per_wave, waves):
+    """Spawn and drop the waves, returns the time of each wave's "frame" emit"""
+    wave_times = []
+    for _ in range(waves):
+        npcs = [NPC() for _ in range(npcs_per_wave)]
+        for npc in npcs:
+            event_system.subscribe("npc.rare", npc.on_event, weak_ref=True)
+            event_system.subscribe("frame", npc.on_event, weak_ref=True)
+        start = time.perf_counter()
+        event_system.emit("frame")
+        wave_times.append(time.perf_counter() - start)
+        del npcs, npc
+        gc.collect()
+        # Next main loop frame
+        event_system.flush_posted()
+    return wave_times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--npcs", type=int, default=5000)
+    parser.add_argument("--waves", type=int, default=10)
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    event_system = EventSystem()
+    # Heap first, tracemalloc would slow down the timed pass
+    tracemalloc.start()
+    run_waves(event_system, args.npcs, args.waves)
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    wave_times = run_waves(event_system, args.npcs, args.waves)
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        event_system.emit("frame")
+    idle_emit = (time.perf_counter() - start) / 1000
+
+    report = event_system.get_handler_report()
+    print(f"{args.waves} waves of {args.npcs} NPCs")
+    print(f"objects alive     {NPC.alive}")
+    print(f"handlers left     {report['handlers']} ({report['dead_handlers']} dead)")
+    print(f"heap held         {heap / 1024:.1f} KiB")
+    print(f"frame emit, wave  {sum(wave_times) / len(wave_times) * 1e3:.2f} ms")
+    print(f"frame emit, idle  {idle_emit * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+InputController microbenchmark: registration and dispatch with many bindings
+
+Compares the previous linear-scan controller with lib.InputController.
+Bindings are laid out like 100 TextBoxWidgets (one binding per printable
+key per widget), with all but one widget paused, as TabControl does.
+
+    python -m benchmarks.bench_input_dispatch [--bindings N]
+"""
+import argparse
+import time
+
+from lib.InputController import InputController
+
+
+class LinearInputController:
+    """The previous implementation: one list scanned on every key press"""
+    def __init__(self):
+        self._events = []
+
+    def handle_key(self, c):
+        for event in self._events:
+            if event.key == c and not event.pause:
+                event.function()
+
+    def _generate_id(self):
+        used_ids = {event.id for event in self._events}
+        candidate = 0
+        while candidate in used_ids:
+            candidate += 1
+        return candidate
+
+    class InputEvent:
+        def __init__(self, controller):
+            self.controller = controller
+            self.id = self.controller._generate_id()
+            self.key = None
+            self.function = None
+            self.pause = False
+
+    def add_input_event(self, key, function, pause=False):
+        event = self.InputEvent(self)
+        event.key = ord(key) if isinstance(key, str) and len(key) == 1 else key
+        event.function = function
+        event.pause = pause
+        self._events.append(event)
+        return event
+
+
+KEYS = list(range(32, 127)) + [10, 13, 127, 8, 259]
+
+
+def bench(controller_cls, bindings, presses):
+    controller = controller_cls()
+    hits = [0]
+
+    def handler():
+        hits[0] += 1
+
+    start = time.perf_counter()
+    for i in range(bindings):
+        controller.add_input_event(KEYS[i % len(KEYS)], handler, pause=i >= len(KEYS))
+    register = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(presses):
+        controller.handle_key(KEYS[i % len(KEYS)])
+    dispatch = time.perf_counter() - start
+
+    assert hits[0] == presses
+    return register, dispatch / presses * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--bindings", type=int, default=10_000)
+    parser.add_argument("--presses", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{args.bindings} bindings, {args.presses} key presses")
+    print(f"{'controller':<12} {'register s':>11} {'us/press':>10}")
+    for name, cls in (("linear", LinearInputController), ("indexed", InputController)):
+        register, per_press = bench(cls, args.bindings, args.presses)
+        print(f"{name:<12} {register:>11.3f} {per_press:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
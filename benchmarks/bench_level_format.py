@@ -0,0 +1,102 @@
+"""
+Level storage benchmark: list of strings vs the chunked mmap format
+
+Builds a --size x --size level with one string per row (what a level class
+holds after import), converts it with lib.ChunkedLevel and compares load
+time, Python heap held by the loaded level, reading the viewport of a
+scrolling camera and scattered single tile reads.
+
+    python -m benchmarks.bench_level_format [--size N] [--view WxH]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from Assets.data.LevelMap import Levels
+from lib.ChunkedLevel import ChunkedLevel, convert_level
+
+
+class FieldLevel(Levels.BaseLevel):
+    """Walled field with scattered obstacles, every row a separate string"""
+    def __init__(self, size):
+        super().__init__(-1, "Benchmark field", "")
+        rng = random.Random(0)
+        patterns = [
+            "".join("#" if rng.random() < 0.05 else " " for _ in range(size - 2))
+            for _ in range(16)
+        ]
+        rows = ["*" * size]
+        rows.extend("*" + patterns[y % len(patterns)] + "*" for y in range(1, size - 1))
+        rows.append("*" * size)
+        self.level_map = rows
+        self.PlayerSpawnX = 1
+        self.PlayerSpawnY = size // 2
+
+
+def load(factory):
+    tracemalloc.start()
+    start = time.perf_counter()
+    level = factory()
+    elapsed = time.perf_counter() - start
+    heap = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return level, elapsed, heap
+
+
+def bench_reads(level, view_width, view_height, frames):
+    rng = random.Random(1)
+    # The camera wanders around the map one tile per frame, like when following the player
+    camera_x, camera_y = level.width // 2, level.height // 2
+    cameras = []
+    for _ in range(frames):
+        camera_x = max(0, min(level.width - view_width, camera_x + rng.choice((-1, 0, 1))))
+        camera_y = max(0, min(level.height - view_height, camera_y + rng.choice((-1, 0, 1))))
+        cameras.append((camera_x, camera_y))
+    start = time.perf_counter()
+    for camera_x, camera_y in cameras:
+        for y in range(camera_y, camera_y + view_height):
+            level.get_row(y, camera_x, camera_x + view_width)
+    per_view = (time.perf_counter() - start) / frames * 1e6
+
+    tiles = [(rng.randrange(level.width), rng.randrange(level.height)) for _ in range(100_000)]
+    start = time.perf_counter()
+    for x, y in tiles:
+        level.get_tile(x, y)
+    per_tile = (time.perf_counter() - start) / len(tiles) * 1e9
+    return per_view, per_tile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=4000)
+    parser.add_argument("--view", default="116x36", help="viewport size in tiles")
+    parser.add_argument("--frames", type=int, default=2000)
+    args = parser.parse_args()
+    view_width, view_height = map(int, args.view.split("x"))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "field.lvl")
+        source = FieldLevel(args.size)
+        start = time.perf_counter()
+        stored = convert_level(source, path)
+        convert_time = time.perf_counter() - start
+        del source
+        print(f"{args.size}x{args.size} level, {stored} chunks, "
+              f"{os.path.getsize(path) / 2**20:.1f} MiB file, converted in {convert_time:.2f} s")
+
+        print(f"{'format':<8} {'load ms':>10} {'heap KiB':>12} {'us/view':>10} {'ns/tile':>10}")
+        for name, factory in (("list", lambda: FieldLevel(args.size)),
+                              ("chunked", lambda: ChunkedLevel(path))):
+            level, elapsed, heap = load(factory)
+            per_view, per_tile = bench_reads(level, view_width, view_height, args.frames)
+            print(f"{name:<8} {elapsed * 1e3:>10.2f} {heap / 1024:>12.1f} {per_view:>10.1f} {per_tile:>10.1f}")
+            if isinstance(level, ChunkedLevel):
+                level.close()
+            del level
+
+
+if __name__ == "__main__":
+    main()
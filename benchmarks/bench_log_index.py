@@ -0,0 +1,98 @@
+"""
+Structured log filtering benchmark: full scan vs sidecar index
+
+Writes a JSONL log of --lines records like JsonFormatter does, then finds
+the WARNING+ records of one module in a time window. "scan" parses every
+line with json.loads, "index" builds the LogIndex once (reported
+separately) and scans only the fixed-size entries. Both return the same
+records; peak memory stays flat since neither keeps the log in memory.
+Then times the first and the last page of 100 records, unfiltered and
+for a selection.
+
+    python -m benchmarks.bench_log_index [--lines N]
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from lib.LogIndex import LogIndex
+
+LEVELS = ["DEBUG"] * 70 + ["INFO"] * 25 + ["WARNING"] * 4 + ["ERROR"]
+MODULES = ["lib.Consolas", "lib.EventSystem", "lib.widgets.PlayerMapWidget",
+           "lib.widgets.MenuWidget", "main", "controller.LibController"]
+
+
+def write_log(path, lines):
+    rng = random.Random(3)
+    start = time.time() - lines / 1000
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(lines):
+            f.write(json.dumps({
+                "time": start + i / 1000,
+                "level": rng.choice(LEVELS),
+                "module": rng.choice(MODULES),
+                "message": f"Position calculated: ({i}, {i * 2}) for widget {i % 7}",
+                "slot": i % 3,
+            }) + "\n")
+    return start
+
+
+def scan(path, module, low, high):
+    found = []
+    with open(path, "rb") as f:
+        for line in f:
+            record = json.loads(line)
+            if (record["level"] in ("WARNING", "ERROR", "CRITICAL") and low <= record["time"] <= high
+                    and "." + module + "." in "." + record["module"] + "."):
+                found.append(record)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--lines", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "LOG__bench__.jsonl")
+        start = write_log(path, args.lines)
+        low, high = start + args.lines / 4000, start + args.lines / 2000
+        module = "lib.widgets"
+        print(f"{args.lines} lines, {os.path.getsize(path) / 1e6:.1f} MB")
+
+        began = time.perf_counter()
+        expected = scan(path, module, low, high)
+        scanned = time.perf_counter() - began
+
+        index = LogIndex(path)
+        began = time.perf_counter()
+        index.update()
+        built = time.perf_counter() - began
+
+        began = time.perf_counter()
+        records = index.read(index.query("WARNING", [module], low, high))
+        queried = time.perf_counter() - began
+        assert records == expected
+
+        print(f"{'method':<12} {'seconds':>8} {'matches':>8}")
+        print(f"{'scan':<12} {scanned:>8.3f} {len(expected):>8}")
+        print(f"{'index build':<12} {built:>8.3f} {'':>8}")
+        print(f"{'index query':<12} {queried:>8.3f} {len(records):>8}")
+        print(f"index size {os.path.getsize(index.index_path) / 1e6:.1f} MB")
+
+        # Pages are read by entry position, the last costs as much as the first
+        for label, selection in (("all lines", None), ("filtered", index.select("WARNING", [module]))):
+            total = len(index) if selection is None else len(selection)
+            times = []
+            for skip in (0, total - 100):
+                began = time.perf_counter()
+                index.page(selection, skip, 100)
+                times.append(time.perf_counter() - began)
+            print(f"page of 100, {label:<9}: first {times[0] * 1e3:.2f} ms, last {times[1] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
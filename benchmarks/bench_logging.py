@@ -0,0 +1,129 @@
+"""
+Logging benchmark: cost of a logger.debug call on the game thread
+
+"sync" is the previous setup, a FileHandler writing and flushing every
+record on the calling thread. "queued" is lib.Logger: the call enqueues
+the record and a background thread writes batches. "inspect" is lib.Logger
+finding the caller with inspect.getmodule as it used to. Reports messages
+per second seen by the caller and the time until everything is on disk.
+--flush-ms adds a delay to every flush, like a slow disk or a virus
+scanner hooking file writes.
+
+The last table is a debug call with the level set to INFO, where nothing
+is written: an f-string message is still formatted by the caller, %-style
+arguments are dropped before any formatting or caller lookup.
+
+    python -m benchmarks.bench_logging [--messages N] [--flush-ms MS]
+"""
+import argparse
+import inspect
+import logging
+import os
+import tempfile
+import time
+
+from lib.Logger import TEXT_FORMAT, Logger
+
+
+class SyncLogger(Logger):
+    """lib.Logger with the handler it had before the queue"""
+    def setup_logger(self):
+        os.makedirs(self.log_folder, exist_ok=True)
+        self.logger = logging.getLogger(self.name)
+        self.logger.setLevel(logging.DEBUG)
+        file_handler = logging.FileHandler(os.path.join(self.log_folder, "sync.log"), encoding='utf-8')
+        file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self.logger.addHandler(file_handler)
+
+    def flush(self):
+        for handler in self.logger.handlers:
+            handler.flush()
+
+    def shutdown(self):
+        for handler in list(self.logger.handlers):
+            handler.close()
+            self.logger.removeHandler(handler)
+
+
+class InspectLogger(Logger):
+    """lib.Logger with the caller lookup it had before the filename cache"""
+    def _get_caller_info(self, depth=2):
+        caller_frame = inspect.currentframe()
+        for _ in range(depth):
+            caller_frame = caller_frame.f_back
+        module = inspect.getmodule(caller_frame)
+
+        if module and module.__file__:
+            abs_path = os.path.abspath(module.__file__)
+            rel_path = os.path.relpath(abs_path, self.root_dir)
+            return rel_path.replace(os.sep, "."), logging.DEBUG
+        return "Unknown File", logging.DEBUG
+
+
+def slow_down(logger, flush_ms):
+    """Make every flush of the file handlers take flush_ms longer"""
+    listener = getattr(logger, "_listener", None)
+    handlers = listener.handlers if listener is not None else logger.logger.handlers
+    for handler in handlers:
+        flush = handler.flush
+
+        def slow_flush(flush=flush):
+            time.sleep(flush_ms / 1000)
+            flush()
+        handler.flush = slow_flush
+
+
+def bench(logger, messages):
+    start = time.perf_counter()
+    for i in range(messages):
+        logger.debug(f"Position calculated: ({i}, {i * 2}) for widget {i % 7}")
+    caller = time.perf_counter() - start
+    logger.flush()
+    total = time.perf_counter() - start
+    logger.shutdown()
+    return caller, total
+
+
+def bench_disabled(logger, messages):
+    logger.set_levels("INFO")
+    start = time.perf_counter()
+    for i in range(messages):
+        logger.debug(f"Position calculated: ({i}, {i * 2}) for widget {i % 7}")
+    eager = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(messages):
+        logger.debug("Position calculated: (%s, %s) for widget %s", i, i * 2, i % 7)
+    lazy = time.perf_counter() - start
+    logger.shutdown()
+    return eager, lazy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--messages", type=int, default=50_000)
+    parser.add_argument("--flush-ms", type=float, default=0.1, help="simulated cost of a flush")
+    args = parser.parse_args()
+
+    print(f"{args.messages} debug messages")
+    print(f"{'logger':<8} {'flush ms':>9} {'caller msg/s':>13} {'us/call':>8} {'written in s':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for flush_ms in (0.0, args.flush_ms):
+            for name, cls in (("sync", SyncLogger), ("inspect", InspectLogger), ("queued", Logger)):
+                logger = cls(os.path.join(tmp, f"{name}{flush_ms}"), name=f"Bench{name}{flush_ms}")
+                logger.start()
+                if flush_ms:
+                    slow_down(logger, flush_ms)
+                caller, total = bench(logger, args.messages)
+                print(f"{name:<8} {flush_ms:>9.2f} {args.messages / caller:>13.0f} "
+                      f"{caller / args.messages * 1e6:>8.2f} {total:>13.2f}")
+
+        logger = Logger(os.path.join(tmp, "disabled"), name="Benchdisabled")
+        logger.start()
+        eager, lazy = bench_disabled(logger, args.messages)
+        print(f"\ndebug below the level   {'ns/call':>8}")
+        print(f"{'f-string':<23} {eager / args.messages * 1e9:>8.0f}")
+        print(f"{'%-style args':<23} {lazy / args.messages * 1e9:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
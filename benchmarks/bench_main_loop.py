@@ -0,0 +1,145 @@
+"""
+Main loop benchmark: idle CPU and key-to-handler latency
+
+Compares the old getch + sleep(0.01) polling loop with lib.MainLoop.
+A pipe stands in for the terminal so the benchmark runs without a TTY.
+
+    python -m benchmarks.bench_main_loop [--idle SECONDS] [--keys N]
+"""
+import argparse
+import os
+import random
+import statistics
+import threading
+import time
+
+from lib.MainLoop import MainLoop
+from lib.Scheduler import Scheduler
+
+STOP_KEY = ord('q')
+TEST_KEY = ord('k')
+
+
+class PipeWindow:
+    """Minimal window reading key codes from a non-blocking pipe"""
+    def __init__(self, fd):
+        self._fd = fd
+        os.set_blocking(fd, False)
+
+    def getch(self):
+        try:
+            data = os.read(self._fd, 1)
+        except BlockingIOError:
+            return -1
+        return data[0] if data else -1
+
+    def nodelay(self, flag):
+        pass
+
+    def timeout(self, delay):
+        pass
+
+
+class RecordingInput:
+    def __init__(self, on_stop):
+        self.received = []
+        self._on_stop = on_stop
+
+    def handle_key(self, c):
+        if c == STOP_KEY:
+            self._on_stop()
+        else:
+            self.received.append(time.perf_counter())
+
+
+class PollingLoop:
+    """The loop App.run used before: getch in nodelay mode + sleep(0.01)"""
+    def __init__(self, win, input_controller):
+        self._win = win
+        self._input_controller = input_controller
+        self._running = False
+
+    def run(self):
+        self._running = True
+        while self._running:
+            c = self._win.getch()
+            if c != -1:
+                self._input_controller.handle_key(c)
+            time.sleep(0.01)
+
+    def stop(self):
+        self._running = False
+
+
+def _make_loop(kind, win, input_controller):
+    if kind == "polling":
+        return PollingLoop(win, input_controller)
+    return MainLoop(win, input_controller, scheduler=Scheduler(), fd=win._fd)
+
+
+def _run_session(kind, drive):
+    """Run a loop in a thread, call drive(write_fd), then stop it via STOP_KEY"""
+    read_fd, write_fd = os.pipe()
+    win = PipeWindow(read_fd)
+    holder = {}
+    input_controller = RecordingInput(lambda: holder["loop"].stop())
+    loop = _make_loop(kind, win, input_controller)
+    holder["loop"] = loop
+    cpu = {}
+
+    def target():
+        start = time.thread_time()
+        loop.run()
+        cpu["seconds"] = time.thread_time() - start
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    drive(write_fd)
+    os.write(write_fd, bytes([STOP_KEY]))
+    thread.join()
+    os.close(read_fd)
+    os.close(write_fd)
+    if isinstance(loop, MainLoop):
+        loop.close()
+    return cpu["seconds"], input_controller.received
+
+
+def measure_idle(kind, idle_seconds):
+    cpu_seconds, _ = _run_session(kind, lambda fd: time.sleep(idle_seconds))
+    return cpu_seconds * 100 / idle_seconds
+
+
+def measure_latency(kind, keys):
+    sent = []
+
+    def drive(fd):
+        for _ in range(keys):
+            time.sleep(random.uniform(0.012, 0.03))
+            sent.append(time.perf_counter())
+            os.write(fd, bytes([TEST_KEY]))
+        time.sleep(0.05)
+
+    _, received = _run_session(kind, drive)
+    latencies = sorted((r - s) * 1e6 for s, r in zip(sent, received))
+    return {
+        "median": statistics.median(latencies),
+        "p99": latencies[max(0, int(len(latencies) * 0.99) - 1)],
+        "max": latencies[-1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--idle", type=float, default=3.0, help="idle phase length in seconds")
+    parser.add_argument("--keys", type=int, default=300, help="number of key presses to time")
+    args = parser.parse_args()
+
+    print(f"{'loop':<10} {'idle CPU %':>10} {'median us':>10} {'p99 us':>10} {'max us':>10}")
+    for kind in ("polling", "selector"):
+        idle_cpu = measure_idle(kind, args.idle)
+        r = measure_latency(kind, args.keys)
+        print(f"{kind:<10} {idle_cpu:>10.2f} {r['median']:>10.1f} {r['p99']:>10.1f} {r['max']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+PlayerMapWidget benchmark: player moves per second on small and huge maps
+
+Each move is one frame: the move itself plus Consolas.flush(). "full"
+repaints the whole viewport after every move like the widget used to,
+"incremental" is the current behaviour (cells only, the exposed strip
+when the camera scrolls). The first map fills the terminal, the second
+is four times the terminal and the third --huge x --huge, both scrolled
+by the camera. Reports moves per second and the worst frame; fails if
+the huge map's incremental mean or worst frame exceeds the 4x map's by
+more than --tolerance, i.e. if the frame cost grows with the map size.
+Runs on the headless curses backend (--lines x --cols); --terminal runs
+inside a real terminal instead, to include its output cost:
+
+    python -m benchmarks.bench_map_moves [--width W] [--height H] [--huge N] [--moves N]
+        [--lines N] [--cols N] [--tolerance X] [--terminal]
+"""
+import argparse
+import curses
+import gc
+import os
+import random
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from Assets.data.LevelMap import Levels
+from lib.CursesBackend import CursesBackend
+
+
+class OpenFieldLevel(Levels.BaseLevel):
+    """Walled field with scattered obstacles and a free corridor in the middle"""
+    def __init__(self, width, height):
+        super().__init__(-1, "Benchmark field", "")
+        rng = random.Random(0)
+        middle = height // 2
+        # A few distinct rows are enough and keep huge maps cheap to build
+        patterns = [
+            "*" + "".join("#" if rng.random() < 0.05 else " " for _ in range(width - 2)) + "*"
+            for _ in range(16)
+        ]
+        rows = ["*" * width]
+        for y in range(1, height - 1):
+            rows.append("*" + " " * (width - 2) + "*" if y == middle else patterns[y % len(patterns)])
+        rows.append("*" * width)
+        self.level_map = rows
+        self.PlayerSpawnX = 1
+        self.PlayerSpawnY = middle
+
+
+def bench_level(consolas, width, height, moves):
+    widget = consolas.create_player_map(level_map=OpenFieldLevel(width, height))
+    consolas.flush()
+
+    # Walk along the corridor, turning before the wall
+    span = min(width - 3, moves)
+    results = {}
+    for mode in ("full", "incremental"):
+        widget.set_player_position(1, height // 2)
+        consolas.flush()
+        gc.collect()
+        frames = []
+        for i in range(moves):
+            began = time.perf_counter()
+            if (i // span) % 2 == 0:
+                widget._move_right()
+            else:
+                widget._move_left()
+            if mode == "full":
+                widget.draw()
+            consolas.flush()
+            frames.append(time.perf_counter() - began)
+        results[mode] = (moves / sum(frames), max(frames))
+    widget.stop()
+    return results
+
+
+def run(win, args):
+    from controller.LibController import LibController
+
+    lib = LibController.get_instance()
+    lib.load_lib(win)
+
+    max_y, max_x = win.getmaxyx()
+    args.width = args.width or max_x - 4
+    args.height = args.height or max_y - 4
+
+    scrolled = (max_x * 4, max_y * 4)
+    return {
+        (args.width, args.height): bench_level(lib.consolas, args.width, args.height, args.moves),
+        scrolled: bench_level(lib.consolas, *scrolled, args.moves),
+        (args.huge, args.huge): bench_level(lib.consolas, args.huge, args.huge, args.moves),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--width", type=int, default=None)
+    parser.add_argument("--height", type=int, default=None)
+    parser.add_argument("--huge", type=int, default=10_000, help="side of the scrolled map")
+    parser.add_argument("--moves", type=int, default=2000)
+    parser.add_argument("--lines", type=int, default=50, help="headless terminal height")
+    parser.add_argument("--cols", type=int, default=160, help="headless terminal width")
+    parser.add_argument("--tolerance", type=float, default=2.0,
+                        help="allowed ratio of the huge map's frame times to the 4x map's")
+    parser.add_argument("--terminal", action="store_true", help="run in the real terminal")
+    args = parser.parse_args()
+
+    if args.terminal:
+        def run_in_terminal(stdscr):
+            curses.curs_set(0)
+            return run(curses.newwin(*stdscr.getmaxyx(), 0, 0), args)
+        results = curses.wrapper(run_in_terminal)
+    else:
+        results = run(CursesBackend.use_headless(args.lines, args.cols), args)
+    print(f"{args.moves} moves per run")
+    print(f"{'map':<14} {'mode':<12} {'moves/s':>12} {'worst ms':>9}")
+    for (width, height), rates in results.items():
+        for mode, (rate, worst) in rates.items():
+            print(f"{f'{width}x{height}':<14} {mode:<12} {rate:>12.1f} {worst * 1e3:>9.2f}")
+
+    # The viewport bounds the cost of a scroll, the map size must not show
+    scrolled, huge = list(results.values())[1:]
+    (scrolled_rate, scrolled_worst), (huge_rate, huge_worst) = scrolled["incremental"], huge["incremental"]
+    assert scrolled_rate <= huge_rate * args.tolerance, \
+        f"huge map moves/s {huge_rate:.1f} vs {scrolled_rate:.1f} on the 4x map"
+    assert huge_worst <= scrolled_worst * args.tolerance, \
+        f"huge map worst frame {huge_worst * 1e3:.2f} ms vs {scrolled_worst * 1e3:.2f} ms on the 4x map"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Collision check benchmark: string lookups vs lib.PassabilityGrid
+
+"string" is the check PlayerMapWidget._can_move_to used to do (bounds,
+row lookup, compare against '*' and '#'); "grid" is PassabilityGrid. Spawn
+search runs on a level whose only free tile is in the bottom right corner.
+
+    python -m benchmarks.bench_passability [--size N] [--checks N]
+"""
+import argparse
+import random
+import time
+
+from Assets.data.LevelMap import Levels
+from lib.PassabilityGrid import PassabilityGrid
+from benchmarks.bench_level_format import FieldLevel
+
+
+class WalledLevel(Levels.BaseLevel):
+    """Solid walls with a single free tile in the last corner"""
+    def __init__(self, size):
+        super().__init__(-1, "Benchmark walls", "")
+        self.level_map = ["*" * size] * (size - 1) + ["*" * (size - 1) + " "]
+
+
+def string_can_move_to(level, x, y):
+    if y < 0 or y >= level.height or x < 0 or x >= level.width:
+        return False
+    cell = level.level_map[y][x]
+    return cell != '*' and cell != '#'
+
+
+def string_find_spawn(level):
+    for y in range(level.height):
+        for x in range(level.width):
+            if string_can_move_to(level, x, y):
+                return x, y
+    return None
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--size", type=int, default=2000)
+    parser.add_argument("--checks", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    level = FieldLevel(args.size)
+    rng = random.Random(0)
+    points = [(rng.randrange(-2, args.size + 2), rng.randrange(-2, args.size + 2)) for _ in range(args.checks)]
+    grid, build = timed(PassabilityGrid.from_level, level)
+
+    def string_checks():
+        return [string_can_move_to(level, x, y) for x, y in points]
+
+    def grid_checks():
+        is_passable = grid.is_passable
+        return [is_passable(x, y) for x, y in points]
+
+    expected, string_time = timed(string_checks)
+    single, grid_time = timed(grid_checks)
+    bulk, bulk_time = timed(grid.are_passable, points)
+    assert expected == single == bulk
+
+    walled = WalledLevel(args.size)
+    walled_grid = PassabilityGrid.from_level(walled)
+    spawn, string_spawn = timed(string_find_spawn, walled)
+    grid_spawn, grid_spawn_time = timed(walled_grid.find_passable)
+    assert spawn == grid_spawn
+
+    print(f"{args.size}x{args.size} level, grid built in {build * 1e3:.1f} ms, {args.checks} random checks")
+    print(f"{'method':<14} {'Mchecks/s':>10} {'spawn ms':>10}")
+    print(f"{'string':<14} {args.checks / string_time / 1e6:>10.2f} {string_spawn * 1e3:>10.1f}")
+    print(f"{'grid':<14} {args.checks / grid_time / 1e6:>10.2f} {grid_spawn_time * 1e3:>10.1f}")
+    print(f"{'grid (bulk)':<14} {args.checks / bulk_time / 1e6:>10.2f} {'':>10}")
+
+
+if __name__ == "__main__":
+    main()
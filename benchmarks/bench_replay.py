@@ -0,0 +1,105 @@
+"""
+Replay a recorded play session headlessly
+
+Record a session with `python Assets/main.py --record session.rec`, then
+replay it against the current build to compare throughput between builds:
+
+    python -m benchmarks.bench_replay session.rec [--realtime] [--speed X]
+        [--output FILE] [--baseline FILE] [--tolerance 0.25]
+
+By default the scheduler runs on a virtual clock, so loading screens,
+animations and output delays take their recorded time in game terms but
+none in wall time. The replay boots the game like main.py and acts on the
+current save files, like a normal session would.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from lib.CursesBackend import CursesBackend
+from lib.EventSystem import event_system
+from lib.Scheduler import Scheduler
+from lib.SessionRecorder import SessionPlayer, VirtualClock
+
+LINES, COLS = 40, 120
+
+
+def boot(lines, cols, realtime):
+    """Start the game on the headless backend, returns the App"""
+    win = CursesBackend.use_headless(lines, cols)
+    clock = None
+    if not realtime:
+        clock = VirtualClock()
+        Scheduler.set_instance(Scheduler(clock=clock))
+
+    from main import App
+
+    app = App()
+    app.win = win
+    app.lib_controller.load_lib(win)
+    app.boot()
+    return app, clock
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("path", help="session recording")
+    parser.add_argument("--realtime", action="store_true", help="wait for the recorded key times")
+    parser.add_argument("--speed", type=float, default=1.0, help="playback speed with --realtime")
+    parser.add_argument("--size", default=f"{COLS}x{LINES}", help="terminal size")
+    parser.add_argument("--output", help="write the results to a JSON file")
+    parser.add_argument("--baseline", help="previous results to compare keys/s with")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+    cols, lines = map(int, args.size.split("x"))
+
+    player = SessionPlayer(args.path)
+    app, clock = boot(lines, cols, args.realtime)
+    stats = player.replay(
+        input_controller=app.lib_controller.input_controller,
+        event_system=event_system,
+        scheduler=Scheduler.get_instance(),
+        frame=app.main_loop.end_frame,
+        realtime=args.realtime,
+        speed=args.speed,
+        clock=clock,
+    )
+
+    result = {
+        "recording": os.path.basename(args.path),
+        "python": platform.python_version(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "realtime": args.realtime,
+        "keys": stats.keys,
+        "events": stats.events,
+        "frames": stats.frames,
+        "recorded_s": round(stats.recorded_seconds, 3),
+        "elapsed_s": round(stats.elapsed, 3),
+        "keys_per_s": round(stats.keys_per_second, 1),
+        "event_mismatches": stats.event_mismatches,
+        "exited": stats.exited,
+    }
+    print(f"{args.path}: {stats.keys} keys, {stats.events} recorded events, {stats.frames} frames")
+    print(f"recorded {stats.recorded_seconds:.2f} s, replayed in {stats.elapsed:.3f} s "
+          f"({stats.keys_per_second:.0f} keys/s)")
+    if stats.event_mismatches:
+        print(f"WARNING: {stats.event_mismatches} emitted events differ from the recording")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline["keys_per_s"] and result["keys_per_s"] < baseline["keys_per_s"] / (1 + args.tolerance):
+            print(f"REGRESSION keys/s: {baseline['keys_per_s']} -> {result['keys_per_s']}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Save benchmark: time the game thread spends in SaveManager.save_data
+
+"sync" is the previous save_data: serialize, encrypt and write both files
+on the calling thread. "background" is lib.SaveManager: the call only
+snapshots the data, a writer thread serializes, encrypts and writes
+atomically with fsync.
+Each run saves a --size KB game state --saves times into one slot, a
+frame apart like an autosave from the game loop; reports the worst and
+mean stall of the caller, the saves actually written (repeated saves of a
+slot coalesce) and the time until everything is on disk.
+
+    python -m benchmarks.bench_save [--saves N] [--size KB] [--frame-ms MS]
+"""
+import argparse
+import json
+import os
+import statistics
+import tempfile
+import time
+
+os.environ.setdefault("LOCALAPPDATA", tempfile.gettempdir())
+
+from lib.SaveManager import SaveManager
+
+
+class SyncSaveManager(SaveManager):
+    """SaveManager with the synchronous save_data it had before the writer"""
+    def save_data(self, data, save_name, callback=None, wait=False):
+        os.makedirs(self.save_dir, exist_ok=True)
+
+        json_file = os.path.join(self.save_dir, f"{save_name}.json")
+        encrypted_file = os.path.join(self.save_dir, f"{save_name}.enc")
+
+        with open(json_file, 'w') as f:
+            json.dump(data, f)
+
+        encrypted_data = self.fernet.encrypt(json.dumps(data).encode())
+        with open(encrypted_file, 'wb') as f:
+            f.write(encrypted_data)
+
+
+def game_state(size_kb):
+    """Inventory-like nested data of roughly size_kb kilobytes of JSON"""
+    items = [{"id": i, "name": f"Item {i}", "count": i % 9, "tags": ["loot", "common"]}
+             for i in range(size_kb * 1024 // 70)]
+    return {"player": {"name": "Hero", "level": 12, "position": [10, 4]}, "inventory": items}
+
+
+def bench(manager, state, saves, frame_ms):
+    stalls = []
+    start = time.perf_counter()
+    for i in range(saves):
+        state["player"]["level"] = i
+        began = time.perf_counter()
+        manager.save_data(state, "bench")
+        stalls.append(time.perf_counter() - began)
+        time.sleep(frame_ms / 1000)
+    manager.flush()
+    return stalls, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--saves", type=int, default=30)
+    parser.add_argument("--size", type=int, default=2048, help="save size in KB")
+    parser.add_argument("--frame-ms", type=float, default=16.0)
+    args = parser.parse_args()
+
+    state = game_state(args.size)
+    print(f"{args.saves} saves of {len(json.dumps(state)) / 1024:.0f} KB, {args.frame_ms} ms apart")
+    print(f"{'writer':<11} {'max ms':>8} {'mean ms':>8} {'written':>8} {'on disk in s':>13}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, cls in (("sync", SyncSaveManager), ("background", SaveManager)):
+            os.environ["LOCALAPPDATA"] = os.path.join(tmp, name)
+            manager = cls()
+            stalls, total = bench(manager, state, args.saves, args.frame_ms)
+            written = args.saves if cls is SyncSaveManager else manager.writer.written
+            print(f"{name:<11} {max(stalls) * 1e3:>8.2f} {statistics.mean(stalls) * 1e3:>8.2f} "
+                  f"{written:>8} {total:>13.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Widget rendering benchmark suite
+
+Runs TableWidget, MenuWidget, TextBoxWidget, PlayerMapWidget and
+AnimationWidget on the headless curses backend with all animation delays
+forced to zero. For each widget and size it measures:
+
+    first_paint  creating the widget and flushing the first frame
+    steady       one typical redraw (key press or draw()) plus a flush
+
+and reports microseconds, terminal calls and bytes per frame. Results go
+to a JSON file; pass a previous file with --baseline to flag regressions.
+
+    python -m benchmarks.bench_widgets [--frames N] [--output FILE]
+        [--baseline FILE] [--tolerance 0.25]
+"""
+import argparse
+import curses
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+from lib.CursesBackend import CursesBackend
+from benchmarks.bench_level_format import FieldLevel
+
+LINES, COLS = 50, 160
+
+
+def noop():
+    pass
+
+
+class Suite:
+    def __init__(self, frames):
+        self.frames = frames
+        self.win = CursesBackend.use_headless(LINES, COLS)
+
+        from controller.LibController import LibController
+        from data.Config import Config
+
+        Config.get_instance().delayOutput = 0
+        self.lib = LibController.get_instance()
+        self.lib.load_lib(self.win)
+        self.consolas = self.lib.consolas
+        self.results = []
+
+    def _finish_animation(self, widget):
+        animation = getattr(widget, "animation", None)
+        if animation is not None and not animation.done:
+            animation.finish()
+
+    def _sample(self, action):
+        win = self.win
+        calls, written = win.calls, win.bytes_written
+        start = time.perf_counter()
+        result = action()
+        self.consolas.flush()
+        elapsed = time.perf_counter() - start
+        return result, elapsed * 1e6, win.calls - calls, win.bytes_written - written
+
+    def run(self, widget_name, size, create, step, stop=True):
+        """
+        Measure one widget configuration
+
+        create() builds the widget, step(widget, i) does one steady-state frame.
+        """
+        self.consolas.clear_window()
+        self.consolas.flush()
+
+        def first_paint():
+            widget = create()
+            self._finish_animation(widget)
+            return widget
+
+        widget, us, calls, written = self._sample(first_paint)
+        self._record(widget_name, size, "first_paint", [us], [calls], [written])
+
+        samples = ([], [], [])
+        for i in range(self.frames):
+            _, us, calls, written = self._sample(lambda: self._step(widget, step, i))
+            for series, value in zip(samples, (us, calls, written)):
+                series.append(value)
+        self._record(widget_name, size, "steady", *samples)
+
+        if stop and hasattr(widget, "stop"):
+            widget.stop()
+
+    def _step(self, widget, step, i):
+        step(widget, i)
+        self._finish_animation(widget)
+
+    def _record(self, widget_name, size, phase, us, calls, written):
+        self.results.append({
+            "widget": widget_name,
+            "size": size,
+            "phase": phase,
+            "frames": len(us),
+            "us_per_frame": round(statistics.mean(us), 2),
+            "us_p95": round(sorted(us)[max(0, int(len(us) * 0.95) - 1)], 2),
+            "calls_per_frame": round(statistics.mean(calls), 2),
+            "bytes_per_frame": round(statistics.mean(written), 2),
+        })
+
+    def press(self, key):
+        self.lib.input_controller.handle_key(key)
+
+
+def run_suite(suite):
+    from Assets.data.LevelMap import Levels
+
+    consolas = suite.consolas
+
+    for rows, width in ((5, 22), (20, 40), (40, 100)):
+        lines = [f"Row {i} " + "x" * (width - 12) for i in range(rows)]
+        suite.run("TableWidget", f"{rows}x{width}",
+                  lambda: consolas.create_table(*lines, width=width, animation=False),
+                  lambda widget, i: widget.draw())
+
+    for options in (3, 10, 30):
+        menu = {f"Option {i}": noop for i in range(options)}
+        info = [f"Tip for option {i}" for i in range(options)]
+        suite.run("MenuWidget", f"{options} options",
+                  lambda: consolas.create_menu("Benchmark", menu, info),
+                  lambda widget, i: suite.press(curses.KEY_DOWN if i % 2 == 0 else curses.KEY_UP))
+
+    for width in (22, 60):
+        suite.run("TextBoxWidget", f"width {width}",
+                  lambda: consolas.create_text_box(width=width, max_symbol=width - 6),
+                  lambda widget, i: suite.press(ord("a") if i % 2 == 0 else 127))
+
+    for name, factory in (("Level0", Levels.Level0), ("200x200", lambda: FieldLevel(200)),
+                          ("2000x2000", lambda: FieldLevel(2000))):
+        level = factory()
+        suite.run("PlayerMapWidget", name,
+                  lambda: consolas.create_player_map(level_map=level),
+                  lambda widget, i: widget._move_player(0, 1 if i % 2 == 0 else -1))
+
+    for frames, width in ((3, 20), (12, 60), (40, 140)):
+        lines = ["#" * width for _ in range(frames)]
+        suite.run("AnimationWidget", f"{frames}x{width}",
+                  lambda: consolas.create_animation(lines, delay=0, audio=False),
+                  lambda widget, i: widget.draw(), stop=False)
+
+
+def compare(results, baseline_path, tolerance):
+    """Print entries slower or chattier than the baseline, return their count"""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {
+            (r["widget"], r["size"], r["phase"]): r for r in json.load(f)["results"]
+        }
+
+    regressions = 0
+    for result in results:
+        old = baseline.get((result["widget"], result["size"], result["phase"]))
+        if old is None:
+            continue
+        for metric in ("us_per_frame", "calls_per_frame", "bytes_per_frame"):
+            if old[metric] and result[metric] > old[metric] * (1 + tolerance):
+                regressions += 1
+                print(f"REGRESSION {result['widget']} {result['size']} {result['phase']} "
+                      f"{metric}: {old[metric]} -> {result[metric]}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--frames", type=int, default=200, help="steady-state frames per widget")
+    parser.add_argument("--output", default="bench_widgets.json")
+    parser.add_argument("--baseline", help="previous results to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="allowed relative increase before a metric counts as a regression")
+    args = parser.parse_args()
+
+    suite = Suite(args.frames)
+    run_suite(suite)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "terminal": [LINES, COLS],
+            "frames": args.frames,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": suite.results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'widget':<16} {'size':<12} {'phase':<12} {'us/frame':>10} {'calls':>8} {'bytes':>9}")
+    for r in suite.results:
+        print(f"{r['widget']:<16} {r['size']:<12} {r['phase']:<12} "
+              f"{r['us_per_frame']:>10.1f} {r['calls_per_frame']:>8.1f} {r['bytes_per_frame']:>9.1f}")
+    print(f"results written to {args.output}")
+
+    if args.baseline and compare(suite.results, args.baseline, args.tolerance):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
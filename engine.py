@@ -6,12 +6,14 @@ from lib.Logger import logger
 from windows.FileManager import FileManager
 from windows.SceneEditor import SceneEditor
 from windows.GameRunner import GameRunner
+from windows.LogViewer import LogViewer
 
 class Engine:
     def __init__(self):
         self.file_manager = None
         self.scene_editor = None
         self.game_runner = None
+        self.log_viewer = None
         self._init_dpg()
 
     def _get_system_font(self):
@@ -34,6 +36,11 @@ class Engine:
         if self.game_runner is None:
             self.game_runner = GameRunner()
         self.game_runner.show()
+
+    def _open_log_viewer_window(self):
+        if self.log_viewer is None:
+            self.log_viewer = LogViewer()
+        self.log_viewer.show()
     
     def _global_left_click_handler(self, sender, app_data):
         """Закрывает контекстное меню при левом клике в любом месте"""
@@ -73,6 +80,7 @@ class Engine:
             with dpg.menu(label="Tools"):  # Переименовываем Window в Tools
                 dpg.add_menu_item(label="File Manager", callback=self._open_file_manager_window)
                 dpg.add_menu_item(label="Scene Editor", callback=self._open_scene_editor_window)
+                dpg.add_menu_item(label="Log Viewer", callback=self._open_log_viewer_window)
             with dpg.menu(label="Help"):
                 dpg.add_menu_item(label="About", callback=self._show_about)
         
@@ -110,6 +118,7 @@ class Engine:
             dpg.add_text("- File Manager")
             dpg.add_text("- Scene Editor")
             dpg.add_text("- Game Runner")
+            dpg.add_text("- Log Viewer")
             dpg.add_separator()
             dpg.add_button(label="Close", callback=lambda: dpg.delete_item("about_dialog"))
 
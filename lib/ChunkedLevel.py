@@ -0,0 +1,361 @@
+"""
+Chunked binary level format loaded through mmap
+
+File layout (little-endian):
+
+    header      HEADER struct, followed by the UTF-8 name and description
+    chunk index uint32 per chunk, row-major; 0 marks an empty chunk filled
+                with the fill tile, n points to the n-th stored chunk
+    chunk data  starts on a PAGE_SIZE boundary; every chunk is
+                chunk_size x chunk_size uint32 code points, row-major
+
+With the default 32 x 32 chunks one chunk is exactly one 4 KB page, so the
+OS only pages in the chunks the camera and the simulation actually read.
+
+Convert a level class from data.LevelMap:
+
+    python -m lib.ChunkedLevel convert Level0 level0.lvl
+    python -m lib.ChunkedLevel info level0.lvl
+"""
+import argparse
+import mmap
+import os
+import struct
+import sys
+from collections import OrderedDict
+from typing import Optional
+
+from Assets.data.LevelMap import Levels
+
+MAGIC = b"TRLV"
+VERSION = 1
+PAGE_SIZE = 4096
+DEFAULT_CHUNK_SIZE = 32
+TILE_SIZE = 4
+# Decoded chunks kept around: a full-screen viewport touches a few dozen
+CHUNK_CACHE_SIZE = 256
+
+# magic, version, chunk_size, width, height, spawn_x, spawn_y, level_id,
+# fill code point, name length, description length, chunk data offset
+HEADER = struct.Struct("<4sHHIIiiiIHHI")
+# Name and description lengths are uint16 in the header
+MAX_TEXT_BYTES = 0xFFFF
+
+
+class LevelFormatError(Exception):
+    """Raised when a level file is not a valid chunked level"""
+    pass
+
+
+def _align(offset: int, alignment: int) -> int:
+    return (offset + alignment - 1) // alignment * alignment
+
+
+class ChunkedRows:
+    """
+    Read-only sequence of map rows for code that still indexes level_map
+
+    Every access decodes a whole row, prefer get_row/get_tile on the level.
+    """
+    __slots__ = ("_level",)
+
+    def __init__(self, level: 'ChunkedLevel'):
+        self._level = level
+
+    def __len__(self):
+        return self._level.height
+
+    def __getitem__(self, y):
+        if isinstance(y, slice):
+            return [self[i] for i in range(*y.indices(len(self)))]
+        if y < 0:
+            y += len(self)
+        if not 0 <= y < len(self):
+            raise IndexError("level row out of range")
+        return self._level.get_row(y)
+
+
+class ChunkedLevel(Levels.BaseLevel):
+    """
+    Class for a level stored in the chunked binary format
+
+    Tiles are read straight from the memory-mapped file, nothing but the
+    header and the chunk index is parsed on open. Recently used chunks are
+    kept decoded in a small LRU cache. Close the level (or use it as a
+    context manager) to release the file.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self._chunks: OrderedDict[int, str] = OrderedDict()
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise LevelFormatError(f"Empty level file: {path}")
+
+        try:
+            header = self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+        super().__init__(header["level_id"], header["name"], header["description"])
+        self.PlayerSpawnX = header["spawn_x"]
+        self.PlayerSpawnY = header["spawn_y"]
+        self.level_map = ChunkedRows(self)
+
+    def _read_header(self) -> dict:
+        mm = self._mm
+        if len(mm) < HEADER.size:
+            raise LevelFormatError(f"Truncated level header: {self.path}")
+
+        (magic, version, chunk_size, width, height, spawn_x, spawn_y, level_id,
+         fill, name_len, desc_len, data_offset) = HEADER.unpack_from(mm, 0)
+        if magic != MAGIC:
+            raise LevelFormatError(f"Not a chunked level file: {self.path}")
+        if version != VERSION:
+            raise LevelFormatError(f"Unsupported level format version {version}: {self.path}")
+
+        offset = HEADER.size
+        name = mm[offset:offset + name_len].decode("utf-8")
+        offset += name_len
+        description = mm[offset:offset + desc_len].decode("utf-8")
+        index_offset = _align(offset + desc_len, TILE_SIZE)
+
+        self._chunk_size = chunk_size
+        self._width = width
+        self._height = height
+        self._fill = chr(fill)
+        self._chunks_x = -(-width // chunk_size)
+        self._chunks_y = -(-height // chunk_size)
+        self._data_offset = data_offset
+
+        index_size = self._chunks_x * self._chunks_y * TILE_SIZE
+        if index_offset + index_size > data_offset or data_offset > len(mm):
+            raise LevelFormatError(f"Corrupted chunk index: {self.path}")
+        # The format is little-endian like every supported host
+        self._index = memoryview(mm)[index_offset:index_offset + index_size].cast("I")
+        self._tiles = memoryview(mm)[data_offset:].cast("I")
+
+        return {
+            "level_id": level_id, "name": name, "description": description,
+            "spawn_x": spawn_x, "spawn_y": spawn_y,
+        }
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def stored_chunks(self) -> int:
+        """Number of non-empty chunks in the file"""
+        return sum(1 for chunk in self._index if chunk)
+
+    def _chunk(self, chunk: int) -> str:
+        """Tiles of a stored chunk as one row-major string"""
+        tiles = self._chunks.get(chunk)
+        if tiles is not None:
+            self._chunks.move_to_end(chunk)
+            return tiles
+
+        length = self._chunk_size * self._chunk_size * TILE_SIZE
+        offset = self._data_offset + (chunk - 1) * length
+        tiles = self._mm[offset:offset + length].decode("utf-32-le")
+        self._chunks[chunk] = tiles
+        if len(self._chunks) > CHUNK_CACHE_SIZE:
+            self._chunks.popitem(last=False)
+        return tiles
+
+    def get_tile(self, x: int, y: int) -> Optional[str]:
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        size = self._chunk_size
+        cy, ly = divmod(y, size)
+        cx, lx = divmod(x, size)
+        chunk = self._index[cy * self._chunks_x + cx]
+        if not chunk:
+            return self._fill
+        tiles = self._chunks.get(chunk)
+        if tiles is not None:
+            return tiles[ly * size + lx]
+        # Scattered lookups read the tile in place instead of decoding its chunk
+        return chr(self._tiles[((chunk - 1) * size + ly) * size + lx])
+
+    def get_row(self, y: int, start: int = 0, stop: Optional[int] = None) -> str:
+        start, stop, _ = slice(start, stop).indices(self._width)
+        if not 0 <= y < self._height or start >= stop:
+            return ""
+
+        size = self._chunk_size
+        cy, ly = divmod(y, size)
+        index_row = cy * self._chunks_x
+        row_offset = ly * size
+        parts = []
+        x = start
+        while x < stop:
+            cx, lx = divmod(x, size)
+            count = min(size - lx, stop - x)
+            chunk = self._index[index_row + cx]
+            if chunk:
+                offset = row_offset + lx
+                parts.append(self._chunk(chunk)[offset:offset + count])
+            else:
+                parts.append(self._fill * count)
+            x += count
+        return "".join(parts)
+
+    def iter_rows(self):
+        """
+        Yield every row, decoding each chunk once
+
+        Whole-level passes (passability, conversion) go band by band instead
+        of through the chunk cache, which a wide level would thrash.
+        """
+        size = self._chunk_size
+        length = size * size * TILE_SIZE
+        empty = self._fill * size * size
+        for cy in range(self._chunks_y):
+            band = []
+            for chunk in self._index[cy * self._chunks_x:(cy + 1) * self._chunks_x]:
+                if chunk:
+                    offset = self._data_offset + (chunk - 1) * length
+                    band.append(self._mm[offset:offset + length].decode("utf-32-le"))
+                else:
+                    band.append(empty)
+            for ly in range(min(size, self._height - cy * size)):
+                start = ly * size
+                yield "".join(tiles[start:start + size] for tiles in band)[:self._width]
+
+    def close(self):
+        """Release the memory map and the file"""
+        self._chunks.clear()
+        for view in ("_index", "_tiles"):
+            if getattr(self, view, None) is not None:
+                getattr(self, view).release()
+                setattr(self, view, None)
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def convert_level(level: Levels.BaseLevel, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  fill: str = " ") -> int:
+    """
+    Write a level to a chunked level file
+
+    Rows are read through iter_rows one chunk band at a time, so huge levels
+    are converted without building the whole file in memory. Rows shorter
+    than the level width are padded with the fill tile. Chunks made only of
+    the fill tile are not stored.
+
+    Args:
+        level: Level to convert
+        path: Output file path
+        chunk_size: Side of a square chunk in tiles
+        fill: Tile used for empty chunks and padding
+
+    Returns:
+        int: Number of stored chunks
+    """
+    if len(fill) != 1:
+        raise ValueError("Fill must be a single character")
+    if not 0 < chunk_size <= 0xFFFF:
+        raise ValueError("Invalid chunk size")
+
+    width, height = level.width, level.height
+    name = str(getattr(level, "name", "")).encode("utf-8")
+    description = str(getattr(level, "description", "")).encode("utf-8")
+    for field, text in (("name", name), ("description", description)):
+        if len(text) > MAX_TEXT_BYTES:
+            raise ValueError(f"Level {field} is {len(text)} bytes in UTF-8, at most {MAX_TEXT_BYTES} fit")
+    chunks_x = -(-width // chunk_size)
+    chunks_y = -(-height // chunk_size)
+
+    index_offset = _align(HEADER.size + len(name) + len(description), TILE_SIZE)
+    data_offset = _align(index_offset + chunks_x * chunks_y * TILE_SIZE, PAGE_SIZE)
+    index = [0] * (chunks_x * chunks_y)
+    empty = fill * chunk_size
+    stored = 0
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, chunk_size, width, height,
+            getattr(level, "PlayerSpawnX", 0), getattr(level, "PlayerSpawnY", 0),
+            getattr(level, "level_id", 0), ord(fill), len(name), len(description), data_offset,
+        ))
+        f.write(name)
+        f.write(description)
+        f.seek(data_offset)
+
+        source_rows = level.iter_rows()
+
+        for cy in range(chunks_y):
+            band = [next(source_rows, "").ljust(chunks_x * chunk_size, fill) for _ in range(chunk_size)]
+            for cx in range(chunks_x):
+                x0 = cx * chunk_size
+                rows = [row[x0:x0 + chunk_size] for row in band]
+                if all(row == empty for row in rows):
+                    continue
+                f.write("".join(rows).encode("utf-32-le"))
+                stored += 1
+                index[cy * chunks_x + cx] = stored
+
+        # Make sure the data section exists even when every chunk is empty
+        f.truncate(data_offset + stored * chunk_size * chunk_size * TILE_SIZE)
+        f.seek(index_offset)
+        f.write(struct.pack(f"<{len(index)}I", *index))
+    os.replace(tmp_path, path)
+    return stored
+
+
+def _load_level_class(name: str) -> Levels.BaseLevel:
+    level_cls = getattr(Levels, name, None)
+    if not isinstance(level_cls, type) or not issubclass(level_cls, Levels.BaseLevel):
+        raise SystemExit(f"Unknown level class: {name}")
+    return level_cls()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Chunked level files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="convert a Levels class to a chunked file")
+    convert.add_argument("level", help="class name in data.LevelMap.Levels, e.g. Level0")
+    convert.add_argument("output")
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    convert.add_argument("--fill", default=" ")
+
+    info = commands.add_parser("info", help="print the header of a chunked file")
+    info.add_argument("path")
+
+    args = parser.parse_args(argv)
+    if args.command == "convert":
+        level = _load_level_class(args.level)
+        stored = convert_level(level, args.output, args.chunk_size, args.fill)
+        print(f"{args.output}: {level.width}x{level.height}, {stored} chunks stored")
+    else:
+        with ChunkedLevel(args.path) as level:
+            print(f"{level.name} (id {level.level_id}): {level.description}")
+            print(f"size {level.width}x{level.height}, spawn ({level.PlayerSpawnX}, {level.PlayerSpawnY})")
+            print(f"chunks {level.chunk_size}x{level.chunk_size}, {level.stored_chunks} stored")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
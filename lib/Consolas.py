@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional, Tuple, Any, Union
+from typing import List, Dict, Optional, Set, Tuple, Any, Union
 from dataclasses import dataclass
 from enum import Enum
 
@@ -11,6 +11,8 @@ from lib.widgets.FastLoadingWidget import FastLoadingWidget
 from lib.widgets.AnimationWidget import AnimationWidget
 from lib.widgets.LoadingAnimationWidget import LoadingAnimationWidget
 from lib.widgets.PlayerMapWidget import PlayerMapWidget
+from lib.ScreenBuffer import ScreenBuffer
+from lib.Scheduler import Task
 from lib.Logger import logger
 
 
@@ -64,6 +66,8 @@ class PlayerMapConfig:
     x_operation: PositionOperation = PositionOperation.SET
     y_operation: PositionOperation = PositionOperation.SET
     clear: bool = True
+    width: Optional[int] = None
+    height: Optional[int] = None
 
 @dataclass
 class TableConfig(WidgetConfig):
@@ -121,6 +125,8 @@ class Consolas:
     
     Provides methods for creating various UI widgets
     and managing their positioning on the screen.
+    Widgets draw into a ScreenBuffer back buffer that the main loop
+    flushes to the terminal once per frame.
     """
     
     def __init__(self, config: Any, win: Any) -> None:
@@ -129,14 +135,17 @@ class Consolas:
         
         Args:
             config: Application configuration
-            win: Curses window
+            win: Curses window covering the terminal
         """
         self._config = config
-        self._win = win
+        self._screen = ScreenBuffer(win)
+        self._win = self._screen.root
         self._current_focus: int = 0
         self._tab_input_event: Optional[Any] = None
         self._btab_input_event: Optional[Any] = None
         self._window_dimensions_cache: Optional[WindowDimensions] = None
+        # Running widget animations, cancelled when the screen is cleared
+        self._animations: Set[Task] = set()
         
         logger.info("Consolas initialized successfully")
     
@@ -147,8 +156,20 @@ class Consolas:
 
     @property
     def win(self) -> Any:
-        """Get the curses window"""
+        """Get the window covering the whole screen"""
         return self._win
+
+    @property
+    def screen(self) -> ScreenBuffer:
+        """Get the screen back buffer"""
+        return self._screen
+
+    def flush(self) -> None:
+        """Send everything drawn since the last frame to the terminal"""
+        try:
+            self._screen.flush()
+        except Exception as e:
+            logger.error(f"Failed to flush screen: {e}")
     
     @property
     def current_focus(self) -> int:
@@ -160,9 +181,26 @@ class Consolas:
         """Set the current focus"""
         self._current_focus = value
     
+    def track_animation(self, task: Task) -> None:
+        """Cancel the widget animation when the screen is cleared"""
+        self._animations.add(task)
+        task.add_done_callback(lambda: self._animations.discard(task))
+
+    def cancel_animations(self, keep: Optional[Task] = None) -> None:
+        """
+        Cancel the running widget animations
+
+        Args:
+            keep: Animation left running, the one clearing the screen
+        """
+        for task in list(self._animations):
+            if task is not keep:
+                task.cancel()
+
     def clear_window(self) -> None:
         """Clear the window and update the display"""
         try:
+            self.cancel_animations()
             self._win.clear()
             self._win.refresh()
             self._window_dimensions_cache = None
@@ -171,6 +209,23 @@ class Consolas:
             logger.error(f"Failed to clear window: {e}")
             raise ConsolasError(f"Window clearing failed: {e}")
     
+    def resize(self, lines: int, cols: int) -> None:
+        """
+        Follow a resized terminal, called by the main loop on KEY_RESIZE
+
+        Args:
+            lines: New terminal height
+            cols: New terminal width
+        """
+        try:
+            self._screen.target.resize(lines, cols)
+            self._screen.resize(lines, cols)
+            self._window_dimensions_cache = None
+            logger.info(f"Screen resized to {cols}x{lines}")
+        except Exception as e:
+            logger.error(f"Failed to resize screen: {e}")
+            raise ConsolasError(f"Screen resizing failed: {e}")
+
     def _get_window_dimensions(self) -> WindowDimensions:
         """
         Get window dimensions with caching
@@ -287,7 +342,7 @@ class Consolas:
             final_x = max(0, min(final_x, dimensions.width - width))
             final_y = max(0, min(final_y, dimensions.height - height))
             
-            logger.debug(f"Position calculated: ({final_x}, {final_y}) for {width}x{height} widget")
+            logger.debug("Position calculated: (%s, %s) for %sx%s widget", final_x, final_y, width, height)
             return final_x, final_y
             
         except Exception as e:
@@ -308,7 +363,7 @@ class Consolas:
         """
         try:
             widget = FastLoadingWidget(self, speed)
-            logger.debug(f"FastLoadingWidget created with speed: {speed}")
+            logger.debug("FastLoadingWidget created with speed: %s", speed)
             return widget
         except Exception as e:
             logger.error(f"Failed to create FastLoadingWidget: {e}")
@@ -361,7 +416,7 @@ class Consolas:
                 animation=config.animation
             )
 
-            logger.debug(f"TableWidget created with {len(args)} rows")
+            logger.debug("TableWidget created with %d rows", len(args))
             return widget
 
         except Exception as e:
@@ -399,11 +454,15 @@ class Consolas:
                     y=kwargs.get('y'),
                     x_operation=PositionOperation(kwargs.get('Xdo', '=')),
                     y_operation=PositionOperation(kwargs.get('Ydo', '=')),
+                    width=kwargs.get('width'),
+                    height=kwargs.get('height'),
                 )
 
             widget = PlayerMapWidget(
                 self,
                 level_map=config.map or level_map,  # Используем переданную карту
+                width=config.width,
+                height=config.height,
                 clear=config.clear,
                 tableAlignment=config.alignment.value,
                 x=config.x,
@@ -412,7 +471,7 @@ class Consolas:
                 Ydo=config.y_operation.value,
             )
 
-            logger.debug(f"PlayerMapWidget created successfully")
+            logger.debug("PlayerMapWidget created successfully")
             return widget
 
         except Exception as e:
@@ -453,7 +512,7 @@ class Consolas:
                 config.x_operation.value, config.y_operation.value, config.audio
             )
             
-            logger.debug(f"AnimationWidget created with {len(frames)} frames")
+            logger.debug("AnimationWidget created with %d frames", len(frames))
             return widget
             
         except Exception as e:
@@ -516,7 +575,7 @@ class Consolas:
                 config.x_operation.value, config.y_operation.value
             )
             
-            logger.debug(f"MenuWidget '{title}' created with {len(options)} options")
+            logger.debug("MenuWidget '%s' created with %d options", title, len(options))
             return widget
             
         except Exception as e:
@@ -557,7 +616,7 @@ class Consolas:
                 config.x_operation.value, config.y_operation.value, config.function
             )
             
-            logger.debug(f"TextBoxWidget created with width: {config.width}")
+            logger.debug("TextBoxWidget created with width: %s", config.width)
             return widget
             
         except Exception as e:
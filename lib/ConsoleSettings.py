@@ -620,6 +620,10 @@ class ConsoleSettings:
         except:
             pass
         finally:
+            # os._exit skips the exit handlers that write the queued saves
+            # and drain the log queue
+            save_manager.flush(timeout=5)
+            logger.shutdown()
             os._exit(ExitCode.FORCE_EXIT.value)
     
     def __enter__(self):
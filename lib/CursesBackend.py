@@ -0,0 +1,285 @@
+import curses
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from lib.Logger import logger
+
+
+class CursesBackend:
+    """
+    Class for the global curses calls used by Consolas, TabControl and widgets
+    Implements the singleton pattern so the whole engine uses one backend
+
+    The default backend forwards to curses. HeadlessBackend replaces it to
+    run widgets without a terminal (tests, benchmarks, CI): switch before
+    loading the library with CursesBackend.use_headless().
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls) -> 'CursesBackend':
+        if CursesBackend._instance is None:
+            CursesBackend._instance = CursesBackend()
+        return CursesBackend._instance
+
+    @classmethod
+    def set_instance(cls, backend: 'CursesBackend'):
+        """Replace the active backend"""
+        CursesBackend._instance = backend
+
+    @classmethod
+    def use_headless(cls, lines: int = 40, cols: int = 120) -> 'HeadlessWindow':
+        """
+        Switch to the headless backend
+
+        Args:
+            lines: Terminal height
+            cols: Terminal width
+
+        Returns:
+            HeadlessWindow: Window covering the virtual terminal, pass it to LibController.load_lib
+        """
+        backend = HeadlessBackend(lines, cols)
+        cls.set_instance(backend)
+        logger.info(f"Headless curses backend enabled ({cols}x{lines})")
+        return backend.stdscr
+
+    @property
+    def headless(self) -> bool:
+        return False
+
+    def color_pair(self, pair: int) -> int:
+        return curses.color_pair(pair)
+
+    def start_color(self):
+        curses.start_color()
+
+    def init_pair(self, pair: int, fg: int, bg: int):
+        curses.init_pair(pair, fg, bg)
+
+    def curs_set(self, visibility: int):
+        return curses.curs_set(visibility)
+
+    def mousemask(self, mask: int):
+        return curses.mousemask(mask)
+
+    def doupdate(self):
+        curses.doupdate()
+
+    def terminal_size(self) -> Tuple[int, int]:
+        """Lines and columns of the terminal, current after a KEY_RESIZE"""
+        curses.update_lines_cols()
+        return curses.LINES, curses.COLS
+
+
+class HeadlessBackend(CursesBackend):
+    """
+    Backend without a terminal
+
+    Color pairs are encoded like curses does (pair << 8) so attributes stay
+    distinguishable; cursor and mouse state are only remembered.
+    """
+    def __init__(self, lines: int = 40, cols: int = 120):
+        self.stdscr = HeadlessWindow(lines, cols)
+        self.pairs: Dict[int, Tuple[int, int]] = {}
+        self.cursor_visibility = 1
+        self.mouse_mask = 0
+        self.update_count = 0
+
+    @property
+    def headless(self) -> bool:
+        return True
+
+    def color_pair(self, pair: int) -> int:
+        return (pair & 0xFF) << 8
+
+    def start_color(self):
+        pass
+
+    def init_pair(self, pair: int, fg: int, bg: int):
+        self.pairs[pair] = (fg, bg)
+
+    def curs_set(self, visibility: int):
+        previous, self.cursor_visibility = self.cursor_visibility, visibility
+        return previous
+
+    def mousemask(self, mask: int):
+        previous, self.mouse_mask = self.mouse_mask, mask
+        return mask, previous
+
+    def doupdate(self):
+        self.update_count += 1
+        self.stdscr.updates += 1
+
+    def terminal_size(self) -> Tuple[int, int]:
+        return self.stdscr.getmaxyx()
+
+
+class HeadlessWindow:
+    """
+    Terminal-sized window that keeps the screen in memory
+
+    Stands in for the real curses window handed to Consolas. Writes go to a
+    grid of characters and attributes and are counted; with record=True
+    every call is also kept in ops. Keys queued with push_keys are returned
+    by getch; without keys getch waits for the timeout like curses, and
+    with a negative timeout until another thread pushes a key or calls
+    wake().
+    """
+    def __init__(self, lines: int, cols: int, record: bool = False):
+        self._lines = lines
+        self._cols = cols
+        self._chars = [[" "] * cols for _ in range(lines)]
+        self._attrs = [[0] * cols for _ in range(lines)]
+        self._cursor = (0, 0)
+        self._keys: Deque[int] = deque()
+        self._key_ready = threading.Condition()
+        self._woken = False
+        self._timeout = -1
+        self.record = record
+        self.ops: List[Tuple[str, tuple]] = []
+        self.calls = 0
+        self.cells_written = 0
+        self.bytes_written = 0
+        self.updates = 0
+
+    def _op(self, name: str, *args):
+        self.calls += 1
+        if self.record:
+            self.ops.append((name, args))
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self._lines, self._cols
+
+    def getyx(self) -> Tuple[int, int]:
+        return self._cursor
+
+    def move(self, y: int, x: int):
+        if not (0 <= y < self._lines and 0 <= x < self._cols):
+            raise curses.error("move() returned ERR")
+        self._op("move", y, x)
+        self._cursor = (y, x)
+
+    def addstr(self, *args):
+        """addstr([y, x,] text[, attr])"""
+        if len(args) >= 3 and isinstance(args[0], int) and isinstance(args[1], int):
+            y, x, args = args[0], args[1], args[2:]
+        else:
+            y, x = self._cursor
+        text = args[0]
+        attr = args[1] if len(args) > 1 else 0
+        self._op("addstr", y, x, text, attr)
+
+        if not (0 <= y < self._lines and 0 <= x < self._cols):
+            raise curses.error("addwstr() returned ERR")
+        row_chars, row_attrs = self._chars[y], self._attrs[y]
+        end = min(self._cols, x + len(text))
+        row_chars[x:end] = text[:end - x]
+        row_attrs[x:end] = [attr] * (end - x)
+        self.cells_written += end - x
+        self.bytes_written += len(text.encode("utf-8", "replace"))
+        self._cursor = (y, min(end, self._cols - 1))
+        if end - x < len(text):
+            raise curses.error("addwstr() returned ERR")
+
+    def addch(self, *args):
+        """addch([y, x,] ch[, attr])"""
+        if len(args) >= 3:
+            y, x, args = args[0], args[1], args[2:]
+        else:
+            y, x = self._cursor
+        ch = args[0]
+        attr = args[1] if len(args) > 1 else 0
+        if isinstance(ch, int):
+            attr |= ch & ~curses.A_CHARTEXT
+            ch = chr(ch & curses.A_CHARTEXT)
+        self.addstr(y, x, ch, attr)
+
+    def erase(self):
+        self._op("erase")
+        for y in range(self._lines):
+            self._chars[y] = [" "] * self._cols
+            self._attrs[y] = [0] * self._cols
+
+    def clear(self):
+        self.erase()
+
+    def refresh(self):
+        self._op("refresh")
+        self.updates += 1
+
+    def noutrefresh(self):
+        self._op("noutrefresh")
+
+    def clearok(self, flag: bool):
+        self._op("clearok", flag)
+
+    def resize(self, lines: int, cols: int):
+        """Change the terminal size like a SIGWINCH would, keeping the cells that still fit"""
+        self._op("resize", lines, cols)
+        self._chars = [row[:cols] + [" "] * (cols - len(row)) for row in self._chars[:lines]]
+        self._attrs = [row[:cols] + [0] * (cols - len(row)) for row in self._attrs[:lines]]
+        self._chars.extend([" "] * cols for _ in range(lines - len(self._chars)))
+        self._attrs.extend([0] * cols for _ in range(lines - len(self._attrs)))
+        self._lines, self._cols = lines, cols
+
+    def keypad(self, flag: bool):
+        pass
+
+    def nodelay(self, flag: bool):
+        self._timeout = 0 if flag else -1
+
+    def timeout(self, delay: int):
+        self._timeout = delay
+
+    def push_keys(self, keys: Iterable[Any]):
+        """Queue key codes (or single characters) for getch, from any thread"""
+        with self._key_ready:
+            for key in keys:
+                self._keys.append(ord(key) if isinstance(key, str) else key)
+            self._key_ready.notify_all()
+
+    def wake(self):
+        """Make a waiting getch return -1, e.g. to stop a main loop"""
+        with self._key_ready:
+            self._woken = True
+            self._key_ready.notify_all()
+
+    def getch(self) -> int:
+        with self._key_ready:
+            if not self._keys and self._timeout != 0:
+                timeout = self._timeout / 1000 if self._timeout > 0 else None
+                self._key_ready.wait_for(lambda: self._keys or self._woken, timeout)
+            self._woken = False
+            if self._keys:
+                return self._keys.popleft()
+            return -1
+
+    def char_at(self, y: int, x: int) -> str:
+        return self._chars[y][x]
+
+    def attr_at(self, y: int, x: int) -> int:
+        return self._attrs[y][x]
+
+    def lines(self) -> List[str]:
+        """Current screen content, one string per row"""
+        return ["".join(row) for row in self._chars]
+
+    def text(self) -> str:
+        return "\n".join(line.rstrip() for line in self.lines())
+
+    def find(self, text: str) -> Optional[Tuple[int, int]]:
+        """Position of the first occurrence of text on the screen"""
+        for y, line in enumerate(self.lines()):
+            x = line.find(text)
+            if x >= 0:
+                return y, x
+        return None
+
+    def reset_counters(self):
+        self.ops.clear()
+        self.calls = 0
+        self.cells_written = 0
+        self.bytes_written = 0
+        self.updates = 0
@@ -0,0 +1,113 @@
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Histogram bucket i counts calls shorter than 2**i microseconds, the last one the rest
+HISTOGRAM_BUCKETS = 24
+
+
+class TimingStats:
+    """Call count, total, max and log2 latency histogram of one event or handler"""
+    __slots__ = ("calls", "errors", "total_ns", "max_ns", "histogram")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.histogram = [0] * HISTOGRAM_BUCKETS
+
+    def add(self, elapsed_ns: int, failed: bool = False):
+        self.calls += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+        if failed:
+            self.errors += 1
+        self.histogram[min((elapsed_ns // 1000).bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_ns / 1e6, 3),
+            "mean_us": round(self.total_ns / self.calls / 1e3, 3) if self.calls else 0.0,
+            "max_us": round(self.max_ns / 1e3, 3),
+            # Upper bound in microseconds -> calls, empty buckets left out
+            "histogram": {
+                ("inf" if i == HISTOGRAM_BUCKETS - 1 else str(1 << i)): count
+                for i, count in enumerate(self.histogram) if count
+            },
+        }
+
+
+class EventProfiler:
+    """
+    Class for collecting handler timings of an EventSystem
+
+    Enabled with EventSystem.enable_profiling(). Every emit records the time
+    of the whole dispatch under the event name and the time of each handler
+    under (event name, handler name), see EventHandler.name.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: Dict[str, TimingStats] = {}
+        self._handlers: Dict[Tuple[str, str], TimingStats] = {}
+
+    def record_handler(self, event_name: str, handler_name: str, elapsed_ns: int, failed: bool = False):
+        key = (event_name, handler_name)
+        with self._lock:
+            stats = self._handlers.get(key)
+            if stats is None:
+                stats = self._handlers[key] = TimingStats()
+            stats.add(elapsed_ns, failed)
+
+    def record_event(self, event_name: str, elapsed_ns: int):
+        with self._lock:
+            stats = self._events.get(event_name)
+            if stats is None:
+                stats = self._events[event_name] = TimingStats()
+            stats.add(elapsed_ns)
+
+    def reset(self):
+        with self._lock:
+            self._events.clear()
+            self._handlers.clear()
+
+    def event_stats(self, event_name: str) -> Optional[Dict[str, Any]]:
+        """Dispatch timings of one event, None if it was never emitted"""
+        with self._lock:
+            stats = self._events.get(event_name)
+            return stats.to_dict() if stats else None
+
+    def handler_stats(self, event_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Timings of every handler (of one event), slowest total first"""
+        with self._lock:
+            entries = [
+                dict(event=key[0], handler=key[1], **stats.to_dict())
+                for key, stats in self._handlers.items()
+                if event_name is None or key[0] == event_name
+            ]
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return entries
+
+    def slowest(self, limit: int = 10, key: str = "total_ms") -> List[Dict[str, Any]]:
+        """
+        Handlers that cost the most
+
+        Args:
+            limit: Number of handlers
+            key: "total_ms", "max_us" or "mean_us"
+        """
+        return sorted(self.handler_stats(), key=lambda entry: entry[key], reverse=True)[:limit]
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            events = {name: stats.to_dict() for name, stats in self._events.items()}
+        return {"events": events, "handlers": self.handler_stats()}
+
+    def dump(self, path: str):
+        """Write the snapshot to a JSON file"""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2)
@@ -1,11 +1,23 @@
-from typing import Dict, List, Callable, Any, Optional, Union
-from functools import wraps
+from typing import Dict, Iterable, Iterator, List, Callable, Any, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import reduce, wraps
+from types import MethodType
+import asyncio
+import copy
+import bisect
+import itertools
+import inspect
+import time
 import weakref
 import threading
 from dataclasses import dataclass
 from enum import Enum
 import logging
 
+from lib.EventProfiler import EventProfiler
+from lib.TopicTrie import TopicTrie
+
 
 class EventPriority(Enum):
     """Handler execution priorities"""
@@ -37,23 +49,62 @@ class EventHandler:
                  priority: EventPriority = EventPriority.NORMAL,
                  once: bool = False,
                  weak_ref: bool = False):
-        self._callback = callback
         self._priority = priority
         self._once = once
         self._weak_ref = weak_ref
         self._call_count = 0
+        self._name: Optional[str] = None
+        # Subscribed name or pattern and global subscription order, set by EventSystem.subscribe
+        self._topic: Optional[str] = None
+        self._order = 0
+        # weakref.finalize of the method owner, set by EventSystem.subscribe
+        self._finalizer: Optional[weakref.finalize] = None
         self._is_method = hasattr(callback, '__self__')
+        # Plain function, kept for the name without holding the method owner
+        self._function = getattr(callback, '__func__', callback)
         
-        # Use weak references for object methods
-        if weak_ref and self._is_method:
-            self._weak_callback = weakref.WeakMethod(callback)
+        # Use weak references for object methods: only the owner is referenced
+        # weakly, the bound method is rebuilt for each call
+        if weak_ref and hasattr(callback, '__func__'):
+            self._weak_owner = weakref.ref(callback.__self__)
+            self._callback = None
         else:
-            self._weak_callback = None
+            self._weak_owner = None
+            self._callback = callback
     
     @property
     def priority(self) -> EventPriority:
         return self._priority
 
+    @property
+    def callback(self) -> Optional[Callable[[EventData], Any]]:
+        """Handler function, None once the owner of a weak method is gone"""
+        if self._weak_owner is not None:
+            owner = self._weak_owner()
+            return MethodType(self._function, owner) if owner is not None else None
+        return self._callback
+
+    @property
+    def owner(self) -> Optional[Any]:
+        """Object of a method handler, None for plain functions or dead weak methods"""
+        callback = self.callback
+        return getattr(callback, '__self__', None) if self._is_method else None
+
+    @property
+    def name(self) -> str:
+        """Readable callback name for profiling: module.qualname:line"""
+        if self._name is None:
+            function = self._function
+            name = getattr(function, '__qualname__', None) or type(function).__qualname__
+            module = getattr(function, '__module__', None)
+            if module:
+                name = f"{module}.{name}"
+            code = getattr(function, '__code__', None)
+            if code is not None:
+                name = f"{name}:{code.co_firstlineno}"
+            self._name = name
+        return self._name
+
     @property
     def once(self) -> bool:
         return self._once
@@ -64,16 +115,11 @@ class EventHandler:
     
     def is_valid(self) -> bool:
         """Check if handler is still valid"""
-        if self._weak_callback:
-            return self._weak_callback() is not None
-        return True
+        return self.callback is not None
     
     def call(self, event_data: EventData) -> Any:
         """Invoke the handler"""
-        if not self.is_valid():
-            return None
-            
-        callback = self._weak_callback() if self._weak_callback else self._callback
+        callback = self.callback
         if callback is None:
             return None
             
@@ -81,17 +127,214 @@ class EventHandler:
         return callback(event_data)
 
 
+def _keep_latest(previous: EventData, event_data: EventData) -> EventData:
+    return event_data
+
+
+_NUMBERS = (int, float)
+
+
+def _sum_payloads(previous: EventData, event_data: EventData) -> EventData:
+    """Copy of the latest event, its numeric attributes increased by the previous ones"""
+    return _sum_events([previous, event_data])
+
+
+def _sum_events(events: List[EventData]) -> EventData:
+    """
+    _sum_payloads over a whole burst, copying the latest event only once
+
+    A numeric attribute adds up the values of the preceding events back to
+    the first one where it is missing or not a number, as merging them
+    pairwise would.
+    """
+    latest = events[-1]
+    # The poster may still hold the event, so it is left as posted
+    summed = copy.copy(latest)
+    for name, value in vars(latest).items():
+        if value.__class__ in _NUMBERS and name != "timestamp":
+            values = []
+            for event_data in reversed(events[:-1]):
+                previous_value = getattr(event_data, name, None)
+                if previous_value.__class__ not in _NUMBERS:
+                    break
+                values.append(previous_value)
+            if values:
+                total = values.pop()
+                while values:
+                    total = total + values.pop()
+                setattr(summed, name, total + value)
+    return summed
+
+
+# Named coalescing policies for EventSystem.set_coalescing
+COALESCE_POLICIES: Dict[str, Callable[[EventData, EventData], EventData]] = {
+    "latest": _keep_latest,
+    "sum": _sum_payloads,
+}
+
+
+class EventQueueFullError(Exception):
+    """Raised when the queued dispatch has no free slot in time"""
+    pass
+
+
+class EventHistory:
+    """
+    Fixed-capacity ring buffer of emitted events
+
+    Every event gets a sequence number; the buffer keeps the last `capacity`
+    of them. A per-name index holds the sequence numbers of each event name,
+    so the last N events of one name are found without scanning the others.
+    While timestamps are in order (the usual case, emit stamps events with
+    time.time()) time ranges are found by binary search, otherwise the query
+    falls back to a scan.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        if capacity < 0:
+            raise ValueError("History capacity can't be negative")
+        self._capacity = capacity
+        self.clear()
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def clear(self) -> None:
+        """Drop all events"""
+        self._events: List[Optional[EventData]] = [None] * self._capacity
+        self._start = 0  # sequence number of the oldest event
+        self._end = 0    # sequence number of the next event
+        self._by_name: Dict[str, deque] = {}
+        # Sequence numbers of events stamped earlier than the event before them
+        self._inversions = deque()
+
+    def append(self, event_data: EventData) -> None:
+        """Add an event, evicting the oldest one when full"""
+        capacity = self._capacity
+        if not capacity:
+            return
+        events = self._events
+        seq = self._end
+        slot = seq % capacity
+
+        if seq - self._start == capacity:
+            # The slot being reused holds the oldest event, which also heads its name index
+            evicted = events[slot].event_name
+            self._start += 1
+            index = self._by_name[evicted]
+            index.popleft()
+            if not index:
+                del self._by_name[evicted]
+            # An inversion only matters while the event before it is still stored
+            inversions = self._inversions
+            while inversions and inversions[0] <= self._start:
+                inversions.popleft()
+
+        if seq > self._start and event_data.timestamp < events[(seq - 1) % capacity].timestamp:
+            self._inversions.append(seq)
+        events[slot] = event_data
+
+        index = self._by_name.get(event_data.event_name)
+        if index is None:
+            index = self._by_name[event_data.event_name] = deque()
+        index.append(seq)
+        self._end = seq + 1
+
+    def _bisect(self, seqs, lo: int, hi: int, timestamp: float, right: bool) -> int:
+        """First index in [lo, hi) whose timestamp is >= (or > when right) the given one"""
+        events, capacity = self._events, self._capacity
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value = events[seqs[mid] % capacity].timestamp
+            if value < timestamp or (right and value == timestamp):
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def query(self,
+              limit: Optional[int] = None,
+              event_name: Optional[str] = None,
+              since: Optional[float] = None,
+              until: Optional[float] = None) -> List[EventData]:
+        """
+        Get stored events, oldest first
+
+        Args:
+            limit: Return only the last N matching events
+            event_name: Only events with this name
+            since: Only events with timestamp >= since
+            until: Only events with timestamp <= until
+        """
+        if event_name is None:
+            seqs = range(self._start, self._end)
+        else:
+            seqs = self._by_name.get(event_name)
+            if seqs is None:
+                return []
+        lo, hi = 0, len(seqs)
+
+        events, capacity = self._events, self._capacity
+        if since is None and until is None or not self._inversions:
+            if since is not None:
+                lo = self._bisect(seqs, lo, hi, since, right=False)
+            if until is not None:
+                hi = self._bisect(seqs, lo, hi, until, right=True)
+            if limit:
+                lo = max(lo, hi - limit)
+            return [events[seqs[i] % capacity] for i in range(lo, hi)]
+
+        matched = [
+            event_data for event_data in (events[seq % capacity] for seq in seqs)
+            if (since is None or event_data.timestamp >= since)
+            and (until is None or event_data.timestamp <= until)
+        ]
+        return matched[-limit:] if limit else matched
+
+
 class EventSystem:
-    """Core event system"""
+    """
+    Core event system
+
+    Handlers of each event are kept in priority order (highest first, then
+    subscription order) and published as an immutable tuple. emit iterates
+    that tuple without copying or locking; it is rebuilt only when the
+    subscriptions of the event change.
+
+    Event names are dotted topics ("combat.hit", "ui.menu.open"). Handlers
+    can subscribe to wildcard patterns: "*" matches one segment, "**" any
+    number of segments ("combat.*", "ui.**"). Patterns live in a TopicTrie;
+    the merged handlers of a concrete name are resolved on its first emit
+    and cached until a wildcard subscription changes.
+    """
     
-    def __init__(self, use_threading: bool = False):
+    def __init__(self, use_threading: bool = False, history_size: int = 1000):
         self._handlers: Dict[str, List[EventHandler]] = {}
-        self._event_history: List[EventData] = []
-        self._max_history_size: int = 1000
+        # Negated priorities parallel to _handlers, for bisect
+        self._handler_keys: Dict[str, List[int]] = {}
+        # Concrete event name -> handlers to call, exact and wildcard merged
+        self._dispatch: Dict[str, Tuple[EventHandler, ...]] = {}
+        self._patterns = TopicTrie()
+        self._subscription_order = itertools.count()
+        self._history = EventHistory(history_size)
         self._use_threading = use_threading
         self._lock = threading.RLock() if use_threading else None
         self._logger = logging.getLogger(__name__)
         self._global_filters: List[Callable[[EventData], bool]] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue_slots: Optional[threading.BoundedSemaphore] = None
+        self._coalescing: Dict[str, Callable[[EventData, EventData], EventData]] = {}
+        # Event name -> events posted for the next flush, as EventData or
+        # (timestamp, kwargs) until the flush builds them
+        self._posted: Dict[str, List[Any]] = {}
+        self._profiler: Optional[EventProfiler] = None
+        # Weak handlers whose owner was collected, filled by finalizers
+        self._dead_handlers: deque = deque()
+        self._reaped_count = 0
     
     def subscribe(self,
                   event_name: str, 
@@ -103,27 +346,95 @@ class EventSystem:
         Subscribe to an event
 
         Args:
-            event_name: Event name
+            event_name: Event name or wildcard pattern ("combat.*", "ui.**")
             callback: Handler function
             priority: Execution priority
             once: Execute only once
             weak_ref: Use weak references
         """
+        if self._dead_handlers:
+            self.reap_dead_handlers()
         with self._get_lock():
-            if event_name not in self._handlers:
-                self._handlers[event_name] = []
-            
+            handlers = self._handlers.setdefault(event_name, [])
+            keys = self._handler_keys.setdefault(event_name, [])
+
             handler = EventHandler(callback, priority, once, weak_ref)
-            self._handlers[event_name].append(handler)
-            
-            # Sort by priority (highest first)
-            self._handlers[event_name].sort(
-                key=lambda h: h.priority.value, 
-                reverse=True
-            )
+            handler._topic = event_name
+            handler._order = next(self._subscription_order)
+            if handler._weak_owner is not None:
+                # Removed when the owner dies, not on the next emit of this event
+                handler._finalizer = weakref.finalize(
+                    callback.__self__, EventSystem._handler_died, weakref.ref(self), handler)
+
+            # Highest priority first, after handlers of the same priority
+            index = bisect.bisect_right(keys, -priority.value)
+            keys.insert(index, -priority.value)
+            handlers.insert(index, handler)
+            self._publish(event_name)
             
-            self._logger.debug(f"Handler subscribed to event '{event_name}'")
+            self._logger.debug("Handler subscribed to event '%s'", event_name)
             return handler
+
+    def _publish(self, event_name: str) -> None:
+        """Rebuild the dispatch tuple of an event or pattern, call with the lock held"""
+        handlers = self._handlers.get(event_name)
+        if not handlers:
+            self._handlers.pop(event_name, None)
+            self._handler_keys.pop(event_name, None)
+
+        if TopicTrie.is_pattern(event_name):
+            if handlers:
+                self._patterns.add(event_name)
+            else:
+                self._patterns.remove(event_name)
+            if self._patterns:
+                # Any cached name may match the pattern, resolve them again
+                self._dispatch = {}
+            else:
+                self._dispatch = {name: tuple(exact) for name, exact in self._handlers.items()}
+        elif self._patterns:
+            self._dispatch.pop(event_name, None)
+        elif handlers:
+            self._dispatch[event_name] = tuple(handlers)
+        else:
+            self._dispatch.pop(event_name, None)
+
+    def _resolve(self, event_name: str) -> Tuple[EventHandler, ...]:
+        """Merge the exact and wildcard handlers of an event and cache them"""
+        with self._get_lock():
+            if not self._patterns:
+                return ()
+            handlers = list(self._handlers.get(event_name, ()))
+            for pattern in self._patterns.match(event_name):
+                # Emitting a pattern by its name matches the pattern itself,
+                # its handlers are already in as the exact ones
+                if pattern != event_name:
+                    handlers.extend(self._handlers[pattern])
+            handlers.sort(key=lambda h: (-h._priority.value, h._order))
+            dispatch = self._dispatch[event_name] = tuple(handlers)
+            return dispatch
+
+    def _handlers_for(self, event_name: str) -> Tuple[EventHandler, ...]:
+        handlers = self._dispatch.get(event_name)
+        return handlers if handlers is not None else self._resolve(event_name)
+
+    def _remove_handlers(self, event_name: str, remove: Callable[[EventHandler], bool]) -> int:
+        """Remove the handlers of an event matching a predicate, call with the lock held"""
+        handlers = self._handlers.get(event_name)
+        if not handlers:
+            return 0
+        kept = []
+        for handler in handlers:
+            if not remove(handler):
+                kept.append(handler)
+            elif handler._finalizer is not None:
+                handler._finalizer.detach()
+        removed = len(handlers) - len(kept)
+        if removed:
+            self._handlers[event_name] = kept
+            self._handler_keys[event_name] = [-h.priority.value for h in kept]
+            self._publish(event_name)
+        return removed
     
     def unsubscribe(self, event_name: str, callback: Callable[[EventData], Any]) -> bool:
         """
@@ -134,18 +445,9 @@ class EventSystem:
             callback: Handler function to remove
         """
         with self._get_lock():
-            if event_name not in self._handlers:
-                return False
-            
-            original_count = len(self._handlers[event_name])
-            self._handlers[event_name] = [
-                h for h in self._handlers[event_name] 
-                if h._callback != callback
-            ]
-            
-            removed = original_count - len(self._handlers[event_name])
+            removed = self._remove_handlers(event_name, lambda h: h.callback == callback)
             if removed > 0:
-                self._logger.debug(f"Removed {removed} handler(s) for event '{event_name}'")
+                self._logger.debug("Removed %d handler(s) for event '%s'", removed, event_name)
             
             return removed > 0
     
@@ -161,8 +463,115 @@ class EventSystem:
             event_data: Event data
             **kwargs: Additional parameters for EventData creation
         """
-        import time
-        
+        event_data = self._prepare_event(event_name, event_data, kwargs)
+        if event_data is None:
+            return []
+        return self._call_handlers(event_name, event_data)
+
+    def _call_handlers(self, event_name: str, event_data: EventData) -> List[Any]:
+        """Run the handlers of an already recorded event"""
+        results = []
+        for callback in self._dispatch_steps(event_name, event_data, results):
+            try:
+                results.append(callback(event_data))
+            except Exception as e:
+                self._handler_failed(event_name, e)
+        return results
+
+    def _handler_failed(self, event_name: str, error: Exception) -> None:
+        self._logger.error(f"Error in handler for event '{event_name}': {error}")
+
+    def _dispatch_steps(self, event_name: str, event_data: EventData,
+                        results: List[Any]) -> Iterator[Callable[[EventData], Any]]:
+        """
+        Handler loop of one dispatch, shared by emit and emit_async
+
+        Yields the callback of every handler to run, in priority order; the
+        caller runs it and appends its result to results, or reports the
+        error and appends nothing. Skips dead weak handlers, stops when the
+        event is cancelled, removes dead and fired one-time handlers at the
+        end and times the handlers while profiling.
+        """
+        if self._dead_handlers:
+            self.reap_dead_handlers()
+        profiler = self._profiler
+        perf_counter_ns = time.perf_counter_ns
+        if profiler is not None:
+            dispatch_start = perf_counter_ns()
+        handlers_to_remove = []
+
+        # Immutable snapshot, subscriptions made by handlers apply to the next emit
+        handlers = self._dispatch.get(event_name)
+        if handlers is None:
+            handlers = self._resolve(event_name)
+        if not handlers:
+            self._logger.debug("No handlers for event '%s'", event_name)
+
+        for handler in handlers:
+            # Same as is_valid() + call(), a weak method is rebuilt from its live owner
+            callback = handler._callback
+            if callback is None:
+                owner = handler._weak_owner()
+                if owner is None:
+                    handlers_to_remove.append(handler)
+                    continue
+                callback = MethodType(handler._function, owner)
+
+            if event_data.cancelled:
+                break
+
+            handler._call_count += 1
+            if profiler is None and not handler._once:
+                yield callback
+                continue
+            called = len(results)
+            if profiler is not None:
+                start = perf_counter_ns()
+            yield callback
+            succeeded = len(results) > called
+            if profiler is not None:
+                profiler.record_handler(event_name, handler.name, perf_counter_ns() - start, not succeeded)
+
+            # Remove one-time handlers
+            if succeeded and handler._once:
+                handlers_to_remove.append(handler)
+
+        # Remove invalid and one-time handlers
+        self._discard_handlers(event_name, handlers_to_remove)
+
+        if profiler is not None:
+            profiler.record_event(event_name, perf_counter_ns() - dispatch_start)
+        if handlers:
+            self._logger.debug("Event '%s' handled by %d handlers", event_name, len(results))
+
+    def enable_profiling(self, profiler: Optional[EventProfiler] = None) -> EventProfiler:
+        """
+        Start timing handlers
+
+        Args:
+            profiler: Profiler to record into, keeps the current one or creates a new one
+
+        Returns:
+            EventProfiler: Active profiler, query it or dump it to JSON
+        """
+        if profiler is None:
+            profiler = self._profiler or EventProfiler()
+        self._profiler = profiler
+        return profiler
+
+    def disable_profiling(self) -> Optional[EventProfiler]:
+        """Stop timing handlers, returns the profiler with the collected timings"""
+        profiler, self._profiler = self._profiler, None
+        return profiler
+
+    @property
+    def profiler(self) -> Optional[EventProfiler]:
+        """Active profiler, None when profiling is disabled"""
+        return self._profiler
+
+    def _prepare_event(self, event_name: str, event_data: Optional[EventData],
+                       kwargs: Dict[str, Any]) -> Optional[EventData]:
+        """Create the event data, apply global filters and record it, None if filtered"""
         # Create event data if not provided
         if event_data is None:
             event_data = EventData(
@@ -174,51 +583,344 @@ class EventSystem:
         # Apply global filters
         for filter_func in self._global_filters:
             if not filter_func(event_data):
-                self._logger.debug(f"Event '{event_name}' filtered")
-                return []
+                self._logger.debug("Event '%s' filtered", event_name)
+                return None
         
         # Add to history
         self._add_to_history(event_data)
-        
-        results = []
-        handlers_to_remove = []
-        
+        return event_data
+
+    def set_coalescing(self,
+                       event_name: str,
+                       policy: Union[str, Callable[[EventData, EventData], EventData], None]) -> None:
+        """
+        Collapse bursts of an event delivered by emit_batch and flush_posted
+
+        Args:
+            event_name: Event name
+            policy: "latest" keeps the last event, "sum" adds up the numeric
+                attributes of the burst, a callable (previous, new) returns
+                the merged event; None delivers every event again
+        """
+        if policy is None:
+            self._coalescing.pop(event_name, None)
+            return
+        if isinstance(policy, str):
+            if policy not in COALESCE_POLICIES:
+                raise ValueError(f"Unknown coalescing policy: {policy}")
+            policy = COALESCE_POLICIES[policy]
+        self._coalescing[event_name] = policy
+
+    def _coalesce(self, pending: List[EventData], index: Dict[str, int], event_data: EventData) -> None:
+        """Append an event to a batch or merge it with the pending one of the same name"""
+        event_name = event_data.event_name
+        policy = self._coalescing.get(event_name)
+        if policy is None:
+            pending.append(event_data)
+            return
+        position = index.get(event_name)
+        if position is None:
+            index[event_name] = len(pending)
+            pending.append(event_data)
+        else:
+            pending[position] = policy(pending[position], event_data)
+
+    def emit_batch(self, events: Iterable[EventData], coalesce: bool = True) -> List[List[Any]]:
+        """
+        Emit several events in one pass
+
+        Events with a coalescing policy are merged and delivered at the
+        position of their first occurrence. Filters still see every delivered
+        event; the history is updated under a single lock.
+
+        Args:
+            events: Event data, dispatched by their event_name
+            coalesce: Apply the coalescing policies
+
+        Returns:
+            List[List[Any]]: Handler results of each delivered event
+        """
+        if coalesce and self._coalescing:
+            batch: List[EventData] = []
+            index: Dict[str, int] = {}
+            for event_data in events:
+                self._coalesce(batch, index, event_data)
+        else:
+            batch = list(events)
+
+        filters = self._global_filters
+        if filters:
+            batch = [event_data for event_data in batch
+                     if all(filter_func(event_data) for filter_func in filters)]
         with self._get_lock():
-            if event_name not in self._handlers:
-                self._logger.debug(f"No handlers for event '{event_name}'")
-                return results
-            
-            # Create handler copy for safe iteration
-            handlers = self._handlers[event_name].copy()
-        
-        for handler in handlers:
-            if not handler.is_valid():
-                handlers_to_remove.append(handler)
-                continue
-            
-            if event_data.cancelled:
-                break
-            
+            for event_data in batch:
+                self._history.append(event_data)
+
+        return [self._call_handlers(event_data.event_name, event_data) for event_data in batch]
+
+    def post(self, event_name: str, event_data: Optional[EventData] = None, **kwargs) -> None:
+        """
+        Queue an event for the next flush_posted (once per main loop frame)
+
+        Only appends to the slot of the event name; the EventData, the
+        coalescing policy, filters and history wait for the flush, so a
+        burst of an event with a policy costs one dispatch and almost
+        nothing per post. Events are delivered grouped by name, in the
+        order each name was first posted.
+
+        Args:
+            event_name: Event name
+            event_data: Event data
+            **kwargs: Additional parameters for EventData creation
+        """
+        event = event_data if event_data is not None else (time.time(), kwargs)
+        lock = self._lock
+        if lock is None:
+            slot = self._posted.get(event_name)
+            if slot is None:
+                slot = self._posted[event_name] = []
+            slot.append(event)
+            return
+        with lock:
+            self._posted.setdefault(event_name, []).append(event)
+
+    def flush_posted(self) -> int:
+        """
+        Deliver the posted events, used as a MainLoop frame callback
+
+        Returns:
+            int: Number of events delivered
+        """
+        if self._dead_handlers:
+            self.reap_dead_handlers()
+        if not self._posted:
+            return 0
+        with self._get_lock():
+            posted, self._posted = self._posted, {}
+
+        batch = []
+        for event_name, events in posted.items():
+            policy = self._coalescing.get(event_name)
+            if policy is _keep_latest:
+                events = events[-1:]
+            events = [self._posted_event(event_name, event) for event in events]
+            if policy is _sum_payloads and len(events) > 1:
+                events = [_sum_events(events)]
+            elif policy is not None and len(events) > 1:
+                events = [reduce(policy, events)]
+            batch.extend(events)
+        return len(self.emit_batch(batch, coalesce=False))
+
+    @staticmethod
+    def _posted_event(event_name: str, event: Any) -> EventData:
+        if isinstance(event, EventData):
+            return event
+        timestamp, kwargs = event
+        return EventData(event_name=event_name, timestamp=timestamp, **kwargs)
+
+    @staticmethod
+    def _handler_died(system_ref: 'weakref.ReferenceType[EventSystem]', handler: EventHandler) -> None:
+        """
+        Finalizer of a weak handler owner
+
+        May run in the middle of any code through the garbage collector, so
+        it only queues the handler; the next emit, subscription change or
+        main loop frame removes it.
+        """
+        system = system_ref()
+        if system is not None:
+            system._dead_handlers.append(handler)
+
+    def reap_dead_handlers(self) -> int:
+        """
+        Remove the weak handlers whose owner was collected
+
+        Returns:
+            int: Number of handlers removed
+        """
+        handlers = []
+        while self._dead_handlers:
+            handlers.append(self._dead_handlers.popleft())
+        if not handlers:
+            return 0
+        with self._get_lock():
+            dead = set(map(id, handlers))
+            removed = 0
+            for topic in {handler._topic for handler in handlers}:
+                removed += self._remove_handlers(topic, lambda h: id(h) in dead)
+            self._reaped_count += removed
+        return removed
+
+    def get_handler_report(self, min_handlers: int = 1) -> Dict[str, Any]:
+        """
+        Leak diagnostics of the subscriptions
+
+        A growing "strong_owners" count for some type usually means objects
+        subscribe bound methods without weak_ref and never unsubscribe,
+        which keeps them alive.
+
+        Args:
+            min_handlers: Only list topics and owner types with at least this many handlers
+
+        Returns:
+            Dict[str, Any]: Totals, handlers per topic, strong and weak method owners per type
+        """
+        with self._get_lock():
+            subscriptions = [(topic, list(handlers)) for topic, handlers in self._handlers.items()]
+            pending = len(self._dead_handlers)
+            reaped = self._reaped_count
+
+        topics: Dict[str, int] = {}
+        strong_owners: Dict[str, int] = {}
+        weak_owners: Dict[str, int] = {}
+        total = weak = dead = 0
+        for topic, handlers in subscriptions:
+            topics[topic] = len(handlers)
+            total += len(handlers)
+            for handler in handlers:
+                owners = strong_owners
+                if handler._weak_owner is not None:
+                    weak += 1
+                    owners = weak_owners
+                owner = handler.owner
+                if owner is None:
+                    if handler._weak_owner is not None:
+                        dead += 1
+                    continue
+                owner_type = f"{type(owner).__module__}.{type(owner).__qualname__}"
+                owners[owner_type] = owners.get(owner_type, 0) + 1
+
+        def top(counts: Dict[str, int]) -> Dict[str, int]:
+            return dict(sorted(((key, count) for key, count in counts.items() if count >= min_handlers),
+                               key=lambda item: item[1], reverse=True))
+
+        return {
+            "handlers": total,
+            "weak_handlers": weak,
+            "dead_handlers": dead,
+            "pending_reap": pending,
+            "reaped": reaped,
+            "topics": top(topics),
+            "strong_owners": top(strong_owners),
+            "weak_owners": top(weak_owners),
+        }
+
+    def _discard_handlers(self, event_name: str, handlers: List[EventHandler]) -> None:
+        """Remove dead and fired one-time handlers after a dispatch"""
+        if handlers:
+            with self._get_lock():
+                stale = set(map(id, handlers))
+                # Wildcard handlers are stored under their pattern
+                for topic in {handler._topic for handler in handlers}:
+                    self._remove_handlers(topic, lambda h: id(h) in stale)
+
+    async def emit_async(self,
+                         event_name: str,
+                         event_data: Optional[EventData] = None,
+                         in_thread: bool = False,
+                         **kwargs) -> List[Any]:
+        """
+        Emit an event from asyncio code
+
+        Handlers run in priority order like in emit. A handler may be a
+        coroutine function: its result is awaited before the next handler
+        runs, so it can still cancel the event for lower priorities.
+
+        Args:
+            event_name: Event name
+            event_data: Event data
+            in_thread: Run the whole dispatch on the thread pool (see
+                emit_queued) and await its future, for slow blocking handlers
+            **kwargs: Additional parameters for EventData creation
+        """
+        if in_thread:
+            return await asyncio.wrap_future(self.emit_queued(event_name, event_data, **kwargs))
+
+        event_data = self._prepare_event(event_name, event_data, kwargs)
+        if event_data is None:
+            return []
+
+        # Coroutine results are awaited before the next handler runs; while
+        # profiling, the time spent awaiting counts for the handler
+        results = []
+        for callback in self._dispatch_steps(event_name, event_data, results):
             try:
-                result = handler.call(event_data)
+                result = callback(event_data)
+                if inspect.isawaitable(result):
+                    result = await result
                 results.append(result)
-                
-                # Remove one-time handlers
-                if handler.once:
-                    handlers_to_remove.append(handler)
-                    
             except Exception as e:
-                self._logger.error(f"Error in handler for event '{event_name}': {e}")
-        
-        # Remove invalid and one-time handlers
-        if handlers_to_remove:
-            with self._get_lock():
-                for handler in handlers_to_remove:
-                    if handler in self._handlers[event_name]:
-                        self._handlers[event_name].remove(handler)
-        
-        self._logger.debug(f"Event '{event_name}' handled by {len(results)} handlers")
+                self._handler_failed(event_name, e)
         return results
+
+    def start_dispatcher(self, workers: int = 1, queue_size: int = 256) -> ThreadPoolExecutor:
+        """
+        Start the thread pool used by emit_queued
+
+        Called implicitly with the defaults by the first emit_queued. With one
+        worker queued events are dispatched in emit order; more workers
+        dispatch different events concurrently.
+
+        Args:
+            workers: Number of dispatch threads
+            queue_size: Events that may wait for a worker before emit_queued applies back-pressure
+        """
+        with self._get_lock():
+            if self._executor is not None:
+                return self._executor
+            if workers < 1 or queue_size < 0:
+                raise ValueError("Invalid dispatcher configuration")
+            # Handlers now run on other threads, history and subscriptions need the lock
+            if self._lock is None:
+                self._lock = threading.RLock()
+            self._queue_slots = threading.BoundedSemaphore(workers + queue_size)
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="EventDispatch")
+            return self._executor
+
+    def shutdown_dispatcher(self, wait: bool = True) -> None:
+        """Stop the thread pool, by default after the queued events are dispatched"""
+        with self._get_lock():
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    def emit_queued(self,
+                    event_name: str,
+                    event_data: Optional[EventData] = None,
+                    block: bool = True,
+                    timeout: Optional[float] = None,
+                    **kwargs) -> Future:
+        """
+        Emit an event on the dispatcher thread pool
+
+        The caller only waits for a free queue slot. The dispatch itself is a
+        regular emit on a worker thread, so priorities and cancellation behave
+        the same; handlers must be thread-safe.
+
+        Args:
+            event_name: Event name
+            event_data: Event data
+            block: Wait for a free slot when the queue is full
+            timeout: Longest wait for a slot in seconds
+            **kwargs: Additional parameters for EventData creation
+
+        Returns:
+            Future: Resolves to the list of handler results
+
+        Raises:
+            EventQueueFullError: If no slot became free
+        """
+        executor = self._executor or self.start_dispatcher()
+        slots = self._queue_slots
+        if not slots.acquire(block, timeout):
+            raise EventQueueFullError(f"Dispatch queue is full, event '{event_name}' dropped")
+        try:
+            future = executor.submit(self.emit, event_name, event_data, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
     
     def add_global_filter(self, filter_func: Callable[[EventData], bool]) -> None:
         """Add global event filter"""
@@ -232,12 +934,11 @@ class EventSystem:
         return False
     
     def get_event_handlers(self, event_name: str) -> List[EventHandler]:
-        """Get handlers for an event"""
-        with self._get_lock():
-            return self._handlers.get(event_name, []).copy()
+        """Get handlers called for an event, wildcard subscriptions included"""
+        return list(self._handlers_for(event_name))
     
     def get_event_names(self) -> List[str]:
-        """Get all registered event names"""
+        """Get all subscribed event names and patterns"""
         with self._get_lock():
             return list(self._handlers.keys())
 
@@ -245,27 +946,58 @@ class EventSystem:
         """Clear handlers (all or for specific event)"""
         with self._get_lock():
             if event_name:
-                self._handlers.pop(event_name, None)
-                self._logger.debug(f"Cleared handlers for event '{event_name}'")
+                self._remove_handlers(event_name, lambda h: True)
+                self._logger.debug("Cleared handlers for event '%s'", event_name)
             else:
+                for handlers in self._handlers.values():
+                    for handler in handlers:
+                        if handler._finalizer is not None:
+                            handler._finalizer.detach()
                 self._handlers.clear()
+                self._handler_keys.clear()
+                self._dispatch = {}
+                self._patterns.clear()
                 self._logger.debug("Cleared all event handlers")
     
-    def get_event_history(self, limit: Optional[int] = None) -> List[EventData]:
-        """Get event history"""
-        if limit:
-            return self._event_history[-limit:]
-        return self._event_history.copy()
+    def get_event_history(self,
+                          limit: Optional[int] = None,
+                          event_name: Optional[str] = None,
+                          since: Optional[float] = None,
+                          until: Optional[float] = None) -> List[EventData]:
+        """
+        Get event history, oldest first
+
+        Args:
+            limit: Return only the last N matching events
+            event_name: Only events with this name
+            since: Only events with timestamp >= since
+            until: Only events with timestamp <= until
+        """
+        with self._get_lock():
+            return self._history.query(limit, event_name, since, until)
+
+    @property
+    def history_size(self) -> int:
+        """Maximum number of events kept in the history"""
+        return self._history.capacity
+
+    @history_size.setter
+    def history_size(self, size: int) -> None:
+        with self._get_lock():
+            history = EventHistory(size)
+            for event_data in self._history.query(limit=size) if size else ():
+                history.append(event_data)
+            self._history = history
     
     def clear_history(self) -> None:
         """Clear event history"""
-        self._event_history.clear()
+        with self._get_lock():
+            self._history.clear()
     
     def _add_to_history(self, event_data: EventData) -> None:
         """Add event to history"""
-        self._event_history.append(event_data)
-        if len(self._event_history) > self._max_history_size:
-            self._event_history.pop(0)
+        with self._get_lock():
+            self._history.append(event_data)
     
     def _get_lock(self):
         """Get lock or dummy lock"""
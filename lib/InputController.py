@@ -1,52 +1,82 @@
+import itertools
+from typing import Callable, Dict, List, Tuple
+
 from lib.Logger import logger
 
 class InputController:
     """
     Class for managing input and handling keyboard events
+
+    Events are indexed by key code, so dispatching a key only touches the
+    active handlers bound to that key. Dispatch iterates an immutable tuple
+    snapshot of the unpaused events, rebuilt lazily after bindings or pause
+    flags of that key change, which lets handlers add, remove or pause
+    bindings while a key is being dispatched.
     """
     def __init__(self):
-        self._events = []
+        self._events: Dict[int, 'InputController.InputEvent'] = {}
+        self._bindings: Dict[int, List['InputController.InputEvent']] = {}
+        self._dispatch: Dict[int, Tuple['InputController.InputEvent', ...]] = {}
+        self._ids = itertools.count()
+        self._key_listeners: Tuple[Callable[[int], None], ...] = ()
 
     def handle_key(self, c):
-        for event in self._events:
-            if event.key == c and not event.pause:
+        for listener in self._key_listeners:
+            listener(c)
+
+        handlers = self._dispatch.get(c)
+        if handlers is None:
+            handlers = self._dispatch[c] = tuple(
+                event for event in self._bindings.get(c, ()) if not event._pause
+            )
+
+        for event in handlers:
+            if not event._pause and not event.removed:
                 event.function()
 
     def _generate_id(self):
-        used_ids = {event.id for event in self._events}
-        candidate = 0
-        while candidate in used_ids:
-            candidate += 1
-        return candidate
+        return next(self._ids)
 
     class InputEvent:
         """
         Class representing an input event
         """
+        __slots__ = ("controller", "id", "key", "function", "_pause", "removed")
+
         def __init__(self, controller):
             self.controller = controller
 
             self.id = self.controller._generate_id()
             self.key = None
             self.function = None
-            self.pause = False
+            self._pause = False
+            self.removed = False
+
+        @property
+        def pause(self):
+            return self._pause
+
+        @pause.setter
+        def pause(self, pause):
+            if pause != self._pause:
+                self._pause = pause
+                self.controller._dispatch.pop(self.key, None)
 
         def set_pause(self, pause):
             self.pause = pause
 
         def remove(self):
             self.controller.remove_input_event(self.id)
-            del self
 
-    def add_input_event(self, key, function, pause=False) -> InputEvent:
+    def add_input_event(self, key, function: Callable, pause=False) -> InputEvent:
         """
         Add an input event
-    
+
         Args:
             key: Key or key code
             function: Event handling function
             pause: Pause event processing
-    
+
         Returns:
             InputEvent: Created input event
         """
@@ -56,28 +86,62 @@ class InputController:
         else:
             event.key = key
         event.function = function
-        event.pause = pause
-        self._events.append(event)
+        event._pause = pause
+
+        self._events[event.id] = event
+        self._bindings.setdefault(event.key, []).append(event)
+        self._dispatch.pop(event.key, None)
         return event
 
     def remove_input_event(self, id):
         """
         Remove an input event by its identifier
-    
+
         Args:
             id: Event identifier
         """
-        self._events = [event for event in self._events if event.id != id]
+        event = self._events.pop(id, None)
+        if event is None:
+            return
+
+        event.removed = True
+        bound = self._bindings[event.key]
+        bound.remove(event)
+        if not bound:
+            del self._bindings[event.key]
+        self._dispatch.pop(event.key, None)
 
     def set_input_event_pause(self, id, bool):
         """
         Set input event pause
-    
+
         Args:
             id: Event identifier
             bool: True to pause, False to resume
         """
-        for event in self._events:
-            if event.id == id:
-                event.pause = bool
-                return
\ No newline at end of file
+        event = self._events.get(id)
+        if event is not None:
+            event.pause = bool
+
+    def add_key_listener(self, listener: Callable[[int], None]):
+        """
+        Add a function called with every key code before it is dispatched
+
+        Args:
+            listener: Function taking the key code (e.g. a session recorder)
+        """
+        self._key_listeners += (listener,)
+
+    def remove_key_listener(self, listener: Callable[[int], None]) -> bool:
+        """Remove a key listener"""
+        if listener not in self._key_listeners:
+            return False
+        listeners = list(self._key_listeners)
+        listeners.remove(listener)
+        self._key_listeners = tuple(listeners)
+        return True
+
+    @property
+    def event_count(self) -> int:
+        """Number of registered input events"""
+        return len(self._events)
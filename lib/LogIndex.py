@@ -0,0 +1,324 @@
+import datetime
+from array import array
+import json
+import logging
+import os
+import struct
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+# Sidecar files next to a structured log: <log>.idx holds one fixed-size
+# entry per line, <log>.idx.json the module names and how far the log has
+# been indexed. Only the index is scanned when filtering; lines are read
+# from the log by offset when shown.
+ENTRY = struct.Struct("<QdBI")     # line offset, time, level number, module id
+# Stored in the meta; an index written with another entry layout is rebuilt
+INDEX_VERSION = 2
+INDEX_SUFFIX = ".idx"
+META_SUFFIX = ".idx.json"
+# Entries read from the index at once while filtering
+SCAN_CHUNK = 65536
+
+
+class IndexEntry(NamedTuple):
+    offset: int
+    time: float
+    level: int
+    module: int
+
+
+def level_number(level: Any) -> int:
+    """Level number from a number or a name like INFO, 0 if unknown"""
+    if isinstance(level, int):
+        return level
+    number = logging.getLevelName(str(level).upper())
+    return number if isinstance(number, int) else 0
+
+
+def parse_time(text: str) -> Optional[float]:
+    """
+    Epoch seconds from "YYYY-MM-DD HH:MM[:SS]", "HH:MM[:SS]" (today) or a number
+
+    Returns:
+        Optional[float]: None for an empty string
+
+    Raises:
+        ValueError: If the text is none of these
+    """
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    for pattern in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
+        try:
+            return datetime.datetime.strptime(text, pattern).timestamp()
+        except ValueError:
+            pass
+    for pattern in ("%H:%M:%S", "%H:%M"):
+        try:
+            moment = datetime.datetime.strptime(text, pattern).time()
+            return datetime.datetime.combine(datetime.date.today(), moment).timestamp()
+        except ValueError:
+            pass
+    raise ValueError(f"Unrecognized time: {text}")
+
+
+class LogIndex:
+    """
+    Class for filtering a structured (JSONL) log without loading it
+
+    update() indexes the lines appended since the last call, so a log that
+    is still being written is indexed incrementally; a log that shrank is
+    indexed again from the start. query() scans the index for level, module
+    and time range and yields line offsets, read() fetches the lines;
+    select() keeps the matches of a filter so page() reads any page of them
+    directly.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.index_path = path + INDEX_SUFFIX
+        self.meta_path = path + META_SUFFIX
+        self.modules: List[str] = []
+        self._module_ids: Dict[str, int] = {}
+        self.indexed_bytes = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _load_meta(self):
+        try:
+            with open(self.meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            index_size = os.path.getsize(self.index_path)
+        except (OSError, ValueError):
+            meta, index_size = None, -1
+        if (meta is None or meta.get("version") != INDEX_VERSION
+                or index_size != meta.get("count", 0) * ENTRY.size):
+            self._reset()
+            return
+        self.modules = list(meta["modules"])
+        self._module_ids = {name: i for i, name in enumerate(self.modules)}
+        self.indexed_bytes = meta["size"]
+        self.count = meta["count"]
+
+    def _save_meta(self):
+        part = self.meta_path + ".part"
+        with open(part, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "size": self.indexed_bytes, "count": self.count,
+                       "modules": self.modules}, f)
+        os.replace(part, self.meta_path)
+
+    def _reset(self):
+        self.modules = []
+        self._module_ids = {}
+        self.indexed_bytes = 0
+        self.count = 0
+        with open(self.index_path, "wb"):
+            pass
+
+    def _module_id(self, name: str) -> int:
+        module_id = self._module_ids.get(name)
+        if module_id is None:
+            module_id = self._module_ids[name] = len(self.modules)
+            self.modules.append(name)
+        return module_id
+
+    def update(self, progress: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Index the lines written since the last update
+
+        Args:
+            progress: Called with (bytes indexed, log size) every SCAN_CHUNK lines
+
+        Returns:
+            int: Number of new entries
+        """
+        self._load_meta()
+        size = os.path.getsize(self.path)
+        if size < self.indexed_bytes:
+            self._reset()
+
+        added = 0
+        pending = []
+        offset = self.indexed_bytes
+        with open(self.path, "rb") as log, open(self.index_path, "ab") as index:
+            log.seek(offset)
+            for line in log:
+                if not line.endswith(b"\n"):
+                    # Still being written
+                    break
+                try:
+                    record = json.loads(line)
+                    pending.append(ENTRY.pack(offset, float(record.get("time", 0.0)),
+                                              level_number(record.get("level", 0)) & 0xFF,
+                                              self._module_id(str(record.get("module", "")))))
+                except (ValueError, AttributeError):
+                    # Not a record (truncated by a crash, written by hand)
+                    pass
+                offset += len(line)
+                if len(pending) >= SCAN_CHUNK:
+                    index.write(b"".join(pending))
+                    added += len(pending)
+                    pending.clear()
+                    if progress is not None:
+                        progress(offset, size)
+            index.write(b"".join(pending))
+            added += len(pending)
+
+        self.indexed_bytes = offset
+        self.count += added
+        self._save_meta()
+        if progress is not None:
+            progress(offset, size)
+        return added
+
+    def module_ids(self, prefixes: Iterable[str]) -> set:
+        """
+        Ids of the modules matching any of the dotted paths
+
+        A path matches whole segments anywhere in the name, like
+        Logger.set_levels does: "lib.widgets" matches "lib.widgets.MenuWidget"
+        and names logged before the .. and .py were dropped from them,
+        "...lib.widgets.MenuWidget.py".
+        """
+        paths = ["." + prefix.strip(".") + "." for prefix in prefixes if prefix.strip(".")]
+        return {
+            i for i, name in enumerate(self.modules)
+            if any(path in "." + name + "." for path in paths)
+        }
+
+    def _chunks(self) -> Iterator[bytes]:
+        with open(self.index_path, "rb") as index:
+            while True:
+                data = index.read(ENTRY.size * SCAN_CHUNK)
+                if not data:
+                    return
+                yield data[:len(data) - len(data) % ENTRY.size]
+
+    def entries(self) -> Iterator[IndexEntry]:
+        """Every index entry, in log order"""
+        for data in self._chunks():
+            for entry in ENTRY.iter_unpack(data):
+                yield IndexEntry(*entry)
+
+    def _scan(self, min_level: Any, modules: Optional[Sequence[str]],
+              start: Optional[float], end: Optional[float]) -> Iterator[Tuple[int, int]]:
+        """Entry number and line offset of every entry matching a filter"""
+        min_level = level_number(min_level)
+        allowed = self.module_ids(modules) if modules else None
+        low = start if start is not None else float("-inf")
+        high = end if end is not None else float("inf")
+        first = 0
+        for data in self._chunks():
+            for number, (offset, moment, level, module) in enumerate(ENTRY.iter_unpack(data), first):
+                if level >= min_level and low <= moment <= high and (allowed is None or module in allowed):
+                    yield number, offset
+            first += len(data) // ENTRY.size
+
+    def query(self,
+              min_level: Any = 0,
+              modules: Optional[Sequence[str]] = None,
+              start: Optional[float] = None,
+              end: Optional[float] = None) -> Iterator[int]:
+        """
+        Find the lines matching a filter
+
+        Args:
+            min_level: Lowest level number or name
+            modules: Dotted module prefixes, e.g. ["lib.widgets"]; None for all
+            start: Earliest time in epoch seconds
+            end: Latest time in epoch seconds
+
+        Yields:
+            int: Offsets of the matching lines, for read()
+        """
+        for _, offset in self._scan(min_level, modules, start, end):
+            yield offset
+
+    def select(self,
+               min_level: Any = 0,
+               modules: Optional[Sequence[str]] = None,
+               start: Optional[float] = None,
+               end: Optional[float] = None) -> Optional[Sequence[int]]:
+        """
+        Entry numbers of the lines matching a filter, for paging with page()
+
+        Takes the same filter as query(). The result holds 4 bytes per
+        match and stays valid while the log grows, without the new lines.
+
+        Returns:
+            Optional[Sequence[int]]: None if the filter lets every line through
+        """
+        if level_number(min_level) <= 0 and not modules and start is None and end is None:
+            return None
+        return array("I", (number for number, _ in self._scan(min_level, modules, start, end)))
+
+    def read(self, offsets: Iterable[int]) -> List[Dict[str, Any]]:
+        """Records at the given line offsets"""
+        records = []
+        with open(self.path, "rb") as log:
+            for offset in offsets:
+                log.seek(offset)
+                records.append(json.loads(log.readline()))
+        return records
+
+    def page(self, selection: Optional[Sequence[int]], skip: int, limit: int) -> Tuple[List[Dict[str, Any]], bool]:
+        """
+        Read one page of a selection
+
+        Entries are fixed-size, so the page is read from the index by
+        position: its cost does not depend on how many matches it skips.
+
+        Args:
+            selection: Entry numbers from select(), None for every line
+            skip: Matches before the page
+            limit: Most records on the page
+
+        Returns:
+            Tuple[List[Dict[str, Any]], bool]: Records and whether more follow
+        """
+        with open(self.index_path, "rb") as index:
+            if selection is None:
+                count = max(0, min(limit, self.count - skip))
+                index.seek(skip * ENTRY.size)
+                entries = list(ENTRY.iter_unpack(index.read(count * ENTRY.size)))
+                more = skip + count < self.count
+            else:
+                entries = []
+                for number in selection[skip:skip + limit]:
+                    index.seek(number * ENTRY.size)
+                    entries.append(ENTRY.unpack(index.read(ENTRY.size)))
+                more = skip + limit < len(selection)
+        return self.read(entry[0] for entry in entries), more
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Filter a structured log through its index")
+    parser.add_argument("path")
+    parser.add_argument("--level", default="DEBUG")
+    parser.add_argument("--module", action="append", help="dotted module prefix, repeatable")
+    parser.add_argument("--since", default="", help="YYYY-MM-DD HH:MM:SS, HH:MM:SS or epoch seconds")
+    parser.add_argument("--until", default="")
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    index = LogIndex(args.path)
+    added = index.update()
+    print(f"{args.path}: {len(index)} lines indexed ({added} new), {len(index.modules)} modules")
+    selection = index.select(args.level, args.module, parse_time(args.since), parse_time(args.until))
+    records, more = index.page(selection, 0, args.limit)
+    for record in records:
+        moment = datetime.datetime.fromtimestamp(record.get("time", 0.0)).strftime("%Y-%m-%d %H:%M:%S")
+        print(f"{moment} {record.get('level', ''):<8} {record.get('module', '')} : {record.get('message', '')}")
+    if more:
+        print(f"... more than {args.limit} matches")
+
+
+if __name__ == "__main__":
+    main()
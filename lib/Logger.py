@@ -1,92 +1,373 @@
-import datetime
+import atexit
 import logging
 import os
-import inspect
+import queue
+import sys
+import threading
+from typing import Optional
+from logging import CRITICAL, DEBUG, ERROR, INFO, WARNING
+
+from lib.logs.BatchQueueListener import BatchQueueListener
+from lib.logs.LogArchiver import BACKUP_COUNT, LogArchiver
+from lib.logs.LogHandlers import (MAX_BYTES, ROTATE_INTERVAL, JsonFormatter, MemoryLogHandler, RecordQueueHandler,
+                                  RotatingBatchFileHandler)
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(caller)s : %(message)s'
+
+# Where records go: files in the log folder, a bounded list in memory
+# (tools, tests) or nowhere. Set with GAME_LOG_MODE or Logger.set_mode()
+FILE_MODE = "file"
+MEMORY_MODE = "memory"
+NULL_MODE = "null"
+# Above every level, so nothing passes the checks in the logging methods
+_NULL_LEVEL = CRITICAL + 1
+
 
 class Logger:
     """
     Class for managing logging functionality
     Handles different log levels and message formatting
+
+    Log calls only put the record on a queue; a background thread writes
+    the file in batches. The queue is drained when the interpreter exits,
+    including after an uncaught exception, and by shutdown(). The file is
+    rotated by size and age, see RotatingBatchFileHandler and LogArchiver.
+    set_structured(True) also writes every record to a JSONL file.
+
+    Nothing is set up before the first message that passes the level
+    checks: importing the module creates no folder, file or thread.
     """
-    def __init__(self, log_folder: str):
+    def __init__(self, log_folder: str, name: str = "GameLogger", max_bytes: int = MAX_BYTES,
+                 interval: float = ROTATE_INTERVAL, backup_count: int = BACKUP_COUNT,
+                 mode: str = FILE_MODE):
+        if mode not in (FILE_MODE, MEMORY_MODE, NULL_MODE):
+            raise ValueError(f"Unknown log mode: {mode}")
         self.log_folder = log_folder
+        self.mode = mode
+        self.name = name
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self.archiver = LogArchiver(log_folder, backup_count, on_error=self._archiver_error)
         self.logger = None
         self.root_dir = os.path.abspath(os.getcwd())
-        self.setup_logger()
+        self._listener = None
+        self._queue_handler = None
+        self._json_handler = None
+        self._memory_handler = None
+        self._structured = False
+        self._ready = False
+        self._lock = threading.RLock()
+        # Source file -> (caller name, effective level), see _get_caller_info
+        self._callers = {}
+        self._level = DEBUG
+        self._module_levels = {}
+        self._min_level = _NULL_LEVEL if mode == NULL_MODE else DEBUG
+        # Once per logger, shutdown() does nothing while no writer runs
+        atexit.register(self.shutdown)
+
+    def _archiver_error(self, message: str):
+        """Archiver failures go to the log itself, the terminal belongs to curses"""
+        self.warning("%s", message)
+
+    def start(self):
+        """Set up the handlers now instead of at the first logged message"""
+        if self._ready:
+            return
+        with self._lock:
+            if self._ready:
+                return
+            if self.mode == FILE_MODE:
+                self.setup_logger()
+                if self._structured:
+                    self._add_json_handler()
+            elif self.mode == MEMORY_MODE:
+                self._setup_memory()
+            self._ready = True
+
+    def set_mode(self, mode: str):
+        """
+        Switch between FILE_MODE, MEMORY_MODE and NULL_MODE
+
+        Records queued for the previous destination are written first.
+        """
+        if mode not in (FILE_MODE, MEMORY_MODE, NULL_MODE):
+            raise ValueError(f"Unknown log mode: {mode}")
+        with self._lock:
+            if self._ready:
+                self._close_handlers()
+            self.mode = mode
+            self._ready = False
+            self._update_min_level()
+
+    def records(self) -> list:
+        """Lines kept in MEMORY_MODE, oldest first"""
+        if self._memory_handler is None:
+            return []
+        return self._memory_handler.lines()
+
+    def _setup_memory(self):
+        self.logger = logging.getLogger(self.name)
+        self.logger.setLevel(self._min_level)
+        self._memory_handler = MemoryLogHandler()
+        self._memory_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+        self.logger.addHandler(self._memory_handler)
+
+    def _close_handlers(self):
+        self.shutdown()
+        if self.logger is not None:
+            for handler in list(self.logger.handlers):
+                self.logger.removeHandler(handler)
+                handler.close()
+        self._json_handler = None
+        self._memory_handler = None
 
     def setup_logger(self):
         if not os.path.exists(self.log_folder):
             os.makedirs(self.log_folder)
 
-        current_time = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        log_filename = f"LOG__{current_time}__.log"
-        log_path = os.path.join(self.log_folder, log_filename)
+        self.logger = logging.getLogger(self.name)
+        self.logger.setLevel(self._min_level)
 
-        self.logger = logging.getLogger("GameLogger")
-        self.logger.setLevel(logging.DEBUG)
-
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
+        file_handler = RotatingBatchFileHandler(self.log_folder, self.archiver, self.max_bytes, self.interval)
         file_handler.setLevel(logging.DEBUG)
 
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+
+        # The game thread only enqueues, the listener thread formats and writes
+        log_queue = queue.SimpleQueue()
+        self._queue_handler = RecordQueueHandler(log_queue)
+        self.logger.addHandler(self._queue_handler)
+        self._listener = BatchQueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        self.archiver.prune(exclude=file_handler.baseFilename)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until everything logged so far is written
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self._lock:
+            listener = self._listener
+        if listener is None:
+            return True
+        return listener.flush(timeout)
+
+    def shutdown(self):
+        """
+        Write the queued records and stop the writer thread
+
+        Records logged afterwards (other exit handlers) are written directly;
+        logging.shutdown flushes and closes the file at exit.
+        """
+        with self._lock:
+            listener, self._listener = self._listener, None
+        if listener is None:
+            return
+        listener.stop()
+        self.logger.removeHandler(self._queue_handler)
+        for handler in listener.handlers:
+            self.logger.addHandler(handler)
+
+    def set_structured(self, enabled: bool):
+        """
+        Turn the structured sink on or off
+
+        Records are written to LOG__<time>__.jsonl next to the text log, one
+        JSON object per line, see JsonFormatter. The file rotates like the
+        text log.
+        """
+        with self._lock:
+            self._structured = enabled
+            if not self._ready or self.mode != FILE_MODE:
+                # Applied by start()
+                return
+            if enabled == (self._json_handler is not None):
+                return
+            if enabled:
+                self._add_json_handler()
+            else:
+                self._remove_json_handler()
+
+    def _add_json_handler(self):
+        handler = RotatingBatchFileHandler(self.log_folder, self.archiver, self.max_bytes,
+                                           self.interval, extension=".jsonl")
+        handler.setFormatter(JsonFormatter())
+        self.archiver.prune(".jsonl", exclude=handler.baseFilename)
+        self._attach(handler, True)
+        self._json_handler = handler
+
+    def _remove_json_handler(self):
+        handler, self._json_handler = self._json_handler, None
+        self._attach(handler, False)
+        handler.close()
+
+    def _attach(self, handler: logging.Handler, enabled: bool):
+        """Add or remove a handler of the writer thread, or of the logger after shutdown()"""
+        with self._lock:
+            listener = self._listener
+            if listener is None:
+                # After shutdown() the handlers are attached directly
+                if enabled:
+                    self.logger.addHandler(handler)
+                else:
+                    self.logger.removeHandler(handler)
+            else:
+                listener.stop()
+                if enabled:
+                    listener.handlers = listener.handlers + (handler,)
+                else:
+                    listener.handlers = tuple(h for h in listener.handlers if h is not handler)
+                listener.start()
+
+    def set_levels(self, level="DEBUG", module_levels=None):
+        """
+        Set the log level, globally and per module
+
+        Args:
+            level: Level name or number for every module
+            module_levels: Dotted module path -> level, e.g. {"lib.widgets": "INFO"};
+                the longest matching path wins
+        """
+        self._level = _to_level(level)
+        self._module_levels = {module: _to_level(value) for module, value in (module_levels or {}).items()}
+        self._update_min_level()
+        self._callers = {}
+
+    def _update_min_level(self):
+        if self.mode == NULL_MODE:
+            self._min_level = _NULL_LEVEL
+        else:
+            self._min_level = min([self._level, *self._module_levels.values()])
+        if self.logger is not None:
+            self.logger.setLevel(min(self._min_level, CRITICAL))
+
+    def isEnabledFor(self, level: int) -> bool:
+        """
+        Check if a message of this level from the calling module would be logged
 
-        self.logger.addHandler(file_handler)
+        Use it before building expensive log arguments.
+        """
+        if level < self._min_level:
+            return False
+        return level >= self._get_caller_info()[1]
 
-    def _get_caller_info(self):
-        frame = inspect.currentframe()
-        caller_frame = frame.f_back.f_back
-        module = inspect.getmodule(caller_frame)
+    def _get_caller_info(self, depth: int = 2):
+        """
+        Caller name and effective level of the code depth frames up
 
-        if module and module.__file__:
-            abs_path = os.path.abspath(module.__file__)
+        Args:
+            depth: 2 is the caller of the method calling this one
+        """
+        filename = sys._getframe(depth).f_code.co_filename
+        caller = self._callers.get(filename)
+        if caller is None:
+            name = self._caller_name(filename)
+            caller = self._callers[filename] = (name, self._module_level(name))
+        return caller
+
+    def _caller_name(self, filename: str) -> str:
+        """
+        Dotted module path of a source file relative to the start directory
+
+        Parent directories ("..") and the .py suffix are dropped, so a game
+        started from Assets logs lib/widgets/MenuWidget.py as
+        lib.widgets.MenuWidget, the path set_levels and the log viewer match.
+        """
+        if filename.startswith("<"):
+            # <stdin>, <string> and frozen modules have no file
+            return "Unknown File"
+        abs_path = os.path.abspath(filename)
+        try:
             rel_path = os.path.relpath(abs_path, self.root_dir)
-            return rel_path.replace(os.sep, ".")
-        return "Unknown File"
+        except ValueError:
+            # Another drive on Windows
+            rel_path = abs_path
+        rel_path = os.path.splitext(rel_path)[0]
+        parts = [part for part in rel_path.replace(os.altsep or os.sep, os.sep).split(os.sep)
+                 if part not in ("", ".", "..")]
+        return ".".join(parts)
+
+    def _module_level(self, caller: str) -> int:
+        """Level of the longest configured module path found in a caller name"""
+        dotted = "." + caller + "."
+        matches = [module for module in self._module_levels if "." + module + "." in dotted]
+        if not matches:
+            return self._level
+        return self._module_levels[max(matches, key=len)]
 
-    def debug(self, message):
+    def _log(self, level: int, message, args, fields, exc_info=None):
+        # 0 is this method, 1 the logging method, 2 its caller
+        caller, caller_level = self._get_caller_info(3)
+        if level >= caller_level:
+            if not self._ready:
+                self.start()
+            self.logger.log(level, message, *args, exc_info=exc_info,
+                            extra={"caller": caller, "fields": fields})
+
+    def debug(self, message, *args, **fields):
         """
         Log a debug message
     
         Args:
-            message: Message to log
+            message: Message to log, %-style placeholders are filled from args
+                only if the message is logged
+            *args: Arguments for the placeholders
+            **fields: Extra fields for the structured log
         """
-        caller_info = self._get_caller_info()
-        self.logger.debug(f"{caller_info} : {message}")
+        if DEBUG >= self._min_level:
+            self._log(DEBUG, message, args, fields)
 
-    def info(self, message):
+    def info(self, message, *args, **fields):
         """
         Log an informational message
     
         Args:
-            message: Message to log
+            message: Message to log, %-style placeholders are filled from args
+            *args: Arguments for the placeholders
+            **fields: Extra fields for the structured log
         """
-        caller_info = self._get_caller_info()
-        self.logger.info(f"{caller_info} : {message}")
+        if INFO >= self._min_level:
+            self._log(INFO, message, args, fields)
 
-    def warning(self, message):
+    def warning(self, message, *args, **fields):
         """
         Log a warning message
     
         Args:
-            message: Message to log
+            message: Message to log, %-style placeholders are filled from args
+            *args: Arguments for the placeholders
+            **fields: Extra fields for the structured log
         """
-        caller_info = self._get_caller_info()
-        self.logger.warning(f"{caller_info} : {message}")
+        if WARNING >= self._min_level:
+            self._log(WARNING, message, args, fields)
 
-    def error(self, message, exc_info=True):
-        caller_info = self._get_caller_info()
-        self.logger.error(f"{caller_info} : {message}", exc_info=exc_info)
+    def error(self, message, *args, exc_info=True, **fields):
+        if ERROR >= self._min_level:
+            self._log(ERROR, message, args, fields, exc_info=exc_info)
 
-    def critical(self, message):
+    def critical(self, message, *args, **fields):
         """
         Log a critical message
     
         Args:
-            message: Message to log
+            message: Message to log, %-style placeholders are filled from args
+            *args: Arguments for the placeholders
+            **fields: Extra fields for the structured log
         """
-        caller_info = self._get_caller_info()
-        self.logger.critical(f"{caller_info} : {message}")
+        if CRITICAL >= self._min_level:
+            self._log(CRITICAL, message, args, fields)
+
+
+def _to_level(level) -> int:
+    """Level number from a number or a name like INFO"""
+    if isinstance(level, int):
+        return level
+    number = logging.getLevelName(str(level).upper())
+    if not isinstance(number, int):
+        raise ValueError(f"Unknown log level: {level}")
+    return number
 
 
-logger = Logger(log_folder='LOG')
+logger = Logger(log_folder='LOG', mode=os.environ.get("GAME_LOG_MODE", FILE_MODE))
@@ -0,0 +1,152 @@
+import curses
+import selectors
+import sys
+from typing import Any, Callable, List, Optional
+
+from lib.Logger import logger
+from lib.CursesBackend import CursesBackend
+from lib.Scheduler import Scheduler
+
+
+class MainLoop:
+    """
+    Event-driven main loop
+
+    Sleeps until the terminal has input or the next scheduler deadline is due,
+    instead of polling getch every few milliseconds. On platforms where the
+    terminal cannot be watched with selectors (Windows consoles) it falls back
+    to a blocking getch with a timeout, which is still idle between events.
+    """
+
+    def __init__(self, win: Any, input_controller: Any,
+                 scheduler: Optional[Scheduler] = None, fd: Optional[int] = None):
+        """
+        Initialize the main loop
+
+        Args:
+            win: Curses window to read keys from (switched to nodelay mode)
+            input_controller: InputController receiving key codes
+            scheduler: Scheduler providing timers (shared instance by default)
+            fd: File descriptor of the terminal input (stdin by default)
+        """
+        self._win = win
+        self._input_controller = input_controller
+        self._scheduler = scheduler or Scheduler.get_instance()
+        self._running = False
+        self._frame_callbacks: List[Callable[[], None]] = []
+        self._resize_callbacks: List[Callable[[int, int], None]] = []
+        self._selector = self._create_selector(fd)
+
+        self._win.nodelay(True)
+
+    def _create_selector(self, fd: Optional[int]) -> Optional[selectors.BaseSelector]:
+        if sys.platform.startswith('win'):
+            # select() on Windows only accepts sockets
+            return None
+        if CursesBackend.get_instance().headless and fd is None:
+            # Keys come from the headless window, not from stdin
+            return None
+        try:
+            if fd is None:
+                fd = sys.stdin.fileno()
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            return selector
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(f"Terminal input can't be watched with selectors, using getch timeout: {e}")
+            return None
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def add_frame_callback(self, callback: Callable[[], None]):
+        """
+        Add a function called once per iteration, after timers and before waiting
+
+        Args:
+            callback: Function without arguments (e.g. flushing the screen)
+        """
+        self._frame_callbacks.append(callback)
+
+    def remove_frame_callback(self, callback: Callable[[], None]) -> bool:
+        """Remove a frame callback"""
+        if callback in self._frame_callbacks:
+            self._frame_callbacks.remove(callback)
+            return True
+        return False
+
+    def add_resize_callback(self, callback: Callable[[int, int], None]):
+        """
+        Add a function called with the new lines and columns when the terminal is resized
+
+        Args:
+            callback: Function of (lines, cols), e.g. Consolas.resize
+        """
+        self._resize_callbacks.append(callback)
+
+    def end_frame(self):
+        """Run the frame callbacks"""
+        for callback in self._frame_callbacks:
+            callback()
+
+    def run(self):
+        """Run the loop until stop() is called"""
+        self._running = True
+        try:
+            while self._running:
+                self.run_once()
+        finally:
+            self._running = False
+
+    def stop(self):
+        """Stop the loop after the current iteration"""
+        self._running = False
+        # A headless window may be waiting in getch without a timeout
+        wake = getattr(self._win, "wake", None)
+        if wake is not None:
+            wake()
+
+    def run_once(self):
+        """
+        Run one iteration: fire due timers, end the frame, wait for input or
+        the next deadline, then dispatch every pending key
+        """
+        self._scheduler.tick()
+        if not self._running:
+            return
+        self.end_frame()
+        timeout = self._scheduler.time_until_next()
+
+        if self._selector is not None:
+            self._selector.select(timeout)
+        else:
+            self._win.timeout(-1 if timeout is None else int(timeout * 1000))
+            c = self._win.getch()
+            self._win.nodelay(True)
+            if c != -1:
+                self._handle_key(c)
+
+        self._dispatch_pending_keys()
+
+    def _dispatch_pending_keys(self):
+        while True:
+            c = self._win.getch()
+            if c == -1:
+                break
+            self._handle_key(c)
+
+    def _handle_key(self, c: int):
+        if c == curses.KEY_RESIZE:
+            # curses reports SIGWINCH as a key; it is not input for the game
+            lines, cols = CursesBackend.get_instance().terminal_size()
+            for callback in self._resize_callbacks:
+                callback(lines, cols)
+        else:
+            self._input_controller.handle_key(c)
+
+    def close(self):
+        """Release the selector"""
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
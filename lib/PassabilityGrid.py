@@ -0,0 +1,215 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from Assets.data.LevelMap import Levels
+
+# Tiles the player cannot walk through
+BLOCKING_TILES = frozenset("*#")
+
+# Maps every byte but 0 to 1, see PassabilityGrid.from_level
+_PASSABLE_BYTES = bytes([0] + [1] * 255)
+
+_NEIGHBOURS = ((-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1))
+
+
+def _translation(blocking: Iterable[str]) -> dict:
+    """str.translate table turning blocking tiles into NUL and NUL into a passable byte"""
+    blocking = set(blocking)
+    table = {ord(tile): 0 for tile in blocking}
+    if "\0" not in blocking:
+        table[0] = 1
+    return table
+
+
+def _row_cells(row: str, table: dict) -> bytes:
+    """Cells of a row: blocking tiles become NUL, the row is encoded to single bytes, the rest 1"""
+    return row.translate(table).encode("latin-1", "replace").translate(_PASSABLE_BYTES)
+
+
+class PassabilityGrid:
+    """
+    Class for fast collision checks on a level
+
+    One byte per tile (1 passable, 0 blocked), row-major, built once per
+    level. Tiles outside the map and past the end of short rows are blocked.
+    """
+    __slots__ = ("width", "height", "cells")
+
+    def __init__(self, width: int, height: int, cells: Optional[bytearray] = None):
+        if cells is None:
+            cells = bytearray(width * height)
+        elif len(cells) != width * height:
+            raise ValueError("Cell count does not match the grid size")
+        self.width = width
+        self.height = height
+        self.cells = cells
+
+    @classmethod
+    def for_level(cls, level: Levels.BaseLevel, blocking: Iterable[str] = BLOCKING_TILES):
+        """
+        Grid suited to a level: ChunkedPassability for chunked levels, so
+        opening one doesn't page in the whole file, a full grid otherwise
+        """
+        if getattr(level, "chunk_size", None):
+            return ChunkedPassability(level, blocking)
+        return cls.from_level(level, blocking)
+
+    @classmethod
+    def from_level(cls, level: Levels.BaseLevel, blocking: Iterable[str] = BLOCKING_TILES) -> 'PassabilityGrid':
+        """
+        Build the grid of a level
+
+        Each row is converted in C: blocking tiles become NUL, the row is
+        encoded to single bytes and every non-NUL byte becomes 1.
+
+        Args:
+            level: Level to scan
+            blocking: Tiles that block movement
+
+        Returns:
+            PassabilityGrid: Grid of the level
+        """
+        table = _translation(blocking)
+
+        width, height = level.width, level.height
+        cells = bytearray(width * height)
+        for y, row in enumerate(level.iter_rows()):
+            if y >= height:
+                break
+            row = _row_cells(row[:width], table)
+            cells[y * width:y * width + len(row)] = row
+        return cls(width, height, cells)
+
+    def is_passable(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height and self.cells[y * self.width + x] == 1
+
+    def set_passable(self, x: int, y: int, passable: bool):
+        """Change a tile at runtime (doors, destroyed walls)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("Tile is outside the grid")
+        self.cells[y * self.width + x] = 1 if passable else 0
+
+    def are_passable(self, points: Iterable[Tuple[int, int]]) -> List[bool]:
+        """Check many tiles at once"""
+        cells, width, height = self.cells, self.width, self.height
+        return [0 <= x < width and 0 <= y < height and cells[y * width + x] == 1 for x, y in points]
+
+    def passable_neighbours(self, x: int, y: int) -> Iterator[Tuple[int, int]]:
+        """Passable tiles among the 8 neighbours of a tile, for pathfinding"""
+        cells, width, height = self.cells, self.width, self.height
+        for dx, dy in _NEIGHBOURS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height and cells[ny * width + nx] == 1:
+                yield nx, ny
+
+    def find_passable(self, x: int = 0, y: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        Find the first passable tile in reading order starting at (x, y)
+
+        Returns:
+            Optional[Tuple[int, int]]: Tile position, None if there is none
+        """
+        index = self.cells.find(1, max(0, y * self.width + x))
+        if index < 0:
+            return None
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def count_passable(self) -> int:
+        return self.cells.count(1)
+
+    def row(self, y: int) -> memoryview:
+        """Read-only view of one row of cells"""
+        return memoryview(self.cells)[y * self.width:(y + 1) * self.width].toreadonly()
+
+
+class ChunkedPassability:
+    """
+    PassabilityGrid for a ChunkedLevel, built one chunk at a time
+
+    A chunk's cells are computed the first time a tile in it is checked and
+    kept, with any set_passable changes, for the life of the grid. Moving
+    around a huge level only reads the chunks the player gets near.
+    """
+    __slots__ = ("width", "height", "chunk_size", "_level", "_table", "_chunks")
+
+    def __init__(self, level: Levels.BaseLevel, blocking: Iterable[str] = BLOCKING_TILES):
+        self.width = level.width
+        self.height = level.height
+        self.chunk_size = level.chunk_size
+        self._level = level
+        self._table = _translation(blocking)
+        # (chunk x, chunk y) -> chunk_size * chunk_size cells, row-major
+        self._chunks: Dict[Tuple[int, int], bytearray] = {}
+
+    def _chunk(self, cx: int, cy: int) -> bytearray:
+        cells = self._chunks.get((cx, cy))
+        if cells is None:
+            size = self.chunk_size
+            cells = bytearray(size * size)
+            x0 = cx * size
+            for ly in range(min(size, self.height - cy * size)):
+                row = _row_cells(self._level.get_row(cy * size + ly, x0, x0 + size), self._table)
+                cells[ly * size:ly * size + len(row)] = row
+            self._chunks[(cx, cy)] = cells
+        return cells
+
+    def is_passable(self, x: int, y: int) -> bool:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        size = self.chunk_size
+        cy, ly = divmod(y, size)
+        cx, lx = divmod(x, size)
+        return self._chunk(cx, cy)[ly * size + lx] == 1
+
+    def set_passable(self, x: int, y: int, passable: bool):
+        """Change a tile at runtime (doors, destroyed walls)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError("Tile is outside the grid")
+        size = self.chunk_size
+        cy, ly = divmod(y, size)
+        cx, lx = divmod(x, size)
+        self._chunk(cx, cy)[ly * size + lx] = 1 if passable else 0
+
+    def are_passable(self, points: Iterable[Tuple[int, int]]) -> List[bool]:
+        """Check many tiles at once"""
+        return [self.is_passable(x, y) for x, y in points]
+
+    def passable_neighbours(self, x: int, y: int) -> Iterator[Tuple[int, int]]:
+        """Passable tiles among the 8 neighbours of a tile, for pathfinding"""
+        for dx, dy in _NEIGHBOURS:
+            if self.is_passable(x + dx, y + dy):
+                yield x + dx, y + dy
+
+    def _row(self, y: int) -> bytearray:
+        size = self.chunk_size
+        cy, ly = divmod(y, size)
+        cells = bytearray()
+        for cx in range(-(-self.width // size)):
+            cells += self._chunk(cx, cy)[ly * size:(ly + 1) * size]
+        del cells[self.width:]
+        return cells
+
+    def row(self, y: int) -> memoryview:
+        """Read-only copy of one row of cells, builds the chunks along the row"""
+        return memoryview(self._row(y)).toreadonly()
+
+    def find_passable(self, x: int = 0, y: int = 0) -> Optional[Tuple[int, int]]:
+        """
+        Find the first passable tile in reading order starting at (x, y)
+
+        Builds chunks band by band until a passable tile is found.
+
+        Returns:
+            Optional[Tuple[int, int]]: Tile position, None if there is none
+        """
+        x, y = max(0, x), max(0, y)
+        while y < self.height:
+            found = self._row(y).find(1, x)
+            if found >= 0:
+                return found, y
+            x, y = 0, y + 1
+        return None
+
+    def count_passable(self) -> int:
+        """Builds every chunk"""
+        return sum(self._row(y).count(1) for y in range(self.height))
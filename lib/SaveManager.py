@@ -1,20 +1,227 @@
+import atexit
 import json
+import marshal
 import os
+import threading
+from typing import Callable, Dict, List, Optional, Tuple, Union
 from cryptography.fernet import Fernet
 
 from data.Config import Config
 
 from lib.Logger import logger
 
+# Called on the writer thread with the save name and None or the error.
+# It must not wait for the writer: flush() from the writer thread returns
+# at once, so load_data or save_data(wait=True) may see an older save
+SaveCallback = Callable[[str, Optional[Exception]], None]
+# Seconds the exit handler waits for queued saves before giving up
+EXIT_FLUSH_TIMEOUT = 10.0
+# Items of a list or dict frozen in one marshal piece of a snapshot; the
+# writer holds the GIL while it turns one piece into JSON
+SNAPSHOT_CHUNK = 256
+# Frozen copy of the save data: JSON text, and marshal pieces of lists or
+# dicts whose JSON goes in without the outer brackets
+Snapshot = List[Union[str, bytes]]
+
+
+class SaveCancelledError(Exception):
+    """Passed to the callbacks of a queued save dropped by delete_save"""
+    pass
+
+
+def take_snapshot(data) -> Snapshot:
+    """
+    Copy the save data so the game can go on changing it
+
+    marshal copies plain dicts, lists and scalars in C several times faster
+    than json.dumps or copy.deepcopy. Big lists and dicts are cut into
+    pieces of SNAPSHOT_CHUNK items so turning them into JSON on the writer
+    doesn't hold the GIL, and the game, for the whole save. Data marshal
+    can't hold (subclasses of dict, list, str...) is serialized here.
+    """
+    parts = []
+    try:
+        _snapshot_parts(data, parts)
+    except ValueError:
+        return [json.dumps(data)]
+    return parts
+
+
+def _snapshot_parts(value, parts: Snapshot):
+    if type(value) is dict and len(value) <= SNAPSHOT_CHUNK and all(type(key) is str for key in value):
+        # Small dicts are walked so the big lists inside them get cut too
+        parts.append("{")
+        for i, (key, item) in enumerate(value.items()):
+            parts.append(f"{', ' if i else ''}{json.dumps(key)}: ")
+            _snapshot_parts(item, parts)
+        parts.append("}")
+    elif type(value) is dict:
+        items = list(value.items())
+        _snapshot_chunks("{}", [dict(items[i:i + SNAPSHOT_CHUNK]) for i in range(0, len(items), SNAPSHOT_CHUNK)], parts)
+    elif type(value) is list:
+        _snapshot_chunks("[]", [value[i:i + SNAPSHOT_CHUNK] for i in range(0, len(value), SNAPSHOT_CHUNK)], parts)
+    else:
+        parts.append(marshal.dumps([value]))
+
+
+def _snapshot_chunks(brackets: str, chunks: list, parts: Snapshot):
+    parts.append(brackets[0])
+    for i, chunk in enumerate(chunks):
+        if i:
+            parts.append(", ")
+        parts.append(marshal.dumps(chunk))
+    parts.append(brackets[1])
+
+
+def snapshot_to_json(snapshot: Snapshot) -> str:
+    """JSON text of a snapshot, the same as json.dumps of the data it copies"""
+    return "".join(part if type(part) is str else json.dumps(marshal.loads(part))[1:-1]
+                   for part in snapshot)
+
+
+def write_atomic(path: str, data: bytes):
+    """
+    Replace a file so it holds either the old or the new content
+
+    The data goes to path.tmp, is flushed to the disk and renamed over the
+    file; a crash leaves at most a stale .tmp behind.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _sync_directory(path: str):
+    """Make a rename in the folder durable, where the OS allows opening folders"""
+    if not hasattr(os, "O_DIRECTORY"):
+        # Windows: the rename is made durable by NTFS itself
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class SaveWriter:
+    """
+    Background thread writing saves
+
+    The game thread hands over a snapshot of a save; serialization,
+    encryption and the atomic writes happen here. A slot saved again before its previous save
+    was written is written once, with the newest data, and every callback
+    of the merged saves gets that result. flush() waits for all queued
+    saves and runs at interpreter exit, for at most EXIT_FLUSH_TIMEOUT.
+    """
+    def __init__(self, save_manager: 'SaveManager'):
+        self.save_manager = save_manager
+        self._condition = threading.Condition()
+        # Save name -> (snapshot, callbacks), oldest slot first
+        self._pending: Dict[str, Tuple[Snapshot, List[SaveCallback]]] = {}
+        self._writing: Optional[str] = None
+        self._thread = None
+        self.written = 0
+        self.coalesced = 0
+
+    def submit(self, save_name: str, snapshot: Snapshot, callback: Optional[SaveCallback] = None):
+        with self._condition:
+            previous = self._pending.pop(save_name, None)
+            callbacks = previous[1] if previous else []
+            if previous:
+                self.coalesced += 1
+            if callback is not None:
+                callbacks.append(callback)
+            self._pending[save_name] = (snapshot, callbacks)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="SaveWriter", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush, EXIT_FLUSH_TIMEOUT)
+            self._condition.notify_all()
+
+    def cancel(self, save_name: str) -> bool:
+        """
+        Drop a queued save of the slot
+
+        Its callbacks get a SaveCancelledError, on the calling thread.
+
+        Returns:
+            bool: False if no save of the slot was queued
+        """
+        with self._condition:
+            dropped = self._pending.pop(save_name, None)
+            self._condition.notify_all()
+        if dropped is None:
+            return False
+        self._run_callbacks(save_name, dropped[1], SaveCancelledError(f"Save {save_name} was cancelled"))
+        return True
+
+    def is_pending(self, save_name: str) -> bool:
+        with self._condition:
+            return save_name in self._pending or self._writing == save_name
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued save is on disk
+
+        Returns:
+            bool: False if the timeout expired first, or if called from a
+                callback with saves still queued
+        """
+        with self._condition:
+            if threading.current_thread() is self._thread:
+                # A callback can't wait for the thread running it
+                return not self._pending
+            return self._condition.wait_for(lambda: not self._pending and self._writing is None, timeout)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+                save_name = next(iter(self._pending))
+                snapshot, callbacks = self._pending.pop(save_name)
+                self._writing = save_name
+
+            error = None
+            try:
+                self.save_manager._write_files(save_name, snapshot_to_json(snapshot))
+                self.written += 1
+            except Exception as e:
+                error = e
+                logger.error(f"Failed to write save {save_name}: {e}")
+
+            # The save is done before its callbacks run, so flush() in
+            # other threads returns without waiting for them
+            with self._condition:
+                self._writing = None
+                self._condition.notify_all()
+            self._run_callbacks(save_name, callbacks, error)
+
+    def _run_callbacks(self, save_name: str, callbacks: List[SaveCallback], error: Optional[Exception]):
+        for callback in callbacks:
+            try:
+                callback(save_name, error)
+            except Exception as e:
+                logger.error(f"Save callback failed: {e}")
+
+
 class SaveManager:
     """
     Class for managing game data saving and loading
     Handles encryption, file operations, and data integrity checks
+
+    save_data only snapshots the data on the calling thread; a SaveWriter
+    serializes, encrypts and writes the files in the background.
+    Values marshal copies but JSON can't hold (bytes, sets) fail on the
+    writer and are reported to the save callback and the log.
     """
     def __init__(self):
-        self.save_dir = self.save_dir = os.path.join(os.getenv("LOCALAPPDATA"), ".TheTextRPG")
+        self.save_dir = os.path.join(os.getenv("LOCALAPPDATA"), ".TheTextRPG")
         self.key_file = os.path.join(self.save_dir, "encryption_key.key")
         self.fernet = self._load_or_create_key()
+        self.writer = SaveWriter(self)
 
     def _load_or_create_key(self):
         """
@@ -34,30 +241,50 @@ class SaveManager:
                 key = key_file.read()
         return Fernet(key)
 
-    def save_data(self, data, save_name):
+    def save_data(self, data, save_name, callback: Optional[SaveCallback] = None, wait: bool = False):
         """
         Save game data to files
     
         Args:
             data: Data to save
             save_name: Name of the save file
+            callback: Called on the writer thread with (save_name, error) once written
+            wait: Block until the save is on disk
+        """
+        if hasattr(data, 'to_dict'):
+            data_dict = data.to_dict()
+        else:
+            data_dict = data
+
+        # Copied here so later changes to the game state don't leak into the save
+        self.writer.submit(save_name, take_snapshot(data_dict), callback)
+        if wait:
+            self.writer.flush()
+
+    def _write_files(self, save_name, text):
+        """
+        Write both files of a save, called by the writer thread
+
+        The encrypted file goes first: if the JSON file is left behind by a
+        crash, load_data sees the mismatch and uses the encrypted data.
         """
         os.makedirs(self.save_dir, exist_ok=True)
 
         json_file = os.path.join(self.save_dir, f"{save_name}.json")
         encrypted_file = os.path.join(self.save_dir, f"{save_name}.enc")
 
-        if hasattr(data, 'to_dict'):
-            data_dict = data.to_dict()
-        else:
-            data_dict = data
+        write_atomic(encrypted_file, self.fernet.encrypt(text.encode()))
+        write_atomic(json_file, text.encode())
+        _sync_directory(self.save_dir)
 
-        with open(json_file, 'w') as f:
-            json.dump(data_dict, f)
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the queued saves to be written
 
-        encrypted_data = self.fernet.encrypt(json.dumps(data_dict).encode())
-        with open(encrypted_file, 'wb') as f:
-            f.write(encrypted_data)
+        Returns:
+            bool: False if the timeout expired first
+        """
+        return self.writer.flush(timeout)
 
     def load_data(self, save_name, data_class=None):
         """
@@ -67,6 +294,9 @@ class SaveManager:
             save_name: Name of the save file
             data_class: Class to deserialize data into (optional)
         """
+        if self.writer.is_pending(save_name):
+            self.writer.flush()
+
         json_file = os.path.join(self.save_dir, f"{save_name}.json")
         encrypted_file = os.path.join(self.save_dir, f"{save_name}.enc")
 
@@ -101,6 +331,7 @@ class SaveManager:
         Returns:
             list: List of save names
         """
+        self.writer.flush()
         saves = []
         for file in os.listdir(self.save_dir):
             if file.endswith(".json"):
@@ -114,6 +345,8 @@ class SaveManager:
         Args:
             save_name: Name of the save to delete
         """
+        self.writer.cancel(save_name)
+        self.writer.flush()
         json_file = os.path.join(self.save_dir, f"{save_name}.json")
         encrypted_file = os.path.join(self.save_dir, f"{save_name}.enc")
 
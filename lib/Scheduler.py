@@ -0,0 +1,269 @@
+import heapq
+import itertools
+import time
+from typing import Callable, Generator, List, Optional, Tuple
+
+from lib.Logger import logger
+
+
+class Timer:
+    """
+    Handle of a callback scheduled on the Scheduler
+    """
+    __slots__ = ("deadline", "callback", "interval", "cancelled")
+
+    def __init__(self, deadline: float, callback: Callable[[], None], interval: Optional[float] = None):
+        self.deadline = deadline
+        self.callback = callback
+        self.interval = interval
+        self.cancelled = False
+
+    def cancel(self):
+        """Cancel the timer, it will be dropped without being called"""
+        self.cancelled = True
+
+
+class Task:
+    """
+    Cooperative task driven by the Scheduler
+
+    Wraps a generator that yields the delay in seconds before its next step
+    (None or 0 means the next tick). Used for widget animations so several
+    of them can run at once without blocking input.
+    """
+    __slots__ = ("_scheduler", "_steps", "_timer", "_callbacks", "done", "cancelled")
+
+    def __init__(self, scheduler: 'Scheduler', steps: Generator):
+        self._scheduler = scheduler
+        self._steps = steps
+        self._timer: Optional[Timer] = None
+        self._callbacks: List[Callable[[], None]] = []
+        self.done = False
+        self.cancelled = False
+
+    def _step(self):
+        self._timer = None
+        try:
+            delay = next(self._steps)
+        except StopIteration:
+            self._finish()
+            return
+        except Exception as e:
+            logger.error(f"Task failed: {e}")
+            self._finish()
+            return
+        if self.done:
+            # Cancelled or finished from inside the step
+            return
+        self._timer = self._scheduler.call_later(delay or 0.0, self._step)
+
+    def _finish(self):
+        self.done = True
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.error(f"Task done callback failed: {e}")
+
+    def finish(self):
+        """Run all remaining steps right now, ignoring their delays"""
+        if self.done:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        try:
+            for _ in self._steps:
+                pass
+        except Exception as e:
+            logger.error(f"Task failed: {e}")
+        self._finish()
+
+    def cancel(self):
+        """Stop the task without running its remaining steps"""
+        if self.done:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.cancelled = True
+        try:
+            self._steps.close()
+        except ValueError:
+            # Cancelled from inside its own step, the generator is not resumed again
+            pass
+        self._finish()
+
+    def add_done_callback(self, callback: Callable[[], None]):
+        """
+        Call a function once the task is finished or cancelled
+
+        Args:
+            callback: Function without arguments, called right away if the task is done
+        """
+        if self.done:
+            callback()
+        else:
+            self._callbacks.append(callback)
+
+
+class Scheduler:
+    """
+    Class for managing timed callbacks and cooperative tasks on the main thread
+    Implements the singleton pattern so the main loop and widgets share one clock
+
+    The main loop asks the scheduler how long it may sleep (time_until_next)
+    and runs due callbacks with tick(). Not thread-safe: schedule only from
+    the main thread.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def set_instance(cls, scheduler: 'Scheduler'):
+        """Replace the shared scheduler, e.g. with one on a virtual clock for replays"""
+        cls._instance = scheduler
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._timers: List[Tuple[float, int, Timer]] = []
+        self._counter = itertools.count()
+
+    def now(self) -> float:
+        """Current time of the scheduler clock"""
+        return self._clock()
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedule a callback to run once after a delay
+
+        Args:
+            delay: Delay in seconds
+            callback: Function without arguments
+
+        Returns:
+            Timer: Handle that can be cancelled
+        """
+        timer = Timer(self._clock() + max(0.0, delay), callback)
+        self._push(timer)
+        return timer
+
+    def call_every(self, interval: float, callback: Callable[[], None]) -> Timer:
+        """
+        Schedule a callback to run repeatedly
+
+        Args:
+            interval: Interval in seconds
+            callback: Function without arguments
+
+        Returns:
+            Timer: Handle that can be cancelled
+        """
+        if interval <= 0:
+            raise ValueError("Interval must be positive")
+        timer = Timer(self._clock() + interval, callback, interval)
+        self._push(timer)
+        return timer
+
+    def spawn(self, steps: Generator) -> Task:
+        """
+        Start a cooperative task
+
+        The first step runs immediately, the following ones are driven by tick().
+
+        Args:
+            steps: Generator yielding the delay in seconds before its next step
+
+        Returns:
+            Task: Handle of the running task
+        """
+        task = Task(self, steps)
+        task._step()
+        return task
+
+    def run_until_complete(self, task: Task):
+        """
+        Drive the scheduler until a task is done, sleeping between deadlines
+
+        Meant for tools and benchmarks that have no main loop.
+        """
+        while not task.done:
+            timeout = self.time_until_next()
+            if timeout:
+                time.sleep(timeout)
+            self.tick()
+
+    def _push(self, timer: Timer):
+        heapq.heappush(self._timers, (timer.deadline, next(self._counter), timer))
+
+    def next_deadline(self) -> Optional[float]:
+        """
+        Get the deadline of the nearest pending timer
+
+        Returns:
+            Optional[float]: Deadline on the scheduler clock, None if nothing is scheduled
+        """
+        timers = self._timers
+        while timers and timers[0][2].cancelled:
+            heapq.heappop(timers)
+        return timers[0][0] if timers else None
+
+    def time_until_next(self) -> Optional[float]:
+        """
+        Get how long the main loop may sleep
+
+        Returns:
+            Optional[float]: Seconds until the nearest deadline (0 if overdue),
+            None if nothing is scheduled
+        """
+        deadline = self.next_deadline()
+        if deadline is None:
+            return None
+        return max(0.0, deadline - self._clock())
+
+    def tick(self) -> int:
+        """
+        Run all callbacks whose deadline has passed
+
+        Returns:
+            int: Number of callbacks run
+        """
+        timers = self._timers
+        now = self._clock()
+        # Timers pushed while ticking (a task rescheduling itself with no
+        # delay) wait for the next tick, so one tick always terminates
+        last = next(self._counter)
+        deferred = []
+        ran = 0
+        while timers and timers[0][0] <= now:
+            entry = heapq.heappop(timers)
+            timer = entry[2]
+            if timer.cancelled:
+                continue
+            if entry[1] > last:
+                deferred.append(entry)
+                continue
+            if timer.interval is not None:
+                timer.deadline += timer.interval
+                if timer.deadline <= now:
+                    # We fell behind, skip missed intervals instead of bursting
+                    timer.deadline = now + timer.interval
+                self._push(timer)
+            try:
+                timer.callback()
+            except Exception as e:
+                logger.error(f"Scheduled callback failed: {e}")
+            ran += 1
+        for entry in deferred:
+            heapq.heappush(timers, entry)
+        return ran
+
+    def has_pending(self) -> bool:
+        """Check if anything is scheduled"""
+        return self.next_deadline() is not None
@@ -0,0 +1,472 @@
+import curses
+from typing import Any, Iterable, List, Optional, Set, Tuple
+
+from lib.CursesBackend import CursesBackend
+
+
+BOX_CHARS = {
+    "vline": "│", "hline": "─",
+    "ulcorner": "┌", "urcorner": "┐",
+    "llcorner": "└", "lrcorner": "┘",
+}
+
+# Unchanged cells between two changed runs that are rewritten anyway
+# to save a cursor movement and a call into curses
+RUN_MERGE_GAP = 4
+
+
+def _resize_grid(grid: List[list], nlines: int, ncols: int, fill: Any) -> List[list]:
+    """Rows of a grid cut or padded with fill to nlines x ncols"""
+    rows = [row[:ncols] + [fill] * (ncols - len(row)) for row in grid[:nlines]]
+    rows.extend([fill] * ncols for _ in range(nlines - len(rows)))
+    return rows
+
+
+class VirtualWindow:
+    """
+    Curses-like window drawing into a ScreenBuffer
+
+    Supports the subset of the curses window API the widgets use. Like curses,
+    a window keeps its own cells and copies the touched lines into the screen
+    on noutrefresh(); refresh() does the same and leaves the terminal update
+    to the next ScreenBuffer.flush().
+    """
+
+    def __init__(self, screen: 'ScreenBuffer', nlines: int, ncols: int, begin_y: int = 0, begin_x: int = 0):
+        self._screen = screen
+        self._nlines = max(1, nlines)
+        self._ncols = max(1, ncols)
+        self._begin_y = begin_y
+        self._begin_x = begin_x
+        self._chars: List[List[str]] = [[" "] * self._ncols for _ in range(self._nlines)]
+        self._attrs: List[List[int]] = [[0] * self._ncols for _ in range(self._nlines)]
+        self._touched: Set[int] = set(range(self._nlines))
+        self._cursor_y = 0
+        self._cursor_x = 0
+        self._attr = 0
+        self._cleared = False
+
+    # —————————————————————————————— geometry ——————————————————————————————
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self._nlines, self._ncols
+
+    def getbegyx(self) -> Tuple[int, int]:
+        return self._begin_y, self._begin_x
+
+    def getyx(self) -> Tuple[int, int]:
+        return self._cursor_y, self._cursor_x
+
+    def move(self, y: int, x: int) -> None:
+        if not (0 <= y < self._nlines and 0 <= x < self._ncols):
+            raise curses.error("move() returned ERR")
+        self._cursor_y, self._cursor_x = y, x
+        self._screen.set_cursor(self._begin_y + y, self._begin_x + x)
+
+    # —————————————————————————————— attributes ——————————————————————————————
+
+    def attron(self, attr: int) -> None:
+        self._attr |= attr
+
+    def attroff(self, attr: int) -> None:
+        self._attr &= ~attr
+
+    def attrset(self, attr: int) -> None:
+        self._attr = attr
+
+    # —————————————————————————————— drawing ——————————————————————————————
+
+    def addstr(self, *args) -> None:
+        """addstr([y, x,] text[, attr])"""
+        if len(args) >= 3:
+            y, x, text = args[0], args[1], args[2]
+            attr = args[3] if len(args) > 3 else self._attr
+            self.move(y, x)
+        else:
+            text = args[0]
+            attr = args[1] if len(args) > 1 else self._attr
+        self._put(str(text), attr)
+
+    def addch(self, *args) -> None:
+        """addch([y, x,] ch[, attr])"""
+        if len(args) >= 3:
+            y, x, ch = args[0], args[1], args[2]
+            attr = args[3] if len(args) > 3 else self._attr
+            self.move(y, x)
+        else:
+            ch = args[0]
+            attr = args[1] if len(args) > 1 else self._attr
+        if isinstance(ch, int):
+            attr |= ch & ~curses.A_CHARTEXT
+            ch = chr(ch & curses.A_CHARTEXT)
+        self._put(ch, attr)
+
+    def _put(self, text: str, attr: int) -> None:
+        y, x = self._cursor_y, self._cursor_x
+        ncols = self._ncols
+        pos = 0
+        length = len(text)
+        while pos < length:
+            newline = text.find("\n", pos)
+            end = length if newline == -1 else newline
+            while pos < end:
+                # Write what fits on the current line in one slice
+                count = min(end - pos, ncols - x)
+                self._chars[y][x:x + count] = text[pos:pos + count]
+                self._attrs[y][x:x + count] = [attr] * count
+                self._touched.add(y)
+                pos += count
+                x += count
+                if x >= ncols:
+                    if y + 1 >= self._nlines:
+                        self._cursor_y, self._cursor_x = y, ncols - 1
+                        raise curses.error("addwstr() returned ERR")
+                    y, x = y + 1, 0
+            if newline != -1:
+                # Newline clears the rest of the line like curses does
+                if x < ncols:
+                    self._chars[y][x:] = [" "] * (ncols - x)
+                    self._attrs[y][x:] = [attr] * (ncols - x)
+                    self._touched.add(y)
+                pos += 1
+                if y + 1 >= self._nlines:
+                    self._cursor_y, self._cursor_x = y, x
+                    raise curses.error("addwstr() returned ERR")
+                y, x = y + 1, 0
+        self._cursor_y, self._cursor_x = y, x
+
+    def box(self, vertch: Any = 0, horch: Any = 0) -> None:
+        vline = vertch if isinstance(vertch, str) and vertch else BOX_CHARS["vline"]
+        hline = horch if isinstance(horch, str) and horch else BOX_CHARS["hline"]
+        attr = self._attr
+        last_y, last_x = self._nlines - 1, self._ncols - 1
+        top = self._chars[0]
+        bottom = self._chars[last_y]
+        top[:] = [hline] * self._ncols
+        bottom[:] = [hline] * self._ncols
+        self._attrs[0][:] = [attr] * self._ncols
+        self._attrs[last_y][:] = [attr] * self._ncols
+        for y in range(1, last_y):
+            self._chars[y][0] = vline
+            self._chars[y][last_x] = vline
+            self._attrs[y][0] = attr
+            self._attrs[y][last_x] = attr
+        top[0], top[last_x] = BOX_CHARS["ulcorner"], BOX_CHARS["urcorner"]
+        bottom[0], bottom[last_x] = BOX_CHARS["llcorner"], BOX_CHARS["lrcorner"]
+        self._touched.update(range(self._nlines))
+
+    def erase(self) -> None:
+        for y in range(self._nlines):
+            self._chars[y][:] = [" "] * self._ncols
+            self._attrs[y][:] = [0] * self._ncols
+        self._touched.update(range(self._nlines))
+        self._cursor_y = self._cursor_x = 0
+
+    def clear(self) -> None:
+        """Erase the window and repaint the whole terminal on the next flush"""
+        self.erase()
+        self._cleared = True
+
+    def touchwin(self) -> None:
+        self._touched.update(range(self._nlines))
+
+    def resize(self, nlines: int, ncols: int) -> None:
+        """Change the size of the window, keeping the cells that still fit like curses"""
+        self._nlines = max(1, nlines)
+        self._ncols = max(1, ncols)
+        self._chars = _resize_grid(self._chars, self._nlines, self._ncols, " ")
+        self._attrs = _resize_grid(self._attrs, self._nlines, self._ncols, 0)
+        self._cursor_y = min(self._cursor_y, self._nlines - 1)
+        self._cursor_x = min(self._cursor_x, self._ncols - 1)
+        self._touched = set(range(self._nlines))
+
+    def shift(self, dy: int, dx: int, top: int, left: int, height: int, width: int) -> None:
+        """
+        Move the contents of an area by dy rows and dx columns
+
+        Cells moved out of the area are dropped, the vacated ones are blank
+        and left for the caller to draw. Lets a scrolled view paint only the
+        newly exposed strip instead of every cell.
+
+        Args:
+            dy, dx: Offset of the contents, negative moves them up or left
+            top, left: Top-left corner of the area
+            height, width: Size of the area
+        """
+        height = min(height, self._nlines - top)
+        width = min(width, self._ncols - left)
+        if height <= 0 or width <= 0:
+            return
+        right = left + width
+        rows = range(top, top + height)
+        chars = [self._chars[y][left:right] for y in rows]
+        attrs = [self._attrs[y][left:right] for y in rows]
+        blank_chars, blank_attrs = [" "] * width, [0] * width
+        for i, y in enumerate(rows):
+            source = i - dy
+            if 0 <= source < height and abs(dx) < width:
+                row_chars, row_attrs = chars[source], attrs[source]
+                if dx >= 0:
+                    row_chars = [" "] * dx + row_chars[:width - dx]
+                    row_attrs = [0] * dx + row_attrs[:width - dx]
+                else:
+                    row_chars = row_chars[-dx:] + [" "] * -dx
+                    row_attrs = row_attrs[-dx:] + [0] * -dx
+            else:
+                row_chars, row_attrs = blank_chars, blank_attrs
+            self._chars[y][left:right] = row_chars
+            self._attrs[y][left:right] = row_attrs
+        self._touched.update(rows)
+
+    # —————————————————————————————— output ——————————————————————————————
+
+    def noutrefresh(self) -> None:
+        if self._cleared:
+            self._screen.request_repaint()
+            self._cleared = False
+        if self._touched:
+            self._screen.blit(self, sorted(self._touched), 0, 0,
+                              self._begin_y, self._begin_x, self._nlines, self._ncols)
+            self._touched.clear()
+
+    def refresh(self) -> None:
+        self.noutrefresh()
+
+    # Input and terminal modes belong to the real window, these are no-ops
+    def keypad(self, flag: bool) -> None:
+        pass
+
+    def nodelay(self, flag: bool) -> None:
+        pass
+
+
+class VirtualPad(VirtualWindow):
+    """
+    Curses-like pad drawing into a ScreenBuffer
+
+    refresh()/noutrefresh() take the curses pad arguments and copy the
+    requested part of the pad to the screen.
+    """
+
+    def __init__(self, screen: 'ScreenBuffer', nlines: int, ncols: int):
+        super().__init__(screen, nlines, ncols)
+        self._last_region = None
+
+    def noutrefresh(self, pminrow: int = 0, pmincol: int = 0, sminrow: int = 0,
+                    smincol: int = 0, smaxrow: int = 0, smaxcol: int = 0) -> None:
+        height = min(smaxrow - sminrow + 1, self._nlines - pminrow)
+        width = min(smaxcol - smincol + 1, self._ncols - pmincol)
+        if height <= 0 or width <= 0:
+            return
+
+        region = (pminrow, pmincol, sminrow, smincol, height, width)
+        if self._cleared:
+            self._screen.request_repaint()
+            self._cleared = False
+        if region != self._last_region:
+            rows = range(pminrow, pminrow + height)
+            self._last_region = region
+        else:
+            rows = sorted(y for y in self._touched if pminrow <= y < pminrow + height)
+        if rows:
+            self._screen.blit(self, rows, pminrow, pmincol, sminrow, smincol, height, width)
+        self._touched.clear()
+
+    def refresh(self, *args) -> None:
+        self.noutrefresh(*args)
+
+
+class ScreenBuffer:
+    """
+    Back buffer of the whole terminal owned by Consolas
+
+    Windows and pads created here draw into the buffer. flush() compares it
+    with what was last sent to the terminal and writes only the changed
+    cells, then does a single wnoutrefresh/doupdate, so a frame costs one
+    terminal update no matter how many widgets refreshed during it.
+    """
+
+    def __init__(self, target: Any):
+        """
+        Initialize the buffer
+
+        Args:
+            target: Real curses window covering the terminal
+        """
+        self._target = target
+        self._height, self._width = target.getmaxyx()
+        self._back_chars = [[" "] * self._width for _ in range(self._height)]
+        self._back_attrs = [[0] * self._width for _ in range(self._height)]
+        self._front_chars = [[" "] * self._width for _ in range(self._height)]
+        self._front_attrs = [[0] * self._width for _ in range(self._height)]
+        self._dirty: Set[int] = set()
+        self._repaint = False
+        self._cursor: Optional[Tuple[int, int]] = None
+        self._root = VirtualWindow(self, self._height, self._width)
+
+        self.flush_count = 0
+        self.cells_written = 0
+        self.runs_written = 0
+        self.bytes_written = 0
+
+    @property
+    def root(self) -> VirtualWindow:
+        """Window covering the whole screen"""
+        return self._root
+
+    @property
+    def target(self) -> Any:
+        return self._target
+
+    @property
+    def needs_flush(self) -> bool:
+        return bool(self._dirty) or self._repaint
+
+    def getmaxyx(self) -> Tuple[int, int]:
+        return self._height, self._width
+
+    def newwin(self, nlines: int, ncols: int, begin_y: int = 0, begin_x: int = 0) -> VirtualWindow:
+        return VirtualWindow(self, nlines, ncols, begin_y, begin_x)
+
+    def newpad(self, nlines: int, ncols: int) -> VirtualPad:
+        return VirtualPad(self, nlines, ncols)
+
+    def set_cursor(self, y: int, x: int) -> None:
+        self._cursor = (y, x)
+
+    def resize(self, lines: int, cols: int) -> None:
+        """
+        Follow a resized terminal
+
+        The cells that still fit are kept and the root window takes the new
+        size; every cell is rewritten on the next flush, since the terminal
+        content after a resize is unknown.
+
+        Args:
+            lines: New terminal height
+            cols: New terminal width
+        """
+        self._height, self._width = lines, cols
+        self._back_chars = _resize_grid(self._back_chars, lines, cols, " ")
+        self._back_attrs = _resize_grid(self._back_attrs, lines, cols, 0)
+        self._front_chars = [[" "] * cols for _ in range(lines)]
+        self._front_attrs = [[0] * cols for _ in range(lines)]
+        self._dirty = {y for y in self._dirty if y < lines}
+        if self._cursor is not None and not (self._cursor[0] < lines and self._cursor[1] < cols):
+            self._cursor = None
+        self._root.resize(lines, cols)
+        self.request_repaint()
+
+    def request_repaint(self) -> None:
+        """Rewrite every cell on the next flush, as curses clear() does"""
+        self._repaint = True
+
+    def blit(self, win: VirtualWindow, rows: Iterable[int], src_y: int, src_x: int,
+             dst_y: int, dst_x: int, height: int, width: int) -> None:
+        """
+        Copy rows of a window into the back buffer, clipped to the screen
+
+        Args:
+            win: Source window
+            rows: Source rows to copy
+            src_y, src_x: Top-left corner of the copied area in the window
+            dst_y, dst_x: Where that corner lands on the screen
+            height, width: Size of the copied area
+        """
+        left = max(0, -dst_x)
+        right = min(width, self._width - dst_x)
+        if left >= right:
+            return
+        for y in rows:
+            sy = dst_y + y - src_y
+            if not 0 <= sy < self._height or not src_y <= y < src_y + height:
+                continue
+            self._back_chars[sy][dst_x + left:dst_x + right] = win._chars[y][src_x + left:src_x + right]
+            self._back_attrs[sy][dst_x + left:dst_x + right] = win._attrs[y][src_x + left:src_x + right]
+            self._dirty.add(sy)
+
+    def flush(self) -> bool:
+        """
+        Send the changed cells to the terminal
+
+        Returns:
+            bool: True if anything was written
+        """
+        if not self.needs_flush:
+            return False
+
+        if self._repaint:
+            rows = range(self._height)
+            for y in rows:
+                self._front_chars[y][:] = [None] * self._width
+            try:
+                self._target.clearok(True)
+            except (curses.error, AttributeError):
+                pass
+            self._repaint = False
+        else:
+            rows = sorted(self._dirty)
+        self._dirty.clear()
+
+        target = self._target
+        for y in rows:
+            back_chars, back_attrs = self._back_chars[y], self._back_attrs[y]
+            front_chars, front_attrs = self._front_chars[y], self._front_attrs[y]
+            if back_chars == front_chars and back_attrs == front_attrs:
+                continue
+            for x, text, attr in self._changed_runs(back_chars, back_attrs, front_chars, front_attrs):
+                try:
+                    target.addstr(y, x, text, attr)
+                except curses.error:
+                    # Writing the bottom-right cell moves the cursor off screen
+                    pass
+                self.runs_written += 1
+                self.cells_written += len(text)
+                self.bytes_written += len(text.encode("utf-8"))
+            front_chars[:] = back_chars
+            front_attrs[:] = back_attrs
+
+        if self._cursor is not None:
+            try:
+                target.move(*self._cursor)
+            except curses.error:
+                pass
+        target.noutrefresh()
+        CursesBackend.get_instance().doupdate()
+        self.flush_count += 1
+        return True
+
+    @staticmethod
+    def _changed_runs(back_chars, back_attrs, front_chars, front_attrs):
+        """Yield (x, text, attr) for runs of changed cells sharing an attribute"""
+        width = len(back_chars)
+        x = 0
+        while x < width:
+            if back_chars[x] == front_chars[x] and back_attrs[x] == front_attrs[x]:
+                x += 1
+                continue
+            start = x
+            attr = back_attrs[x]
+            end = x + 1
+            gap = 0
+            x += 1
+            while x < width and back_attrs[x] == attr:
+                if back_chars[x] != front_chars[x] or front_attrs[x] != attr:
+                    end = x + 1
+                    gap = 0
+                else:
+                    gap += 1
+                    if gap > RUN_MERGE_GAP:
+                        break
+                x += 1
+            yield start, "".join(back_chars[start:end]), attr
+            x = end
+
+    def stats(self) -> dict:
+        """Counters of what was sent to the terminal since creation"""
+        return {
+            "flushes": self.flush_count,
+            "runs": self.runs_written,
+            "cells": self.cells_written,
+            "bytes": self.bytes_written,
+        }
@@ -0,0 +1,364 @@
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, NamedTuple, Optional
+
+from lib.Logger import logger
+
+# File layout: header, then records of a type byte, the microseconds since
+# the previous record (uint32) and a payload. Event names are written once
+# in a NAME record and referenced by id afterwards.
+MAGIC = b"TRRC"
+VERSION = 2
+HEADER = struct.Struct("<4sHd")    # magic, version, wall clock time of the start
+RECORD = struct.Struct("<BI")      # type, delta in microseconds
+KEY = struct.Struct("<i")          # key code
+EVENT = struct.Struct("<I")        # name id
+NAME = struct.Struct("<II")        # name id, length of the UTF-8 name
+
+KEY_RECORD = 0
+EVENT_RECORD = 1
+NAME_RECORD = 2
+
+_MAX_DELTA = 0xFFFFFFFF
+
+
+class SessionFormatError(Exception):
+    """Raised when a file is not a valid session recording"""
+    pass
+
+
+class SessionEntry(NamedTuple):
+    """Recorded key code (kind "key") or emitted event name (kind "event")"""
+    time: float
+    kind: str
+    value: Any
+
+
+class SessionRecorder:
+    """
+    Class for recording play sessions
+
+    Every key code passed to InputController.handle_key and every event
+    delivered by EventSystem.emit is appended to a compact binary log with
+    its time since the start of the recording. SessionPlayer feeds the log
+    back, see benchmarks/bench_replay.py.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file: Optional[BinaryIO] = None
+        self._lock = threading.Lock()
+        self._names: Dict[str, int] = {}
+        self._start = 0.0
+        self._last = 0
+        self._input_controller = None
+        self._event_system = None
+        self.keys = 0
+        self.events = 0
+
+    @property
+    def recording(self) -> bool:
+        return self._file is not None
+
+    def start(self, input_controller: Any = None, event_system: Any = None):
+        """
+        Open the log and hook into the input controller and event system
+
+        Args:
+            input_controller: InputController whose keys are recorded
+            event_system: EventSystem whose delivered events are recorded
+        """
+        if self._file is not None:
+            return
+        self._file = open(self.path, "wb")
+        self._file.write(HEADER.pack(MAGIC, VERSION, time.time()))
+        self._names.clear()
+        self._start = time.perf_counter()
+        self._last = 0
+        self.keys = self.events = 0
+
+        if input_controller is not None:
+            input_controller.add_key_listener(self.record_key)
+            self._input_controller = input_controller
+        if event_system is not None:
+            event_system.add_global_filter(self._record_event)
+            self._event_system = event_system
+        logger.info(f"Recording session to {self.path}")
+
+    def stop(self):
+        """Unhook and close the log"""
+        if self._file is None:
+            return
+        if self._input_controller is not None:
+            self._input_controller.remove_key_listener(self.record_key)
+            self._input_controller = None
+        if self._event_system is not None:
+            self._event_system.remove_global_filter(self._record_event)
+            self._event_system = None
+        with self._lock:
+            self._file.close()
+            self._file = None
+        logger.info(f"Session recorded: {self.keys} keys, {self.events} events")
+
+    def __enter__(self) -> 'SessionRecorder':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _delta(self) -> int:
+        """Microseconds since the previous record, call with the lock held"""
+        now = int((time.perf_counter() - self._start) * 1e6)
+        delta = min(max(0, now - self._last), _MAX_DELTA)
+        self._last += delta
+        return delta
+
+    def record_key(self, key: int):
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(RECORD.pack(KEY_RECORD, self._delta()) + KEY.pack(key))
+            self.keys += 1
+
+    def record_event(self, event_name: str):
+        with self._lock:
+            if self._file is None:
+                return
+            name_id = self._names.get(event_name)
+            if name_id is None:
+                name_id = self._names[event_name] = len(self._names)
+                encoded = event_name.encode("utf-8")
+                self._file.write(RECORD.pack(NAME_RECORD, 0) + NAME.pack(name_id, len(encoded)) + encoded)
+            self._file.write(RECORD.pack(EVENT_RECORD, self._delta()) + EVENT.pack(name_id))
+            self.events += 1
+
+    def _record_event(self, event_data: Any) -> bool:
+        """Global filter recording the event and letting it through"""
+        self.record_event(event_data.event_name)
+        return True
+
+
+def read_session(path: str) -> Iterator[SessionEntry]:
+    """
+    Read a session recording
+
+    Args:
+        path: Recording file
+
+    Yields:
+        SessionEntry: Keys and events in recorded order, time in seconds since the start
+
+    Raises:
+        SessionFormatError: If the file is not a recording or is truncated
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if len(data) < HEADER.size:
+        raise SessionFormatError(f"{path} is too short for a session recording")
+    magic, version, _ = HEADER.unpack_from(data)
+    if magic != MAGIC or version != VERSION:
+        raise SessionFormatError(f"{path} is not a version {VERSION} session recording")
+
+    names: Dict[int, str] = {}
+    offset = HEADER.size
+    elapsed = 0
+    try:
+        while offset < len(data):
+            kind, delta = RECORD.unpack_from(data, offset)
+            offset += RECORD.size
+            elapsed += delta
+            if kind == KEY_RECORD:
+                key, = KEY.unpack_from(data, offset)
+                offset += KEY.size
+                yield SessionEntry(elapsed / 1e6, "key", key)
+            elif kind == EVENT_RECORD:
+                name_id, = EVENT.unpack_from(data, offset)
+                offset += EVENT.size
+                yield SessionEntry(elapsed / 1e6, "event", names[name_id])
+            elif kind == NAME_RECORD:
+                name_id, length = NAME.unpack_from(data, offset)
+                offset += NAME.size
+                names[name_id] = data[offset:offset + length].decode("utf-8")
+                offset += length
+            else:
+                raise SessionFormatError(f"Unknown record type {kind} at offset {offset - RECORD.size}")
+    except (struct.error, KeyError) as e:
+        raise SessionFormatError(f"{path} is truncated or corrupted: {e}") from e
+
+
+class VirtualClock:
+    """Clock for Scheduler(clock=...) that only moves when told to"""
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def __call__(self) -> float:
+        return self._now
+
+    def advance_to(self, moment: float):
+        if moment > self._now:
+            self._now = moment
+
+
+@dataclass
+class ReplayStats:
+    """Result of SessionPlayer.replay"""
+    keys: int = 0
+    events: int = 0
+    frames: int = 0
+    recorded_seconds: float = 0.0
+    elapsed: float = 0.0
+    event_mismatches: int = 0
+    # The game exited (SystemExit from a handler) before the end of the log
+    exited: bool = False
+
+    @property
+    def keys_per_second(self) -> float:
+        return self.keys / self.elapsed if self.elapsed else 0.0
+
+
+class SessionPlayer:
+    """
+    Class for replaying a session recording
+
+    Keys are fed to InputController.handle_key at their recorded times. In
+    between, due scheduler timers fire and the frame function runs, like
+    one main loop iteration. With realtime=False the scheduler should run
+    on a VirtualClock: it jumps from deadline to deadline, so animations
+    and delays replay exactly but without waiting.
+
+    Events the game emits during the replay are compared with the recorded
+    ones; with replay_events=True the recorded events are emitted instead,
+    to replay the event load without the game.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: List[SessionEntry] = list(read_session(path))
+
+    @property
+    def duration(self) -> float:
+        return self.entries[-1].time if self.entries else 0.0
+
+    def replay(self,
+               input_controller: Any = None,
+               event_system: Any = None,
+               scheduler: Any = None,
+               frame: Optional[Callable[[], None]] = None,
+               realtime: bool = False,
+               speed: float = 1.0,
+               clock: Optional[VirtualClock] = None,
+               replay_events: bool = False) -> ReplayStats:
+        """
+        Replay the recording
+
+        Args:
+            input_controller: InputController receiving the keys
+            event_system: EventSystem to compare or replay events with
+            scheduler: Scheduler whose timers fire between keys
+            frame: Function run after each step (MainLoop.end_frame)
+            realtime: Wait for the recorded times instead of running at full speed
+            speed: Playback speed factor for realtime replays
+            clock: VirtualClock of the scheduler, advanced to the recorded times
+            replay_events: Emit the recorded events instead of comparing them
+
+        Returns:
+            ReplayStats: Counts and elapsed wall time
+        """
+        stats = ReplayStats(recorded_seconds=self.duration)
+        emitted: List[str] = []
+        compare = event_system is not None and not replay_events
+
+        def record(event_data) -> bool:
+            emitted.append(event_data.event_name)
+            return True
+
+        if compare:
+            event_system.add_global_filter(record)
+
+        start = time.perf_counter()
+        now = scheduler.now if scheduler is not None else time.monotonic
+        base = now()
+
+        def deadline_of(entry: SessionEntry) -> Optional[float]:
+            if realtime:
+                return base + entry.time / speed
+            if clock is not None:
+                return base + entry.time
+            return None
+
+        def wait_until(moment: float):
+            if clock is not None and not realtime:
+                clock.advance_to(moment)
+            else:
+                pause = moment - now()
+                if pause > 0:
+                    time.sleep(pause)
+
+        def step():
+            if scheduler is not None:
+                scheduler.tick()
+            if frame is not None:
+                frame()
+            stats.frames += 1
+
+        try:
+            for entry in self.entries:
+                moment = deadline_of(entry)
+                if moment is not None:
+                    # Timers due before this entry fire first, in order
+                    while scheduler is not None:
+                        deadline = scheduler.next_deadline()
+                        if deadline is None or deadline > moment:
+                            break
+                        wait_until(deadline)
+                        step()
+                    wait_until(moment)
+
+                if entry.kind == "key":
+                    if input_controller is not None:
+                        try:
+                            input_controller.handle_key(entry.value)
+                        except SystemExit:
+                            stats.exited = True
+                            break
+                    stats.keys += 1
+                    step()
+                elif replay_events and event_system is not None:
+                    event_system.emit(entry.value)
+                    stats.events += 1
+                else:
+                    stats.events += 1
+        finally:
+            stats.elapsed = time.perf_counter() - start
+            if compare:
+                event_system.remove_global_filter(record)
+
+        if compare:
+            recorded = [entry.value for entry in self.entries if entry.kind == "event"]
+            stats.event_mismatches = sum(1 for a, b in zip(recorded, emitted) if a != b)
+            stats.event_mismatches += abs(len(recorded) - len(emitted))
+        return stats
+
+
+def main():
+    import argparse
+    from collections import Counter
+
+    parser = argparse.ArgumentParser(description="Inspect a session recording")
+    parser.add_argument("path")
+    args = parser.parse_args()
+
+    entries = list(read_session(args.path))
+    keys = [entry for entry in entries if entry.kind == "key"]
+    events = Counter(entry.value for entry in entries if entry.kind == "event")
+    duration = entries[-1].time if entries else 0.0
+    print(f"{args.path}: {duration:.1f} s, {len(keys)} keys, {sum(events.values())} events")
+    for name, count in events.most_common(20):
+        print(f"  {count:>8}  {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ from typing import List, TYPE_CHECKING
 
 from controller.LibController import LibController
 from controller.AudioController import AudioController
+from lib.CursesBackend import CursesBackend
 
 if TYPE_CHECKING:
     from lib.widgets.BaseActiveWidget import BaseActiveWidget
@@ -51,7 +52,7 @@ class TabControl:
         Enables mouse support and initializes tab navigation
         """
 
-        curses.mousemask(1)
+        CursesBackend.get_instance().mousemask(1)
 
         if self._widgets:  # Проверяем, есть ли виджеты
             for i in self._widgets:
@@ -128,7 +129,7 @@ class TabControl:
         self._input_controller.remove_input_event(self.tab_input_event)
         self._input_controller.remove_input_event(self.btab_input_event)
 
-        curses.mousemask(0)
+        CursesBackend.get_instance().mousemask(0)
 
     def _update_tab_control(self):
         """
@@ -0,0 +1,134 @@
+from typing import Dict, Iterator, List, Optional, Set
+
+# Topics are dotted names like "combat.hit" or "ui.menu.open"
+SEPARATOR = "."
+# Matches exactly one segment
+SINGLE = "*"
+# Matches any number of segments, none included
+MULTI = "**"
+
+
+class _Node:
+    __slots__ = ("children", "pattern")
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.pattern: Optional[str] = None
+
+
+class TopicTrie:
+    """
+    Class for matching dotted topics against wildcard patterns
+
+    Patterns are stored segment by segment, so matching a topic only walks
+    the branches that can still match instead of testing every pattern:
+    "combat.*" matches "combat.hit", "ui.**" matches "ui", "ui.menu" and
+    "ui.menu.open".
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._count = 0
+
+    @staticmethod
+    def is_pattern(topic: str) -> bool:
+        """Check if a topic contains wildcard segments"""
+        return any(segment in (SINGLE, MULTI) for segment in topic.split(SEPARATOR))
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, pattern: str) -> bool:
+        node = self._find(pattern)
+        return node is not None and node.pattern is not None
+
+    def __iter__(self) -> Iterator[str]:
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.pattern is not None:
+                yield node.pattern
+            stack.extend(node.children.values())
+
+    def _find(self, pattern: str) -> Optional[_Node]:
+        node = self._root
+        for segment in pattern.split(SEPARATOR):
+            node = node.children.get(segment)
+            if node is None:
+                return None
+        return node
+
+    def add(self, pattern: str) -> bool:
+        """Add a pattern, returns False if it was already there"""
+        node = self._root
+        for segment in pattern.split(SEPARATOR):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        if node.pattern is not None:
+            return False
+        node.pattern = pattern
+        self._count += 1
+        return True
+
+    def remove(self, pattern: str) -> bool:
+        """Remove a pattern and the branches left empty, returns False if it wasn't there"""
+        path = [self._root]
+        segments = pattern.split(SEPARATOR)
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return False
+            path.append(node)
+        if path[-1].pattern is None:
+            return False
+        path[-1].pattern = None
+        self._count -= 1
+
+        # Drop the nodes that no longer lead to a pattern
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.pattern is not None or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+        return True
+
+    def clear(self):
+        self._root = _Node()
+        self._count = 0
+
+    def match(self, topic: str) -> Set[str]:
+        """
+        Find the patterns matching a topic
+
+        Args:
+            topic: Concrete dotted name
+
+        Returns:
+            Set[str]: Matching patterns
+        """
+        found: Set[str] = set()
+        if self._count:
+            self._match(self._root, topic.split(SEPARATOR), 0, found)
+        return found
+
+    def _match(self, node: _Node, segments: List[str], index: int, found: Set[str]):
+        children = node.children
+        multi = children.get(MULTI)
+        if multi is not None:
+            # "**" swallows any number of the remaining segments
+            for rest in range(index, len(segments) + 1):
+                self._match(multi, segments, rest, found)
+
+        if index == len(segments):
+            if node.pattern is not None:
+                found.add(node.pattern)
+            return
+
+        child = children.get(segments[index])
+        if child is not None:
+            self._match(child, segments, index + 1, found)
+        single = children.get(SINGLE)
+        if single is not None:
+            self._match(single, segments, index + 1, found)
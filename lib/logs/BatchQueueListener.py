@@ -0,0 +1,61 @@
+import logging.handlers
+import queue
+import threading
+import time
+from typing import Optional
+
+# Records written per batch before the writer flushes the file
+BATCH_SIZE = 1024
+# Pause of the writer after a batch, lets records pile up instead of waking
+# the thread (and taking the GIL from the game) for every single one
+FLUSH_INTERVAL = 0.05
+
+
+class BatchQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener writing records in batches on a background thread
+
+    Waits for a record, then takes whatever else is already queued (up to
+    BATCH_SIZE), hands the batch to the handlers, flushes them once and
+    pauses for FLUSH_INTERVAL. stop() drains the queue before the thread
+    exits, flush() waits for the records queued so far with the thread
+    left running.
+    """
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the records queued before the call are written
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        done = threading.Event()
+        self.queue.put(done)
+        return done.wait(timeout)
+
+    def _monitor(self):
+        q = self.queue
+        sentinel = self._sentinel
+        running = True
+        while running:
+            batch = [q.get()]
+            while len(batch) < BATCH_SIZE:
+                try:
+                    batch.append(q.get_nowait())
+                except queue.Empty:
+                    break
+
+            flushed = []
+            for record in batch:
+                if record is sentinel:
+                    running = False
+                elif type(record) is threading.Event:
+                    # Put by flush(), set once the records before it are on disk
+                    flushed.append(record)
+                else:
+                    self.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+            for done in flushed:
+                done.set()
+            if running and len(batch) < BATCH_SIZE:
+                time.sleep(FLUSH_INTERVAL)
@@ -0,0 +1,170 @@
+import gzip
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+from typing import Callable, Optional
+
+from lib.LogIndex import INDEX_SUFFIX, META_SUFFIX
+
+# Only the newest BACKUP_COUNT compressed logs are kept
+BACKUP_COUNT = 10
+# Uncompressed logs of earlier launches untouched for this long are
+# compressed, if no running process marks them as its own
+STALE_AFTER = 60
+# Marker next to an open log holding the pid of the process writing it
+PID_SUFFIX = ".pid"
+LOG_PREFIX = "LOG__"
+
+
+def _process_alive(pid: int) -> bool:
+    """Check if a process exists, without signalling it"""
+    if pid == os.getpid():
+        return True
+    if sys.platform.startswith('win'):
+        # os.kill would terminate the process on Windows
+        import ctypes
+        SYNCHRONIZE, WAIT_TIMEOUT = 0x00100000, 0x00000102
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return False
+        try:
+            return kernel32.WaitForSingleObject(handle, 0) == WAIT_TIMEOUT
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+class LogArchiver:
+    """
+    Background thread compressing and deleting old log files
+
+    Compression writes LOG__...log.gz.part and renames it when complete, so
+    a file interrupted by the exit is redone at the next prune. Startup only
+    queues a prune; the game thread never lists or touches old files.
+    Logs marked by a running process (see RotatingBatchFileHandler) are
+    skipped. Failures go to on_error, never to the terminal curses owns.
+    """
+    def __init__(self, log_folder: str, backup_count: int = BACKUP_COUNT,
+                 on_error: Optional[Callable[[str], None]] = None):
+        self.log_folder = log_folder
+        self.backup_count = backup_count
+        self.on_error = on_error
+        self.errors = 0
+        self._jobs = queue.SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _submit(self, job, *args):
+        self._jobs.put((job, args))
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="LogArchiver", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            job, args = self._jobs.get()
+            try:
+                job(*args)
+            except OSError as e:
+                self._report(e)
+
+    def _report(self, error: OSError):
+        self.errors += 1
+        if self.on_error is not None:
+            try:
+                self.on_error(f"Log archiver: {error}")
+            except Exception:
+                pass
+
+    def compress(self, path: str):
+        self._submit(self._compress, path)
+
+    def prune(self, extension: str = ".log", exclude: str = None):
+        """Compress stale logs with the extension and delete all but the newest backup_count"""
+        self._submit(self._prune, extension, exclude)
+
+    def _compress(self, path: str):
+        if not os.path.exists(path + ".gz"):
+            part = path + ".gz.part"
+            with open(path, "rb") as src, gzip.open(part, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(part, path + ".gz")
+        # With the archive already there (an earlier remove failed) only the
+        # original is left to delete
+        os.remove(path)
+        # A viewer index only fits the uncompressed file
+        for suffix in (INDEX_SUFFIX, META_SUFFIX):
+            try:
+                os.remove(path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def _in_use(self, path: str) -> bool:
+        """Check if a running process marked the log as open, drop markers of dead ones"""
+        marker = path + PID_SUFFIX
+        try:
+            with open(marker) as f:
+                pid = int(f.read().strip() or 0)
+        except FileNotFoundError:
+            return False
+        except (OSError, ValueError):
+            # Being written right now
+            return True
+        if pid and _process_alive(pid):
+            return True
+        os.remove(marker)
+        return False
+
+    def _prune(self, extension: str = ".log", exclude: str = None):
+        now = time.time()
+        archives = {}
+        with os.scandir(self.log_folder) as entries:
+            entries = list(entries)
+        for entry in entries:
+            if not entry.name.startswith(LOG_PREFIX) or os.path.abspath(entry.path) == exclude:
+                continue
+            try:
+                if entry.name.endswith(".gz.part"):
+                    # Another process may still be compressing it
+                    if now - entry.stat().st_mtime >= STALE_AFTER:
+                        os.remove(entry.path)
+                elif entry.name.endswith(extension):
+                    # Left by an earlier launch, unless a running one still writes it
+                    modified = entry.stat().st_mtime
+                    if now - modified >= STALE_AFTER and not self._in_use(entry.path):
+                        self._compress(entry.path)
+                        archives[entry.path + ".gz"] = modified
+                elif entry.name.endswith(extension + ".gz"):
+                    archives.setdefault(entry.path, entry.stat().st_mtime)
+                elif entry.name.endswith(extension + PID_SUFFIX):
+                    # Marker whose log is gone, dropped once its process ended
+                    log = entry.path[:-len(PID_SUFFIX)]
+                    if not os.path.exists(log):
+                        self._in_use(log)
+            except FileNotFoundError:
+                # Handled by another process meanwhile
+                pass
+            except OSError as e:
+                self._report(e)
+
+        newest = sorted(archives, key=archives.get, reverse=True)
+        for path in newest[self.backup_count:]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                self._report(e)
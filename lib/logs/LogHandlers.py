@@ -0,0 +1,166 @@
+import collections
+import datetime
+import json
+import logging
+import logging.handlers
+import os
+import time
+
+from lib.logs.LogArchiver import LOG_PREFIX, PID_SUFFIX, LogArchiver
+
+# The log file is rotated when it grows past MAX_BYTES or is older than
+# ROTATE_INTERVAL seconds; rotated files go to a LogArchiver
+MAX_BYTES = 10 * 1024 * 1024
+ROTATE_INTERVAL = 24 * 60 * 60
+MEMORY_CAPACITY = 10000
+
+
+class BatchFileHandler(logging.FileHandler):
+    """
+    FileHandler that leaves flushing to its caller
+
+    StreamHandler flushes after every record; the log writer thread
+    flushes once per batch instead.
+    """
+    def emit(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    Formats a record as one JSON object per line for the structured log
+
+    Keys: time (epoch seconds), level, module (caller name), message, the
+    fields passed to the log call and exception for error records. See
+    lib.LogIndex for reading these files.
+    """
+    def format(self, record):
+        entry = {
+            "time": record.created,
+            "level": record.levelname,
+            "module": getattr(record, "caller", record.name),
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            for key, value in fields.items():
+                entry.setdefault(key, value)
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RotatingBatchFileHandler(BatchFileHandler):
+    """
+    BatchFileHandler starting a new file by size or age
+
+    The size is counted from the written text instead of asking the file,
+    so it is exact only for ASCII. A rotated file is handed to the archiver
+    and the next one is named after the time of the rotation. While a file
+    is open, <file>.pid tells the archivers of other game and engine
+    processes to leave it alone.
+    """
+    def __init__(self, log_folder: str, archiver: LogArchiver, max_bytes: int = MAX_BYTES,
+                 interval: float = ROTATE_INTERVAL, encoding: str = 'utf-8', extension: str = ".log"):
+        self.log_folder = log_folder
+        self.extension = extension
+        self.archiver = archiver
+        self.max_bytes = max_bytes
+        self.interval = interval
+        self._rotations = 0
+        self._size = 0
+        self._rollover_at = time.time() + interval if interval else None
+        super().__init__(self._next_path(), encoding=encoding)
+        self._mark()
+
+    def _mark(self):
+        try:
+            with open(self.baseFilename + PID_SUFFIX, "w") as f:
+                f.write(str(os.getpid()))
+        except OSError:
+            pass
+
+    def _unmark(self):
+        try:
+            os.remove(self.baseFilename + PID_SUFFIX)
+        except OSError:
+            pass
+
+    def close(self):
+        super().close()
+        self._unmark()
+
+    def _next_path(self) -> str:
+        current_time = datetime.datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        # Several rotations within a second get a counter
+        suffix = str(self._rotations) if self._rotations else ""
+        return os.path.join(self.log_folder, f"{LOG_PREFIX}{current_time}__{suffix}{self.extension}")
+
+    def emit(self, record):
+        if self._should_rollover(record):
+            self.do_rollover()
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            text = self.format(record) + self.terminator
+            self.stream.write(text)
+            self._size += len(text)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _should_rollover(self, record) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return self._rollover_at is not None and record.created >= self._rollover_at
+
+    def do_rollover(self):
+        """Close the current file, queue it for compression and start the next one"""
+        if self.stream is not None:
+            self.stream.flush()
+            self.stream.close()
+            self.stream = None
+        self._unmark()
+        self.archiver.compress(self.baseFilename)
+        self._rotations += 1
+        self._size = 0
+        self.baseFilename = os.path.abspath(self._next_path())
+        self._mark()
+        if self.interval:
+            self._rollover_at = time.time() + self.interval
+        self.archiver.prune(self.extension, exclude=self.baseFilename)
+
+
+class MemoryLogHandler(logging.Handler):
+    """Handler keeping the last capacity records in memory"""
+    def __init__(self, capacity: int = MEMORY_CAPACITY):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def lines(self) -> list:
+        """Kept records formatted like the text log"""
+        return [self.format(record) for record in list(self.records)]
+
+
+class RecordQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler passing records as they are
+
+    The stock handler formats and copies every record on the calling thread
+    so it could be pickled; the writer is a thread of this process, so the
+    formatting is left to it. Arguments are formatted when written, a
+    mutable argument changed right after the call may show its new value.
+    """
+    def prepare(self, record):
+        return record
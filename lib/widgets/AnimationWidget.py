@@ -1,5 +1,4 @@
 from lib.widgets.BasePassiveWidget import BasePassiveWidget
-import time
 from controller.AudioController import AudioController
 
 class AnimationWidget(BasePassiveWidget):
@@ -15,8 +14,11 @@ class AnimationWidget(BasePassiveWidget):
         self.draw()
 
     def draw(self):
+        self._animate(self._draw_frames(), animated=self._delay > 0)
+
+    def _draw_frames(self):
         if self._clear:
-            self._win.clear()
+            self._clear_screen()
 
         table_x, table_y = self._calculate_position()
         current_y = table_y
@@ -26,7 +28,7 @@ class AnimationWidget(BasePassiveWidget):
             if self._audio:
                 AudioController.get_instance().play_random_print_sound()
             self._win.refresh()
-            time.sleep(self._delay)
+            yield self._delay
             current_y += 1
 
         self._win.refresh() 
\ No newline at end of file
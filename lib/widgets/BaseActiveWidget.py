@@ -29,6 +29,8 @@ class BaseActiveWidget(BasePassiveWidget):
         return self._pause
 
     def stop(self):
+        if self._animation is not None:
+            self._animation.cancel()
         try:
             self._tab_control.remove_widget(self)
             del self
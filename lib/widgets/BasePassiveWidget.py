@@ -1,4 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Generator, Optional
+
+from lib.Scheduler import Scheduler, Task
+from lib.CursesBackend import CursesBackend
 
 class BasePassiveWidget(ABC):
     def __init__(self, parent, clear: bool = True, tableAlignment: str = "c", width: int = 22, height: int = 3, x: int = None, y: int = None, Xdo: str = "=", Ydo: str = "="):
@@ -13,6 +17,9 @@ class BasePassiveWidget(ABC):
         self._x, self._y = x, y
         self._Xdo, self._Ydo = Xdo, Ydo
 
+        self._animation: Optional[Task] = None
+        self._backend = CursesBackend.get_instance()
+
     @abstractmethod
     def draw(self):
         """
@@ -21,6 +28,39 @@ class BasePassiveWidget(ABC):
         """
         pass
 
+    @property
+    def animation(self) -> Optional[Task]:
+        """
+        Get the task running the widget animation, None if the widget never animated
+        """
+        return self._animation
+
+    def _animate(self, steps: Generator, animated: bool = True) -> Task:
+        """
+        Run a drawing generator on the scheduler
+
+        The generator yields the delay before its next step. A previous
+        animation of the widget is cancelled. When not animated, all steps run
+        right away.
+        """
+        if self._animation is not None:
+            self._animation.cancel()
+        self._animation = Scheduler.get_instance().spawn(steps)
+        self._parent.track_animation(self._animation)
+        if not animated:
+            self._animation.finish()
+        return self._animation
+
+    def _clear_screen(self):
+        """
+        Clear the parent window for this widget
+
+        Animations of the widgets on the previous screen are cancelled so
+        they don't keep drawing over this one.
+        """
+        self._parent.cancel_animations(keep=self._animation)
+        self._win.clear()
+
     def _calculate_position(self) -> tuple[int, int]:
         max_y, max_x = self._win.getmaxyx()
         absolute_center_x = (max_x - self._width) // 2
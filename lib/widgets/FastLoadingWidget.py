@@ -1,5 +1,4 @@
 from lib.widgets.BasePassiveWidget import BasePassiveWidget
-import time
 import random as r
 
 class FastLoadingWidget(BasePassiveWidget):
@@ -10,6 +9,9 @@ class FastLoadingWidget(BasePassiveWidget):
         self.draw()
 
     def draw(self):
+        self._animate(self._draw_progress())
+
+    def _draw_progress(self):
         if self._clear:
             self._win.clear()
 
@@ -33,7 +35,7 @@ class FastLoadingWidget(BasePassiveWidget):
             procent += r.randint(1, 3)
             procent = min(procent, 100)
 
-            time.sleep(self._speed)
+            yield self._speed
 
         progress_display = "Xx________100%________xX"
         bar = "=" * bar_length
@@ -41,5 +43,5 @@ class FastLoadingWidget(BasePassiveWidget):
         self._win.addstr(table_y + 1, table_x + 2, bar)
         self._win.refresh()
 
-        time.sleep(0.5)
+        yield 0.5
         self._win.clear() 
\ No newline at end of file
@@ -1,5 +1,4 @@
 from lib.widgets.BasePassiveWidget import BasePassiveWidget
-import time
 import random as r
 
 class LoadingAnimationWidget(BasePassiveWidget):
@@ -28,6 +27,9 @@ class LoadingAnimationWidget(BasePassiveWidget):
         self.draw()
 
     def draw(self):
+        self._animate(self._draw_imports())
+
+    def _draw_imports(self):
         animation_symbols = ['|', '/', '-', '\\']
         max_length = max(len(module) for module in self._imports)
         height, width = self._win.getmaxyx()
@@ -42,13 +44,13 @@ class LoadingAnimationWidget(BasePassiveWidget):
                 if max_length + 4 < width - 1:
                     self._win.addstr(y, max_length + 4, animation_symbols[i % len(animation_symbols)])
                 self._win.refresh()
-                time.sleep(0.1)
+                yield 0.1
                 if max_length + 4 < width - 1:
                     self._win.addstr(y, max_length + 4, ' ')
             if max_length + 4 < width - 1:
                 self._win.addstr(y, max_length + 4, "DONE |")
             self._win.refresh()
-            time.sleep(r.uniform(0.02, 0.09))
+            yield r.uniform(0.02, 0.09)
             y += 1
 
         self._win.refresh() 
\ No newline at end of file
@@ -1,6 +1,5 @@
 import curses
 from typing import Dict, List, Callable
-import time as t
 
 from lib.widgets.BaseActiveWidget import BaseActiveWidget
 from controller.AudioController import AudioController
@@ -25,6 +24,7 @@ class MenuWidget(BaseActiveWidget):
 
         self.option = 0
         self.is_first_display = True
+        self._visible_rows = None
         self.win = parent.win
         self.menu_win = None
         self.info_win = None
@@ -45,16 +45,16 @@ class MenuWidget(BaseActiveWidget):
 
     def _init_windows(self):
         if self._clear:
-            self._win.clear()
+            self._clear_screen()
             self._win.refresh()
 
         table_x, table_y = self._calculate_position()
 
-        self.menu_win = curses.newwin(len(self.options) + 5, 30, table_y, table_x)
+        self.menu_win = self._parent.screen.newwin(len(self.options) + 5, 30, table_y, table_x)
 
         if self.tips:
             self.info_x, self.info_y = table_x + 35, table_y
-            self.info_win = curses.newwin(len(self.options) + 5, self.info_width, self.info_y, self.info_x)
+            self.info_win = self._parent.screen.newwin(len(self.options) + 5, self.info_width, self.info_y, self.info_x)
 
     def _init_colors(self):
         icol = {1: 'red', 2: 'green', 3: 'yellow', 4: 'blue',
@@ -62,10 +62,10 @@ class MenuWidget(BaseActiveWidget):
         col = {v: k for k, v in icol.items()}
         bc = curses.COLOR_BLACK
 
-        curses.start_color()
-        curses.init_pair(1, curses.COLOR_WHITE, bc)
-        curses.init_pair(2, col[self.color], bc)
-        curses.init_pair(3, curses.COLOR_WHITE, bc)
+        self._backend.start_color()
+        self._backend.init_pair(1, curses.COLOR_WHITE, bc)
+        self._backend.init_pair(2, col[self.color], bc)
+        self._backend.init_pair(3, curses.COLOR_WHITE, bc)
 
     def _register_input_handlers(self):
         self._input_event_up = LibController.get_instance().input_controller.add_input_event(curses.KEY_UP, self._option_up)
@@ -85,23 +85,42 @@ class MenuWidget(BaseActiveWidget):
     def _update_screen(self):
         if self.menu_win:
             self.menu_win.refresh()
-        if self.tips and self.info_win:
+        if self.tips and self.info_win and self._visible_rows is None:
             self.info_win.refresh()
 
     def _update_menu(self):
         if not self.menu_win:
             return
-            
+
+        if self.is_first_display:
+            self.is_first_display = False
+            self._animate(self._reveal_table())
+            return
+
+        self._render_menu()
+
+    def _render_menu(self):
         self.menu_win.erase()
         if self.tips:
             self._update_info_window()
         self._create_table()
         self._update_screen()
-        self.is_first_display = False
+
+    def _reveal_table(self):
+        """Type the table out line by line, input redraws it meanwhile"""
+        try:
+            for rows in range(1, len(self.options) + 4):
+                yield Config.get_instance().delayOutput
+                self._visible_rows = rows
+                self._render_menu()
+                AudioController.get_instance().play_random_print_sound()
+        finally:
+            self._visible_rows = None
+        self._render_menu()
 
     def _update_info_window(self):
         self.info_win.erase()
-        box_color = curses.color_pair(3) if self._pause else curses.color_pair(1)
+        box_color = self._backend.color_pair(3) if self._pause else self._backend.color_pair(1)
         self.info_win.attron(box_color)
         self.info_win.box()
         self.info_win.attroff(box_color)
@@ -109,53 +128,39 @@ class MenuWidget(BaseActiveWidget):
 
     def _display_info(self):
         color = 3 if self._pause else 1
-        self.info_win.attron(curses.color_pair(color))
+        self.info_win.attron(self._backend.color_pair(color))
         info_lines = self.additional_info[self.option].split('\n')
         for i, line in enumerate(info_lines, start=1):
             self.info_win.addstr(i, 1, line)
-        self.info_win.attroff(curses.color_pair(color))
+        self.info_win.attroff(self._backend.color_pair(color))
 
     def _create_table(self):
         main_color = 3 if self._pause else 1
         selected_color = 3 if self._pause else 2
 
-        self.menu_win.addstr("Xx" + "_" * (self._width + 2) + "xX\n", curses.color_pair(main_color))
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.menu_win.refresh()
-
-        self.menu_win.addstr("|| {:^{width}} ||\n".format(self.title, width=self._width),
-                            curses.color_pair(main_color))
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.menu_win.refresh()
-
-        self.menu_win.addstr("||" + "-" * (self._width + 2) + "||\n", curses.color_pair(main_color))
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.menu_win.refresh()
+        lines = [
+            [("Xx" + "_" * (self._width + 2) + "xX\n", main_color)],
+            [("|| {:^{width}} ||\n".format(self.title, width=self._width), main_color)],
+            [("||" + "-" * (self._width + 2) + "||\n", main_color)],
+        ]
 
         for index, option in enumerate(self.options):
             if index == self.option and not self._pause:
                 option_str = "> {:<{width}}".format(option, width=self._width - 2)
-                self.menu_win.addstr("|| ", curses.color_pair(main_color))
-                self.menu_win.addstr(option_str, curses.color_pair(selected_color))
-                self.menu_win.addstr(" ||\n", curses.color_pair(main_color))
+                option_color = selected_color
             else:
                 option_str = "  {:<{width}}".format(option, width=self._width - 2)
-                self.menu_win.addstr("|| ", curses.color_pair(main_color))
-                self.menu_win.addstr(option_str, curses.color_pair(main_color))
-                self.menu_win.addstr(" ||\n", curses.color_pair(main_color))
-            
-            if self.is_first_display:
-                t.sleep(Config.get_instance().delayOutput)
-                AudioController.get_instance().play_random_print_sound()
-                self.menu_win.refresh()
+                option_color = main_color
+            lines.append([("|| ", main_color), (option_str, option_color), (" ||\n", main_color)])
+
+        lines.append([("Xx" + "¯" * (self._width + 2) + "xX\n", main_color)])
+
+        if self._visible_rows is not None:
+            lines = lines[:self._visible_rows]
 
-        self.menu_win.addstr("Xx" + "¯" * (self._width + 2) + "xX\n", curses.color_pair(main_color))
+        for line in lines:
+            for text, color in line:
+                self.menu_win.addstr(text, self._backend.color_pair(color))
 
     def _option_up(self):
         if not self._pause:
@@ -183,7 +188,7 @@ class MenuWidget(BaseActiveWidget):
             eid.set_pause(pause)
 
         if not pause:
-            curses.curs_set(0)
+            self._backend.curs_set(0)
         self._update_menu()
 
     def stop(self):
@@ -1,7 +1,9 @@
 import curses
+from itertools import groupby
 
 from Assets.data.LevelMap import Levels
 from lib.widgets.BaseActiveWidget import BaseActiveWidget
+from lib.PassabilityGrid import PassabilityGrid
 from lib.Logger import logger
 from controller.LibController import LibController
 
@@ -15,7 +17,7 @@ class PlayerMapWidget(BaseActiveWidget):
             raise ValueError("level_map parameter is required and cannot be None")
         
         self.level_map = level_map
-        if not hasattr(self.level_map, 'level_map') or not self.level_map.level_map:
+        if not self.level_map.width or not self.level_map.height:
             raise ValueError("Map data cannot be empty")
 
         self._input_events = []
@@ -26,14 +28,23 @@ class PlayerMapWidget(BaseActiveWidget):
         self.player_y = getattr(self.level_map, 'PlayerSpawnY', 0)
 
         # Вычисляем размеры карты
-        self.map_width = len(self.level_map.level_map[0]) if self.level_map.level_map else 0
-        self.map_height = len(self.level_map.level_map)
+        self.map_width = self.level_map.width
+        self.map_height = self.level_map.height
 
-        # Устанавливаем размеры виджета (добавляем +2 для рамки)
+        # Проходимость считается один раз на уровень, для ChunkedLevel - по чанкам
+        self.passability = PassabilityGrid.for_level(self.level_map)
+
+        # Устанавливаем размеры виджета (добавляем +2 для рамки).
+        # Карта больше экрана показывается через камеру, следующую за игроком
+        max_y, max_x = parent.win.getmaxyx()
         if width is None:
-            width = self.map_width + 2
+            width = min(self.map_width + 2, max_x)
         if height is None:
-            height = self.map_height + 2
+            height = min(self.map_height + 2, max_y)
+
+        # Левый верхний угол видимой части карты
+        self.camera_x = 0
+        self.camera_y = 0
 
         # Вызываем конструктор родительского класса
         super().__init__(parent, clear, tableAlignment, width, height, x, y, Xdo, Ydo)
@@ -47,17 +58,16 @@ class PlayerMapWidget(BaseActiveWidget):
             # Если начальная позиция недоступна, ищем первое свободное место
             self._find_valid_spawn_position()
         
+        self._follow_player()
         self.draw()
     
     def _find_valid_spawn_position(self):
         """Находит первую доступную позицию для спавна игрока"""
-        for y in range(self.map_height):
-            for x in range(self.map_width):
-                if self._can_move_to(x, y):
-                    self.player_x = x
-                    self.player_y = y
-                    logger.info(f"Player spawn position set to ({x}, {y})")
-                    return
+        position = self.passability.find_passable()
+        if position is not None:
+            self.player_x, self.player_y = position
+            logger.info(f"Player spawn position set to {position}")
+            return
         
         # Если не найдено свободного места, устанавливаем в (0, 0)
         self.player_x = 0
@@ -67,12 +77,12 @@ class PlayerMapWidget(BaseActiveWidget):
     def _init_colors(self):
         """Инициализация цветовых пар"""
         try:
-            curses.start_color()
-            curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)    # Обычный текст
-            curses.init_pair(2, curses.COLOR_RED, curses.COLOR_BLACK)      # Стены/препятствия
-            curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)   # Игрок (активный)
-            curses.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)     # Игрок (на паузе)
-            curses.init_pair(5, curses.COLOR_GREEN, curses.COLOR_BLACK)    # Специальные объекты
+            self._backend.start_color()
+            self._backend.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLACK)    # Обычный текст
+            self._backend.init_pair(2, curses.COLOR_RED, curses.COLOR_BLACK)      # Стены/препятствия
+            self._backend.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK)   # Игрок (активный)
+            self._backend.init_pair(4, curses.COLOR_BLUE, curses.COLOR_BLACK)     # Игрок (на паузе)
+            self._backend.init_pair(5, curses.COLOR_GREEN, curses.COLOR_BLACK)    # Специальные объекты
         except curses.error as e:
             logger.warning(f"Color initialization failed: {e}")
     
@@ -126,21 +136,8 @@ class PlayerMapWidget(BaseActiveWidget):
     
     def _can_move_to(self, x: int, y: int) -> bool:
         """Проверяет, можно ли переместиться в указанную позицию"""
-        # Проверяем границы карты
-        if y < 0 or y >= self.map_height or x < 0 or x >= self.map_width:
-            return False
-        
-        # Проверяем, что карта существует и имеет нужную строку
-        if not self.level_map.level_map or y >= len(self.level_map.level_map):
-            return False
-            
-        # Проверяем, что строка имеет нужную длину
-        if x >= len(self.level_map.level_map[y]):
-            return False
-        
-        # Проверяем, что это не стена (символ '*')
-        cell = self.level_map.level_map[y][x]
-        return cell != '*' and cell != '#'  # Добавляем проверку на '#' как альтернативный символ стены
+        # Границы карты, короткие строки и стены ('*', '#') учтены в сетке
+        return self.passability.is_passable(x, y)
     
     def _move_player(self, dx: int, dy: int):
         """Универсальный метод движения игрока"""
@@ -151,10 +148,103 @@ class PlayerMapWidget(BaseActiveWidget):
         new_y = self.player_y + dy
         
         if self._can_move_to(new_x, new_y):
+            old_position = (self.player_x, self.player_y)
             self.player_x = new_x
             self.player_y = new_y
+            self._repaint_after_move(old_position)
+            logger.debug("Player moved to (%s, %s)", self.player_x, self.player_y)
+
+    def _cells_affected_by_move(self, old_position: tuple[int, int],
+                                new_position: tuple[int, int]) -> set[tuple[int, int]]:
+        """
+        Map cells whose look changes when the player moves
+
+        Only the cell left and the cell entered. Override to add neighbours
+        when lighting or fog of war depend on the player position.
+        """
+        return {old_position, new_position}
+
+    def _repaint_after_move(self, old_position: tuple[int, int]):
+        """Scroll the camera if needed, then repaint only the affected cells"""
+        camera = (self.camera_x, self.camera_y)
+        if self._follow_player() and not self._scroll_view(camera):
             self.draw()
-            logger.debug(f"Player moved to ({self.player_x}, {self.player_y})")
+        else:
+            self._redraw_cells(self._cells_affected_by_move(old_position, (self.player_x, self.player_y)))
+
+    def _scroll_view(self, old_camera: tuple[int, int]) -> bool:
+        """
+        Shift the drawn viewport after the camera moved and paint the exposed strips
+
+        Returns:
+            bool: False if nothing of the old view stays visible and the whole
+                  viewport has to be drawn
+        """
+        if not self.map_win:
+            return False
+        dx = self.camera_x - old_camera[0]
+        dy = self.camera_y - old_camera[1]
+        view_width, view_height = self.view_width, self.view_height
+        if abs(dx) >= view_width or abs(dy) >= view_height:
+            return False
+
+        self.map_win.shift(-dy, -dx, 1, 1, view_height, view_width)
+        pause_state = getattr(self, '_pause', False)
+        left, top = self.camera_x, self.camera_y
+        right, bottom = left + view_width, top + view_height
+        # Rows that came into view, then the columns on the remaining rows
+        if dy > 0:
+            self._draw_area(left, max(top, bottom - dy), right, bottom, pause_state)
+            bottom -= dy
+        elif dy < 0:
+            self._draw_area(left, top, right, min(bottom, top - dy), pause_state)
+            top -= dy
+        if dx > 0:
+            self._draw_area(max(left, right - dx), top, right, bottom, pause_state)
+        elif dx < 0:
+            self._draw_area(left, top, min(right, left - dx), bottom, pause_state)
+        return True
+
+    @property
+    def view_width(self) -> int:
+        """Number of map columns visible in the widget"""
+        return max(0, self._width - 2)
+
+    @property
+    def view_height(self) -> int:
+        """Number of map rows visible in the widget"""
+        return max(0, self._height - 2)
+
+    def _follow_player(self) -> bool:
+        """
+        Move the camera so the player stays inside the viewport
+
+        Returns:
+            bool: True if the camera moved and the viewport must be scrolled
+        """
+        camera_x = self._scroll_axis(self.camera_x, self.player_x, self.view_width, self.map_width)
+        camera_y = self._scroll_axis(self.camera_y, self.player_y, self.view_height, self.map_height)
+        moved = camera_x != self.camera_x or camera_y != self.camera_y
+        self.camera_x, self.camera_y = camera_x, camera_y
+        return moved
+
+    @staticmethod
+    def _scroll_axis(camera: int, player: int, view: int, size: int) -> int:
+        """
+        Camera position along one axis
+
+        The player moves freely inside the middle half of the viewport. Once
+        they step into the outer quarter the camera recenters on them, so the
+        view scrolls every view // 4 steps rather than on every step. The
+        drawn cells are shifted and only the exposed quarter is drawn, see
+        _scroll_view. The camera stops at the map edges.
+        """
+        if size <= view:
+            return 0
+        margin = view // 4
+        if player < camera + margin or player >= camera + view - margin:
+            camera = player - view // 2
+        return max(0, min(camera, size - view))
 
     # Методы движения (используют универсальный _move_player)
     def _move_up(self):           self._move_player(0, -1)
@@ -183,7 +273,7 @@ class PlayerMapWidget(BaseActiveWidget):
         try:
             # Очищаем родительское окно если нужно
             if hasattr(self, '_clear') and self._clear and hasattr(self, '_win') and self._win:
-                self._win.clear()
+                self._clear_screen()
                 self._win.refresh()
             
             # Вычисляем позицию и создаем окно
@@ -191,8 +281,8 @@ class PlayerMapWidget(BaseActiveWidget):
             
             # Проверяем, что позиция корректна
             if table_x >= 0 and table_y >= 0:
-                self.map_win = curses.newwin(self._height, self._width, table_y, table_x)
-                logger.debug(f"Map window created at ({table_x}, {table_y}) with size {self._width}x{self._height}")
+                self.map_win = self._parent.screen.newwin(self._height, self._width, table_y, table_x)
+                logger.debug("Map window created at (%s, %s) with size %sx%s", table_x, table_y, self._width, self._height)
             else:
                 logger.error(f"Invalid window position: ({table_x}, {table_y})")
                 
@@ -211,7 +301,7 @@ class PlayerMapWidget(BaseActiveWidget):
             
             # Определяем цвет рамки в зависимости от состояния паузы
             pause_state = getattr(self, '_pause', False)
-            border_color = curses.color_pair(4) if pause_state else curses.color_pair(1)
+            border_color = self._backend.color_pair(4) if pause_state else self._backend.color_pair(1)
             
             # Рисуем рамку
             try:
@@ -222,54 +312,107 @@ class PlayerMapWidget(BaseActiveWidget):
                 logger.warning("Failed to draw border")
 
             # Отрисовываем содержимое карты
-            if self.level_map.level_map:
+            if self.map_width and self.map_height:
                 self._draw_map_content(pause_state)
                 
         except Exception as e:
             logger.error(f"Error drawing map content: {e}")
     
     def _draw_map_content(self, pause_state: bool):
-        """Отрисовка содержимого карты"""
-        for y, row in enumerate(self.level_map.level_map):
-            if y >= self.map_height:
-                break
-                
-            for x, cell in enumerate(row):
-                if x >= self.map_width:
-                    break
-                
-                # Определяем что отображать и каким цветом
-                display_char, color_pair = self._get_cell_display(x, y, cell, pause_state)
-                
-                # Отображаем символ (смещение +1 для рамки)
-                try:
-                    screen_y = y + 1
-                    screen_x = x + 1
-                    
-                    if (0 < screen_y < self._height - 1 and 
-                        0 < screen_x < self._width - 1):
-                        self.map_win.addch(screen_y, screen_x, display_char, color_pair)
-                        
-                except curses.error:
-                    # Игнорируем ошибки позиционирования
-                    pass
+        """Отрисовка видимой через камеру части карты"""
+        self._draw_area(self.camera_x, self.camera_y,
+                        self.camera_x + self.view_width, self.camera_y + self.view_height, pause_state)
+
+    def _draw_area(self, left: int, top: int, right: int, bottom: int, pause_state: bool):
+        """Отрисовка видимых клеток карты в прямоугольнике [left, right) x [top, bottom)"""
+        level = self.level_map
+        # Вид клетки зависит только от символа, игрок рисуется поверх
+        styles = {}
+
+        for y in range(top, min(bottom, self.map_height)):
+            # Берем только видимый срез строки, размер карты не влияет на стоимость кадра
+            visible = level.get_row(y, left, right)
+            screen_y = y - self.camera_y + 1
+            screen_x = left - self.camera_x + 1
+
+            # Соседние клетки одного цвета выводятся одной строкой
+            run, run_color, run_start, offset = [], None, 0, 0
+            for cell, group in groupby(visible):
+                count = len(list(group))
+                style = styles.get(cell)
+                if style is None:
+                    style = styles[cell] = self._cell_style(cell, pause_state)
+                display_char, color_pair = style
+                if color_pair != run_color:
+                    self._put_run(screen_y, screen_x + run_start, run, run_color)
+                    run, run_color, run_start = [], color_pair, offset
+                run.append(display_char * count)
+                offset += count
+            self._put_run(screen_y, screen_x + run_start, run, run_color)
+
+            if y == self.player_y and left <= self.player_x < left + len(visible):
+                display_char, color_pair = self._get_cell_display(
+                    self.player_x, y, visible[self.player_x - left], pause_state)
+                self._put_run(screen_y, self.player_x - self.camera_x + 1, [display_char], color_pair)
+
+    def _put_run(self, screen_y: int, screen_x: int, chars: list, color_pair: int):
+        """Вывод клеток одного цвета (смещение +1 для рамки уже учтено)"""
+        if not chars:
+            return
+        try:
+            self.map_win.addstr(screen_y, screen_x, "".join(chars), color_pair)
+        except curses.error:
+            # Игнорируем ошибки позиционирования
+            pass
     
+    def _redraw_cells(self, cells):
+        """Repaint only the given map cells instead of the whole map"""
+        if not self.map_win:
+            self.draw()
+            return
+
+        pause_state = getattr(self, '_pause', False)
+        try:
+            for x, y in cells:
+                if not (0 <= y < self.map_height and 0 <= x < self.map_width):
+                    continue
+                cell = self.level_map.get_tile(x, y)
+                if cell is None:
+                    continue
+
+                screen_y = y - self.camera_y + 1
+                screen_x = x - self.camera_x + 1
+                if (0 < screen_y < self._height - 1 and
+                    0 < screen_x < self._width - 1):
+                    display_char, color_pair = self._get_cell_display(x, y, cell, pause_state)
+                    try:
+                        self.map_win.addch(screen_y, screen_x, display_char, color_pair)
+                    except curses.error:
+                        pass
+            self._update_screen()
+        except Exception as e:
+            logger.error(f"Error redrawing map cells: {e}")
+
     def _get_cell_display(self, x: int, y: int, cell: str, pause_state: bool) -> tuple[str, int]:
         """Определяет символ и цвет для отображения ячейки"""
         # Если это позиция игрока
         if x == self.player_x and y == self.player_y:
             display_char = '@'
-            color_pair = curses.color_pair(4) if pause_state else curses.color_pair(3)
+            color_pair = self._backend.color_pair(4) if pause_state else self._backend.color_pair(3)
+            return display_char, color_pair
+        return self._cell_style(cell, pause_state)
+
+    def _cell_style(self, cell: str, pause_state: bool) -> tuple[str, int]:
+        """Символ и цвет клетки карты без игрока"""
+        display_char = cell
+        if cell in ['*', '#']:  # Стены
+            color_pair = self._backend.color_pair(2)
         else:
-            display_char = cell
-            if cell in ['*', '#']:  # Стены
-                color_pair = curses.color_pair(2)
-            else:
-                color_pair = curses.color_pair(1)
+            color_pair = self._backend.color_pair(1)
+
+        if pause_state:
+            color_pair = self._backend.color_pair(4)
 
-            if pause_state:
-                color_pair = curses.color_pair(4)
-        
         return display_char, color_pair
     
     def _update_screen(self):
@@ -333,15 +476,38 @@ class PlayerMapWidget(BaseActiveWidget):
             bool: True если позиция установлена успешно, False если позиция недоступна
         """
         if self._can_move_to(x, y):
+            old_position = (self.player_x, self.player_y)
             self.player_x = x
             self.player_y = y
-            self.draw()
+            self._repaint_after_move(old_position)
             logger.info(f"Player position set to ({x}, {y})")
             return True
         else:
             logger.warning(f"Cannot move player to position ({x}, {y}) - position not available")
             return False
     
+    def set_level(self, level_map: Levels.BaseLevel):
+        """
+        Switch the widget to another level and redraw it completely
+
+        The widget keeps its window size, a larger level is scrolled by the
+        camera and a smaller one leaves part of the window empty.
+        """
+        if level_map is None or not level_map.width or not level_map.height:
+            raise ValueError("Map data cannot be empty")
+
+        self.level_map = level_map
+        self.map_width = level_map.width
+        self.map_height = level_map.height
+        self.passability = PassabilityGrid.for_level(level_map)
+        self.player_x = getattr(level_map, 'PlayerSpawnX', 0)
+        self.player_y = getattr(level_map, 'PlayerSpawnY', 0)
+        if not self._can_move_to(self.player_x, self.player_y):
+            self._find_valid_spawn_position()
+        self.camera_x = self.camera_y = 0
+        self._follow_player()
+        self.draw()
+
     def get_map_info(self) -> dict:
         """Возвращает информацию о карте"""
         return {
@@ -350,5 +516,9 @@ class PlayerMapWidget(BaseActiveWidget):
             'player_x': self.player_x,
             'player_y': self.player_y,
             'spawn_x': getattr(self.level_map, 'PlayerSpawnX', 0),
-            'spawn_y': getattr(self.level_map, 'PlayerSpawnY', 0)
-        }
\ No newline at end of file
+            'spawn_y': getattr(self.level_map, 'PlayerSpawnY', 0),
+            'camera_x': self.camera_x,
+            'camera_y': self.camera_y,
+            'view_width': self.view_width,
+            'view_height': self.view_height
+        }
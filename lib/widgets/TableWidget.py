@@ -1,6 +1,3 @@
-import curses
-import time as t
-
 from lib.widgets.BasePassiveWidget import BasePassiveWidget
 from lib.Logger import logger
 from controller.AudioController import AudioController
@@ -15,7 +12,7 @@ class TableWidget(BasePassiveWidget):
         self._style = style
         self._separator_positions = separator_positions or []
         self._textAlignment = textAlignment or {0: "l"}
-        self._animation = animation
+        self._animated = animation
 
         super().__init__(parent, clear, tableAlignment, width + 7, len(self._text) + 2, x, y, Xdo, Ydo)
         self._width = width
@@ -25,26 +22,30 @@ class TableWidget(BasePassiveWidget):
 
     def _init_pad(self):
         self.table_x, self.table_y = self._calculate_position()
-        self.table_pad = curses.newpad(self._height + 10, self._width + 20)
+        self.table_pad = self._parent.screen.newpad(self._height + 10, self._width + 20)
 
     def draw(self):
+        self._animate(self._draw_table(), animated=self._animated)
+
+    def _refresh_pad(self):
+        self.table_pad.refresh(0, 0, self.table_y, self.table_x,
+                               self.table_y + self._height + 1,
+                               self.table_x + self._width + 6)
+
+    def _draw_table(self):
         if self._clear:
-            self._win.clear()
+            self._clear_screen()
             self._win.refresh()
 
         if not self.table_pad:
             self._init_pad()
-        self.table_pad.refresh(0, 0, self.table_y, self.table_x,
-                               self.table_y + self._height + 1,
-                               self.table_x + self._width + 6)
+        self._refresh_pad()
 
         self.table_y_pad = 0
-        self._draw_table_header()
-        self._draw_table_content()
-        self._draw_table_footer()
-        self.table_pad.refresh(0, 0, self.table_y, self.table_x,
-                               self.table_y + self._height + 1,
-                               self.table_x + self._width + 6)
+        yield from self._draw_table_header()
+        yield from self._draw_table_content()
+        yield from self._draw_table_footer()
+        self._refresh_pad()
 
     def _draw_table_header(self):
         if self._style == "info":
@@ -52,18 +53,14 @@ class TableWidget(BasePassiveWidget):
         elif self._style == "error":
             self._separator_up_error()
 
-        if self._animation : t.sleep(Config.get_instance().delayOutput)
+        yield Config.get_instance().delayOutput
         AudioController.get_instance().play_random_print_sound()
-        self.table_pad.refresh(0, 0, self.table_y, self.table_x,
-                               self.table_y + self._height + 1,
-                               self.table_x + self._width + 6)
+        self._refresh_pad()
 
     def _draw_table_content(self):
         for index, row in enumerate(self._text):
-            if self._animation : t.sleep(Config.get_instance().delayOutput)
-            self.table_pad.refresh(0, 0, self.table_y, self.table_x,
-                                   self.table_y + self._height + 1,
-                                   self.table_x + self._width + 6)
+            yield Config.get_instance().delayOutput
+            self._refresh_pad()
 
             if len(row) > self._width:
                 self._draw_long_row(row)
@@ -74,16 +71,14 @@ class TableWidget(BasePassiveWidget):
                 self._draw_separator()
 
     def _draw_table_footer(self):
-        if self._animation : t.sleep(Config.get_instance().delayOutput)
+        yield Config.get_instance().delayOutput
         AudioController.get_instance().play_random_print_sound()
 
         if self._style == "info":
             self._separator_down_info()
         elif self._style == "error":
             self._separator_down_error()
-        self.table_pad.refresh(0, 0, self.table_y, self.table_x,
-                               self.table_y + self._height + 1,
-                               self.table_x + self._width + 6)
+        self._refresh_pad()
 
     def _draw_long_row(self, row):
         words = row.split()
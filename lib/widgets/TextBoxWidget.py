@@ -1,5 +1,4 @@
 import curses
-import time as t
 from typing import Callable, List
 
 from lib.widgets.BaseActiveWidget import BaseActiveWidget
@@ -21,6 +20,7 @@ class TextBoxWidget(BaseActiveWidget):
         self._input_type = input_type
         self._function = function
         self.is_first_display = True
+        self._visible_rows = None
         self.text_box_win = None
 
         self._input_events = []
@@ -35,12 +35,12 @@ class TextBoxWidget(BaseActiveWidget):
 
     def _init_window(self):
         if self._clear:
-            self._win.clear()
+            self._clear_screen()
             self._win.refresh()
 
         table_x, table_y = self._calculate_position()
 
-        self.text_box_win = curses.newwin(4, self._width + 7, table_y, table_x)
+        self.text_box_win = self._parent.screen.newwin(4, self._width + 7, table_y, table_x)
 
         self._cursor_x = table_x + 3
         self._cursor_y = table_y + 1
@@ -65,31 +65,44 @@ class TextBoxWidget(BaseActiveWidget):
         if not self.text_box_win:
             return
 
+        if self.is_first_display:
+            self.is_first_display = False
+            self._animate(self._reveal_text_box())
+            return
+
+        self._render_text_box()
+
+    def _render_text_box(self):
         self.text_box_win.erase()
         self._create_text_box()
         self._update_screen()
 
-    def _create_text_box(self):
-        self.text_box_win.addstr("Xx" + "_" * (self._width + 2) + "xX\n")
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.text_box_win.refresh()
+    def _reveal_text_box(self):
+        """Type the box out line by line, typed text shows up meanwhile"""
+        try:
+            for rows in range(1, 4):
+                yield Config.get_instance().delayOutput
+                self._visible_rows = rows
+                self._render_text_box()
+                AudioController.get_instance().play_random_print_sound()
+        finally:
+            self._visible_rows = None
+        self._render_text_box()
 
-        self.text_box_win.addstr("||" + " " * (self._width + 2) + "||\n")
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.text_box_win.refresh()
+    def _create_text_box(self):
+        lines = [
+            "Xx" + "_" * (self._width + 2) + "xX\n",
+            "||" + " " * (self._width + 2) + "||\n",
+            "Xx" + "¯" * (self._width + 2) + "xX\n",
+        ]
+        if self._visible_rows is not None:
+            lines = lines[:self._visible_rows]
 
-        self.text_box_win.addstr("Xx" + "¯" * (self._width + 2) + "xX\n")
-        if self.is_first_display:
-            t.sleep(Config.get_instance().delayOutput)
-            AudioController.get_instance().play_random_print_sound()
-            self.text_box_win.refresh()
+        for line in lines:
+            self.text_box_win.addstr(line)
 
-        self.is_first_display = False
-        self.text_box_win.addstr(1, 3, self._text.ljust(self._max_symbol))
+        if self._visible_rows is None or self._visible_rows > 1:
+            self.text_box_win.addstr(1, 3, self._text.ljust(self._max_symbol))
 
     def _on_key(self, key):
         if self._pause:
@@ -130,9 +143,9 @@ class TextBoxWidget(BaseActiveWidget):
             eid.set_pause(pause)
 
         if not pause:
-            curses.curs_set(1)
+            self._backend.curs_set(1)
         else:
-            curses.curs_set(0)
+            self._backend.curs_set(0)
             
         self._update_text_box()
 
@@ -0,0 +1,66 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# Keep the game logger's records in memory, test runs leave no LOG folder behind
+os.environ.setdefault("GAME_LOG_MODE", "memory")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+# lib.SaveManager creates its save folder under LOCALAPPDATA at import, which
+# only Windows sets
+os.environ.setdefault("LOCALAPPDATA", tempfile.mkdtemp(prefix="game-saves-"))
+
+# Game modules import each other as `data.*`, like Assets/bootstrap.py sets up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS = os.path.join(ROOT, "Assets")
+if ASSETS not in sys.path:
+    sys.path.append(ASSETS)
+
+from lib.CursesBackend import CursesBackend
+from lib.Scheduler import Scheduler
+
+
+class FakeClock:
+    """Clock for a Scheduler that only moves when told to"""
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def headless():
+    """Headless curses backend for the test, the previous backend is restored afterwards"""
+    previous = CursesBackend._instance
+    win = CursesBackend.use_headless(24, 80)
+    yield win
+    CursesBackend.set_instance(previous)
+
+
+@pytest.fixture
+def scheduler(clock):
+    """Shared scheduler on the manual clock for the test"""
+    previous = Scheduler._instance
+    scheduler = Scheduler(clock)
+    Scheduler.set_instance(scheduler)
+    yield scheduler
+    Scheduler.set_instance(previous)
+
+
+@pytest.fixture
+def consolas(headless, scheduler):
+    """Consolas drawing into the headless window, as LibController.load_lib sets it up"""
+    from controller.LibController import LibController
+    lib_controller = LibController.get_instance()
+    lib_controller.load_lib(headless)
+    return lib_controller.consolas
@@ -0,0 +1,15 @@
+from Assets.data.LevelMap import Levels
+
+
+class OpenFieldLevel(Levels.BaseLevel):
+    """Walled field with a pillar every few cells, the player spawns in the middle"""
+    def __init__(self, width: int, height: int):
+        super().__init__(-1, "Test field", "")
+        rows = ["*" * width]
+        for y in range(1, height - 1):
+            inner = "".join("#" if x % 7 == 3 and y % 5 == 2 else " " for x in range(1, width - 1))
+            rows.append("*" + inner + "*")
+        rows.append("*" * width)
+        self.level_map = rows
+        self.PlayerSpawnX = width // 2
+        self.PlayerSpawnY = height // 2
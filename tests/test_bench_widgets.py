@@ -0,0 +1,38 @@
+import json
+
+import pytest
+
+from benchmarks.bench_widgets import Suite, compare
+
+
+@pytest.fixture
+def suite(headless, scheduler):
+    from data.Config import Config
+
+    config = Config.get_instance()
+    delay = config.delayOutput
+    yield Suite(frames=5)
+    config.delayOutput = delay
+
+
+def test_suite_records_both_phases(suite):
+    consolas = suite.consolas
+    suite.run("TableWidget", "2x30", lambda: consolas.create_table("a", "b", width=30, animation=False),
+              lambda widget, i: widget.draw())
+    phases = {result["phase"]: result for result in suite.results}
+    assert set(phases) == {"first_paint", "steady"}
+    assert phases["steady"]["frames"] == 5
+    assert phases["first_paint"]["bytes_per_frame"] > 0
+    assert phases["steady"]["us_per_frame"] > 0
+
+
+def test_compare_flags_only_regressions_past_the_tolerance(tmp_path, capsys):
+    def result(us, calls=10, written=100):
+        return {"widget": "TableWidget", "size": "5x22", "phase": "steady",
+                "us_per_frame": us, "calls_per_frame": calls, "bytes_per_frame": written}
+
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps({"results": [result(100)]}))
+    assert compare([result(120)], str(baseline), 0.25) == 0
+    assert compare([result(130, calls=20)], str(baseline), 0.25) == 2
+    assert "us_per_frame" in capsys.readouterr().out
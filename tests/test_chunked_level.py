@@ -0,0 +1,65 @@
+import os
+
+import pytest
+
+from Assets.data.LevelMap import Levels
+from lib.ChunkedLevel import ChunkedLevel, LevelFormatError, convert_level
+from tests.levels import OpenFieldLevel
+
+
+class RaggedLevel(Levels.BaseLevel):
+    """Rows of different lengths, non-ASCII tiles and a large empty area"""
+    def __init__(self, description: str = "Описание"):
+        super().__init__(7, "Уровень", description)
+        self.level_map = ["*ʘ*" + " " * 97] + ["*₩"] + [""] * 70 + ["#" * 100]
+        self.PlayerSpawnX = 1
+        self.PlayerSpawnY = 1
+
+
+def test_round_trip_keeps_tiles_and_metadata(tmp_path):
+    level = RaggedLevel()
+    path = str(tmp_path / "ragged.lvl")
+    convert_level(level, path, chunk_size=16)
+    with ChunkedLevel(path) as chunked:
+        assert (chunked.width, chunked.height) == (level.width, level.height)
+        assert (chunked.name, chunked.description, chunked.level_id) == ("Уровень", "Описание", 7)
+        assert (chunked.PlayerSpawnX, chunked.PlayerSpawnY) == (1, 1)
+        for y, row in enumerate(level.level_map):
+            assert chunked.get_row(y) == row.ljust(level.width)
+        assert chunked.get_tile(1, 0) == "ʘ"
+        assert chunked.get_tile(100, 0) is None
+        assert chunked.get_row(1, 1, 3) == "₩ "
+        assert list(chunked.iter_rows()) == [row.ljust(level.width) for row in level.level_map]
+
+
+def test_empty_chunks_are_not_stored(tmp_path):
+    path = str(tmp_path / "ragged.lvl")
+    stored = convert_level(RaggedLevel(), path, chunk_size=16)
+    with ChunkedLevel(path) as chunked:
+        assert chunked.stored_chunks == stored
+        # 7 x 5 chunks, the empty middle rows need none
+        assert stored < 7 * 5
+
+
+def test_large_level_reads_match_the_source(tmp_path):
+    level = OpenFieldLevel(300, 200)
+    path = str(tmp_path / "field.lvl")
+    convert_level(level, path)
+    with ChunkedLevel(path) as chunked:
+        for y in (0, 1, 2, 99, 199):
+            assert chunked.get_row(y, 40, 250) == level.level_map[y][40:250]
+        assert chunked.level_map[7] == level.level_map[7]
+
+
+def test_too_long_description_is_rejected_before_writing(tmp_path):
+    path = str(tmp_path / "long.lvl")
+    with pytest.raises(ValueError, match="description"):
+        convert_level(RaggedLevel("é" * 40000), path)
+    assert os.listdir(tmp_path) == []
+
+
+def test_other_files_are_rejected(tmp_path):
+    path = tmp_path / "bogus.lvl"
+    path.write_bytes(b"NOPE" + b"\0" * 100)
+    with pytest.raises(LevelFormatError):
+        ChunkedLevel(str(path))
@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+
+import pytest
+
+from lib.EventSystem import EventData, EventSystem
+
+
+@dataclass
+class DamageData(EventData):
+    amount: int = 0
+
+
+def damage(amount: int, timestamp: float = 0.0) -> DamageData:
+    return DamageData(event_name="damage", timestamp=timestamp, amount=amount)
+
+
+def test_posted_events_wait_for_the_flush():
+    system = EventSystem()
+    calls = []
+    system.subscribe("move", lambda e: calls.append(e.source))
+    system.post("move", source=1)
+    system.post("move", source=2)
+    assert calls == []
+    assert system.flush_posted() == 2
+    assert calls == [1, 2]
+    assert system.flush_posted() == 0
+
+
+def test_flush_groups_events_by_first_posted_name():
+    system = EventSystem()
+    calls = []
+    for name in ("a", "b"):
+        system.subscribe(name, lambda e: calls.append((e.event_name, e.source)))
+    system.post("a", source=1)
+    system.post("b", source=2)
+    system.post("a", source=3)
+    system.flush_posted()
+    assert calls == [("a", 1), ("a", 3), ("b", 2)]
+
+
+def test_latest_policy_delivers_only_the_last_post():
+    system = EventSystem()
+    calls = []
+    system.subscribe("move", lambda e: calls.append(e.source))
+    system.set_coalescing("move", "latest")
+    for i in range(5):
+        system.post("move", source=i)
+    assert system.flush_posted() == 1
+    assert calls == [4]
+    assert len(system.get_event_history(event_name="move")) == 1
+
+
+def test_sum_policy_adds_numeric_attributes():
+    system = EventSystem()
+    calls = []
+    system.subscribe("damage", lambda e: calls.append(e.amount))
+    system.set_coalescing("damage", "sum")
+    posted = [damage(amount) for amount in (3, 4, 5)]
+    for event_data in posted:
+        system.post("damage", event_data)
+    system.flush_posted()
+    assert calls == [12]
+    # The posted events are left untouched
+    assert [e.amount for e in posted] == [3, 4, 5]
+
+
+def test_custom_policy_merges_pairwise():
+    system = EventSystem()
+    calls = []
+    system.subscribe("damage", lambda e: calls.append(e.amount))
+    system.set_coalescing("damage", lambda previous, new: damage(max(previous.amount, new.amount)))
+    system.emit_batch([damage(2), damage(7), damage(3)])
+    assert calls == [7]
+
+
+def test_emit_batch_delivers_merged_events_at_their_first_position():
+    system = EventSystem()
+    calls = []
+    system.subscribe("damage", lambda e: calls.append(("damage", e.amount)))
+    system.subscribe("move", lambda e: calls.append(("move", None)))
+    system.set_coalescing("damage", "sum")
+    results = system.emit_batch([damage(1), EventData("move", 0.0), damage(2)])
+    assert calls == [("damage", 3), ("move", None)]
+    assert len(results) == 2
+
+
+def test_batch_without_coalescing_delivers_every_event():
+    system = EventSystem()
+    calls = []
+    system.subscribe("damage", lambda e: calls.append(e.amount))
+    system.set_coalescing("damage", "sum")
+    system.emit_batch([damage(1), damage(2)], coalesce=False)
+    system.set_coalescing("damage", None)
+    system.emit_batch([damage(3), damage(4)])
+    assert calls == [1, 2, 3, 4]
+
+
+def test_global_filters_apply_to_batches():
+    system = EventSystem()
+    calls = []
+    system.subscribe("damage", lambda e: calls.append(e.amount))
+    system.add_global_filter(lambda e: e.amount > 1)
+    system.emit_batch([damage(1), damage(2)])
+    assert calls == [2]
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        EventSystem().set_coalescing("damage", "average")
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+
+import pytest
+
+from lib.EventSystem import EventPriority, EventQueueFullError, EventSystem
+
+
+def test_emit_async_awaits_coroutine_handlers_in_order():
+    system = EventSystem()
+    calls = []
+
+    async def slow(event_data):
+        await asyncio.sleep(0)
+        calls.append("slow")
+        return "slow"
+
+    system.subscribe("load", slow, EventPriority.HIGH)
+    system.subscribe("load", lambda e: calls.append("sync") or "sync")
+    assert asyncio.run(system.emit_async("load")) == ["slow", "sync"]
+    assert calls == ["slow", "sync"]
+
+
+def test_async_handler_can_cancel_the_event():
+    system = EventSystem()
+    calls = []
+
+    async def cancel(event_data):
+        event_data.cancel()
+
+    system.subscribe("load", cancel, EventPriority.HIGH)
+    system.subscribe("load", lambda e: calls.append(1))
+    asyncio.run(system.emit_async("load"))
+    assert calls == []
+
+
+def test_emit_async_in_thread_runs_on_the_dispatcher():
+    system = EventSystem()
+    system.subscribe("load", lambda e: threading.current_thread().name)
+    try:
+        [thread_name] = asyncio.run(system.emit_async("load", in_thread=True))
+    finally:
+        system.shutdown_dispatcher()
+    assert thread_name.startswith("EventDispatch")
+
+
+def test_queued_events_are_dispatched_in_order():
+    system = EventSystem()
+    calls = []
+    system.subscribe("step", lambda e: calls.append(e.source))
+    futures = [system.emit_queued("step", source=i) for i in range(20)]
+    system.shutdown_dispatcher()
+    assert calls == list(range(20))
+    assert all(future.done() for future in futures)
+
+
+def test_full_queue_raises_without_blocking():
+    system = EventSystem()
+    release = threading.Event()
+    system.subscribe("step", lambda e: release.wait(5))
+    system.start_dispatcher(workers=1, queue_size=1)
+    try:
+        system.emit_queued("step")
+        system.emit_queued("step")
+        with pytest.raises(EventQueueFullError):
+            system.emit_queued("step", block=False)
+    finally:
+        release.set()
+        system.shutdown_dispatcher()
+
+
+def test_invalid_dispatcher_configuration():
+    with pytest.raises(ValueError):
+        EventSystem().start_dispatcher(workers=0)
@@ -0,0 +1,74 @@
+import pytest
+
+from lib.EventSystem import EventData, EventHistory, EventSystem
+
+
+def event(name: str, timestamp: float) -> EventData:
+    return EventData(event_name=name, timestamp=timestamp)
+
+
+def names(events):
+    return [(e.event_name, e.timestamp) for e in events]
+
+
+def test_ring_buffer_keeps_the_last_events():
+    history = EventHistory(3)
+    for i in range(5):
+        history.append(event("tick", i))
+    assert len(history) == 3
+    assert [e.timestamp for e in history.query()] == [2, 3, 4]
+
+
+def test_query_by_name_limit_and_time_range():
+    history = EventHistory(10)
+    for i in range(8):
+        history.append(event("a" if i % 2 else "b", i))
+    assert names(history.query(event_name="a")) == [("a", 1), ("a", 3), ("a", 5), ("a", 7)]
+    assert names(history.query(limit=2, event_name="a")) == [("a", 5), ("a", 7)]
+    assert [e.timestamp for e in history.query(since=2, until=5)] == [2, 3, 4, 5]
+    assert names(history.query(event_name="b", since=3)) == [("b", 4), ("b", 6)]
+    assert history.query(event_name="missing") == []
+
+
+def test_evicted_events_leave_the_name_index():
+    history = EventHistory(2)
+    history.append(event("old", 0))
+    history.append(event("new", 1))
+    history.append(event("new", 2))
+    assert history.query(event_name="old") == []
+    assert [e.timestamp for e in history.query(event_name="new")] == [1, 2]
+
+
+def test_out_of_order_timestamps_fall_back_to_a_scan():
+    history = EventHistory(10)
+    for timestamp in (1, 5, 3, 4, 2):
+        history.append(event("tick", timestamp))
+    assert sorted(e.timestamp for e in history.query(since=2, until=4)) == [2, 3, 4]
+    assert [e.timestamp for e in history.query(limit=1, since=3)] == [4]
+
+
+def test_zero_capacity_stores_nothing():
+    history = EventHistory(0)
+    history.append(event("tick", 0))
+    assert history.query() == []
+    with pytest.raises(ValueError):
+        EventHistory(-1)
+
+
+def test_event_system_records_emitted_events():
+    system = EventSystem(history_size=3)
+    for i in range(4):
+        system.emit("tick" if i % 2 else "tock")
+    assert [e.event_name for e in system.get_event_history()] == ["tick", "tock", "tick"]
+    assert len(system.get_event_history(event_name="tick")) == 2
+
+
+def test_shrinking_the_history_keeps_the_newest_events():
+    system = EventSystem(history_size=5)
+    for i in range(5):
+        system.emit("tick", event("tick", i))
+    system.history_size = 2
+    assert system.history_size == 2
+    assert [e.timestamp for e in system.get_event_history()] == [3, 4]
+    system.clear_history()
+    assert system.get_event_history() == []
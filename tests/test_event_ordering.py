@@ -0,0 +1,80 @@
+from lib.EventSystem import EventPriority, EventSystem
+
+
+def test_handlers_run_by_priority_then_subscription_order():
+    system = EventSystem()
+    calls = []
+    system.subscribe("hit", lambda e: calls.append("normal 1"))
+    system.subscribe("hit", lambda e: calls.append("low"), EventPriority.LOW)
+    system.subscribe("hit", lambda e: calls.append("highest"), EventPriority.HIGHEST)
+    system.subscribe("hit", lambda e: calls.append("normal 2"))
+    system.emit("hit")
+    assert calls == ["highest", "normal 1", "normal 2", "low"]
+
+
+def test_cancel_stops_lower_priorities():
+    system = EventSystem()
+    calls = []
+    system.subscribe("hit", lambda e: e.cancel(), EventPriority.HIGH)
+    system.subscribe("hit", lambda e: calls.append("normal"))
+    assert system.emit("hit") == [None]
+    assert calls == []
+
+
+def test_subscriptions_made_during_emit_apply_to_the_next_one():
+    system = EventSystem()
+    calls = []
+
+    def late(event_data):
+        calls.append("late")
+
+    def first(event_data):
+        calls.append("first")
+        system.subscribe("hit", late)
+        system.unsubscribe("hit", second)
+
+    def second(event_data):
+        calls.append("second")
+
+    system.subscribe("hit", first)
+    system.subscribe("hit", second)
+    system.emit("hit")
+    assert calls == ["first", "second"]
+
+    calls.clear()
+    system.unsubscribe("hit", first)
+    system.emit("hit")
+    assert calls == ["late"]
+
+
+def test_once_handler_runs_a_single_time():
+    system = EventSystem()
+    calls = []
+    system.subscribe("hit", lambda e: calls.append(1), once=True)
+    system.emit("hit")
+    system.emit("hit")
+    assert calls == [1]
+    assert system.get_event_handlers("hit") == []
+
+
+def test_failing_handler_does_not_stop_the_others():
+    system = EventSystem()
+
+    def broken(event_data):
+        raise RuntimeError("boom")
+
+    system.subscribe("hit", broken, EventPriority.HIGH)
+    system.subscribe("hit", lambda e: "ok")
+    assert system.emit("hit") == ["ok"]
+
+
+def test_unsubscribe_reports_whether_a_handler_was_removed():
+    system = EventSystem()
+
+    def handler(event_data):
+        pass
+
+    system.subscribe("hit", handler)
+    assert system.unsubscribe("hit", handler)
+    assert not system.unsubscribe("hit", handler)
+    assert system.get_event_names() == []
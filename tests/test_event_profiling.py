@@ -0,0 +1,57 @@
+import json
+
+from lib.EventProfiler import EventProfiler
+from lib.EventSystem import EventSystem
+
+
+def ok(event_data):
+    return "ok"
+
+
+def broken(event_data):
+    raise RuntimeError("boom")
+
+
+def test_profiler_counts_calls_and_errors():
+    system = EventSystem()
+    system.subscribe("hit", ok)
+    system.subscribe("hit", broken)
+    profiler = system.enable_profiling()
+    for _ in range(3):
+        system.emit("hit")
+
+    assert system.profiler is profiler
+    assert profiler.event_stats("hit")["calls"] == 3
+    stats = {entry["handler"].split(":")[0]: entry for entry in profiler.handler_stats("hit")}
+    assert stats[f"{__name__}.ok"]["calls"] == 3
+    assert stats[f"{__name__}.ok"]["errors"] == 0
+    assert stats[f"{__name__}.broken"]["errors"] == 3
+
+
+def test_disabled_profiler_keeps_its_timings():
+    system = EventSystem()
+    system.subscribe("hit", ok)
+    system.enable_profiling()
+    system.emit("hit")
+    profiler = system.disable_profiling()
+    system.emit("hit")
+    assert system.profiler is None
+    assert profiler.event_stats("hit")["calls"] == 1
+    assert profiler.event_stats("miss") is None
+
+
+def test_enable_profiling_reuses_a_given_profiler(tmp_path):
+    system = EventSystem()
+    profiler = EventProfiler()
+    system.subscribe("hit", ok)
+    assert system.enable_profiling(profiler) is profiler
+    system.emit("hit")
+    assert system.enable_profiling() is profiler
+
+    path = tmp_path / "profile.json"
+    profiler.dump(str(path))
+    snapshot = json.loads(path.read_text(encoding="utf-8"))
+    assert snapshot["events"]["hit"]["calls"] == 1
+    assert len(profiler.slowest(limit=5)) == 1
+    profiler.reset()
+    assert profiler.handler_stats() == []
@@ -0,0 +1,63 @@
+import gc
+
+from lib.EventSystem import EventSystem
+
+
+class Listener:
+    def __init__(self):
+        self.calls = 0
+
+    def on_hit(self, event_data):
+        self.calls += 1
+
+
+def test_weak_handler_does_not_keep_its_owner_alive():
+    system = EventSystem()
+    listener = Listener()
+    system.subscribe("hit", listener.on_hit, weak_ref=True)
+    system.emit("hit")
+    assert listener.calls == 1
+
+    del listener
+    gc.collect()
+    assert system.get_handler_report()["pending_reap"] == 1
+    assert system.reap_dead_handlers() == 1
+    assert system.get_event_handlers("hit") == []
+    assert system.get_handler_report()["reaped"] == 1
+
+
+def test_emit_reaps_dead_handlers():
+    system = EventSystem()
+    listener = Listener()
+    system.subscribe("hit", listener.on_hit, weak_ref=True)
+    del listener
+    gc.collect()
+    assert system.emit("hit") == []
+    assert system.get_event_names() == []
+
+
+def test_unsubscribed_weak_handler_is_not_reaped():
+    system = EventSystem()
+    listener = Listener()
+    system.subscribe("hit", listener.on_hit, weak_ref=True)
+    assert system.unsubscribe("hit", listener.on_hit)
+    del listener
+    gc.collect()
+    assert system.reap_dead_handlers() == 0
+
+
+def test_handler_report_counts_strong_and_weak_owners():
+    system = EventSystem()
+    strong, weak = Listener(), Listener()
+    system.subscribe("hit", strong.on_hit)
+    system.subscribe("hit", weak.on_hit, weak_ref=True)
+    system.subscribe("miss", lambda e: None)
+
+    report = system.get_handler_report()
+    owner = f"{__name__}.Listener"
+    assert report["handlers"] == 3
+    assert report["weak_handlers"] == 1
+    assert report["topics"] == {"hit": 2, "miss": 1}
+    assert report["strong_owners"] == {owner: 1}
+    assert report["weak_owners"] == {owner: 1}
+    assert system.get_handler_report(min_handlers=2)["topics"] == {"hit": 2}
@@ -0,0 +1,67 @@
+from lib.EventSystem import EventPriority, EventSystem
+from lib.TopicTrie import TopicTrie
+
+
+def test_trie_matches_single_and_multi_segment_patterns():
+    trie = TopicTrie()
+    for pattern in ("combat.*", "ui.**", "*.open", "combat.hit"):
+        trie.add(pattern)
+    assert trie.match("combat.hit") == {"combat.*", "combat.hit"}
+    assert trie.match("ui") == {"ui.**"}
+    assert trie.match("ui.menu.open") == {"ui.**"}
+    assert trie.match("door.open") == {"*.open"}
+    assert trie.match("combat.hit.crit") == set()
+
+
+def test_trie_remove_drops_empty_branches():
+    trie = TopicTrie()
+    trie.add("a.b.*")
+    assert not trie.add("a.b.*")
+    assert "a.b.*" in trie
+    assert trie.remove("a.b.*")
+    assert not trie.remove("a.b.*")
+    assert len(trie) == 0
+    assert trie._root.children == {}
+
+
+def test_wildcard_and_exact_handlers_merge_by_priority():
+    system = EventSystem()
+    calls = []
+    system.subscribe("combat.hit", lambda e: calls.append("exact"))
+    system.subscribe("combat.*", lambda e: calls.append("wildcard"), EventPriority.HIGH)
+    system.subscribe("**", lambda e: calls.append("all"), EventPriority.LOW)
+    system.emit("combat.hit")
+    assert calls == ["wildcard", "exact", "all"]
+
+    calls.clear()
+    system.emit("ui.menu.open")
+    assert calls == ["all"]
+
+
+def test_new_pattern_applies_to_already_emitted_names():
+    system = EventSystem()
+    calls = []
+    system.emit("combat.hit")
+    system.subscribe("combat.*", lambda e: calls.append(e.event_name))
+    system.emit("combat.hit")
+    system.unsubscribe("combat.*", system.get_event_handlers("combat.hit")[0].callback)
+    system.emit("combat.hit")
+    assert calls == ["combat.hit"]
+
+
+def test_emitting_a_pattern_name_calls_its_handlers_once():
+    system = EventSystem()
+    calls = []
+    system.subscribe("combat.*", lambda e: calls.append(1))
+    system.emit("combat.*")
+    assert calls == [1]
+
+
+def test_once_wildcard_handler_is_removed_from_its_pattern():
+    system = EventSystem()
+    calls = []
+    system.subscribe("combat.*", lambda e: calls.append(e.event_name), once=True)
+    system.emit("combat.hit")
+    system.emit("combat.miss")
+    assert calls == ["combat.hit"]
+    assert system.get_event_names() == []
@@ -0,0 +1,106 @@
+import curses
+import threading
+import time
+
+import pytest
+
+from lib.CursesBackend import CursesBackend, HeadlessWindow
+
+
+def settle(consolas, widget):
+    """Run the widget's reveal animation to the end and flush the frame"""
+    if widget.animation is not None and not widget.animation.done:
+        widget.animation.finish()
+    consolas.flush()
+
+
+def test_window_keeps_text_and_attributes():
+    win = HeadlessWindow(5, 20)
+    win.addstr(1, 2, "hello", 7)
+    win.addch(2, 0, ord("x") | curses.A_BOLD)
+    assert win.find("hello") == (1, 2)
+    assert win.attr_at(1, 2) == 7
+    assert win.char_at(2, 0) == "x" and win.attr_at(2, 0) == curses.A_BOLD
+    assert win.lines()[1] == "  hello" + " " * 13
+    assert win.cells_written == 6
+
+
+def test_writing_past_the_edge_raises_like_curses():
+    win = HeadlessWindow(2, 5)
+    with pytest.raises(curses.error):
+        win.addstr(0, 3, "abc")
+    assert win.lines()[0] == "   ab"
+    with pytest.raises(curses.error):
+        win.move(2, 0)
+
+
+def test_getch_returns_pushed_keys_then_times_out():
+    win = HeadlessWindow(2, 5)
+    win.push_keys(["a", curses.KEY_UP])
+    win.nodelay(True)
+    assert [win.getch(), win.getch(), win.getch()] == [ord("a"), curses.KEY_UP, -1]
+    win.timeout(20)
+    began = time.monotonic()
+    assert win.getch() == -1
+    assert time.monotonic() - began >= 0.015
+
+
+def test_blocking_getch_wakes_on_keys_from_another_thread():
+    win = HeadlessWindow(2, 5)
+    win.timeout(-1)
+    threading.Timer(0.02, win.push_keys, args=(["z"],)).start()
+    assert win.getch() == ord("z")
+
+
+def test_backend_encodes_color_pairs(headless):
+    backend = CursesBackend.get_instance()
+    assert backend.headless
+    backend.init_pair(3, 1, 2)
+    assert backend.pairs[3] == (1, 2)
+    assert backend.color_pair(3) == 3 << 8
+
+
+def test_table_renders_its_rows(consolas, headless):
+    widget = consolas.create_table("First row", "Second row", width=30, animation=False)
+    settle(consolas, widget)
+    first, second = headless.find("First row"), headless.find("Second row")
+    assert first and second and second[0] > first[0]
+
+
+def test_menu_follows_arrow_keys(consolas, headless):
+    from controller.LibController import LibController
+
+    chosen = []
+    menu = {"New game": lambda: chosen.append("new"), "Quit": lambda: chosen.append("quit")}
+    widget = consolas.create_menu("Main", menu, ["Start", "Leave"])
+    settle(consolas, widget)
+    assert headless.find("> New game") is not None
+
+    input_controller = LibController.get_instance().input_controller
+    input_controller.handle_key(curses.KEY_DOWN)
+    settle(consolas, widget)
+    assert headless.find("> Quit") is not None
+    assert headless.find("> New game") is None
+
+    input_controller.handle_key(curses.KEY_ENTER)
+    assert chosen == ["quit"]
+    widget.stop()
+
+
+def test_text_box_takes_typed_text(consolas, headless):
+    from controller.LibController import LibController
+
+    entered = []
+    widget = consolas.create_text_box(width=30, max_symbol=10, function=entered.append)
+    settle(consolas, widget)
+    input_controller = LibController.get_instance().input_controller
+    for key in "hero!":
+        input_controller.handle_key(ord(key))
+    input_controller.handle_key(127)
+    settle(consolas, widget)
+    assert headless.find("hero") is not None
+    assert widget.text == "hero"
+
+    input_controller.handle_key(10)
+    assert widget.done and entered == ["hero"]
+    widget.stop()
@@ -0,0 +1,58 @@
+from lib.InputController import InputController
+
+
+def test_key_dispatches_only_its_handlers():
+    controller = InputController()
+    calls = []
+    controller.add_input_event("a", lambda: calls.append("a1"))
+    controller.add_input_event(ord("a"), lambda: calls.append("a2"))
+    controller.add_input_event("b", lambda: calls.append("b"))
+    controller.handle_key(ord("a"))
+    assert calls == ["a1", "a2"]
+    controller.handle_key(ord("z"))
+    assert calls == ["a1", "a2"]
+
+
+def test_paused_and_removed_events_are_skipped():
+    controller = InputController()
+    calls = []
+    paused = controller.add_input_event("a", lambda: calls.append("paused"), pause=True)
+    removed = controller.add_input_event("a", lambda: calls.append("removed"))
+    controller.add_input_event("a", lambda: calls.append("active"))
+    removed.remove()
+    controller.handle_key(ord("a"))
+    assert calls == ["active"]
+
+    controller.set_input_event_pause(paused.id, False)
+    controller.handle_key(ord("a"))
+    assert calls == ["active", "paused", "active"]
+    assert controller.event_count == 2
+
+
+def test_handlers_can_change_bindings_while_dispatching():
+    controller = InputController()
+    calls = []
+
+    def first():
+        calls.append("first")
+        second.remove()
+        controller.add_input_event("a", lambda: calls.append("added"))
+
+    controller.add_input_event("a", first)
+    second = controller.add_input_event("a", lambda: calls.append("second"))
+    controller.handle_key(ord("a"))
+    # The removed handler is not called, the added one waits for the next key
+    assert calls == ["first"]
+    controller.handle_key(ord("a"))
+    assert calls == ["first", "first", "added"]
+
+
+def test_key_listeners_see_every_key():
+    controller = InputController()
+    seen = []
+    controller.add_key_listener(seen.append)
+    controller.handle_key(5)
+    controller.handle_key(ord("a"))
+    assert seen == [5, ord("a")]
+    assert controller.remove_key_listener(seen.append)
+    assert not controller.remove_key_listener(seen.append)
@@ -0,0 +1,131 @@
+import json
+import logging
+import pathlib
+
+from lib.LogIndex import ENTRY, LogIndex, level_number
+from lib.Logger import NULL_MODE, Logger
+from lib.logs.LogHandlers import JsonFormatter
+
+
+def write_log(path, records):
+    with open(path, "a", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record) + "\n")
+
+
+def sample(count: int, modules=("lib.widgets.MenuWidget", "lib.Scheduler", "main")):
+    levels = ("DEBUG", "INFO", "WARNING", "ERROR")
+    return [{"time": 1000.0 + i, "level": levels[i % len(levels)],
+             "module": modules[i % len(modules)], "message": f"line {i}"}
+            for i in range(count)]
+
+
+def messages(records):
+    return [record["message"] for record in records]
+
+
+def test_update_indexes_only_appended_lines(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    write_log(path, sample(3))
+    index = LogIndex(path)
+    assert index.update() == 3
+
+    write_log(path, sample(5)[3:])
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"time": 2000, "level": "INFO"')  # still being written
+    reopened = LogIndex(path)
+    assert reopened.update() == 2
+    assert len(reopened) == 5
+    assert messages(reopened.read(reopened.query())) == [f"line {i}" for i in range(5)]
+
+
+def test_query_filters_by_level_module_and_time(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    write_log(path, sample(12))
+    index = LogIndex(path)
+    index.update()
+
+    assert messages(index.read(index.query("ERROR"))) == ["line 3", "line 7", "line 11"]
+    assert messages(index.read(index.query(modules=["lib.widgets"]))) == ["line 0", "line 3", "line 6", "line 9"]
+    assert messages(index.read(index.query(start=1004, end=1006))) == ["line 4", "line 5", "line 6"]
+    assert messages(index.read(index.query("WARNING", ["lib"], start=1005))) == ["line 6", "line 7", "line 10"]
+
+
+def test_select_and_page(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    write_log(path, sample(20))
+    index = LogIndex(path)
+    index.update()
+
+    assert index.select() is None
+    records, more = index.page(None, 18, 5)
+    assert messages(records) == ["line 18", "line 19"] and not more
+
+    selection = index.select("INFO", ["main"])
+    assert list(selection) == [2, 5, 11, 14, 17]
+    records, more = index.page(selection, 1, 2)
+    assert messages(records) == ["line 5", "line 11"] and more
+    records, more = index.page(selection, 3, 2)
+    assert messages(records) == ["line 14", "line 17"] and not more
+
+
+def test_index_of_another_version_is_rebuilt(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    write_log(path, sample(4))
+    index = LogIndex(path)
+    index.update()
+    meta = json.loads(pathlib.Path(index.meta_path).read_text(encoding="utf-8"))
+    meta["version"] = 1
+    pathlib.Path(index.meta_path).write_text(json.dumps(meta), encoding="utf-8")
+
+    rebuilt = LogIndex(path)
+    assert rebuilt.update() == 4
+    assert pathlib.Path(rebuilt.index_path).stat().st_size == 4 * ENTRY.size
+
+
+def test_shrunk_log_is_indexed_again(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    write_log(path, sample(6))
+    LogIndex(path).update()
+    pathlib.Path(path).unlink()
+    write_log(path, sample(2))
+    index = LogIndex(path)
+    assert index.update() == 2
+    assert len(index) == 2
+
+
+def test_more_modules_than_a_byte_can_number(tmp_path):
+    path = str(tmp_path / "LOG__a__.jsonl")
+    modules = [f"mod{i}" for i in range(300)]
+    write_log(path, sample(300, modules))
+    index = LogIndex(path)
+    index.update()
+    assert messages(index.read(index.query(modules=["mod299"]))) == ["line 299"]
+
+
+def test_json_formatter_writes_fields_and_caller():
+    record = logging.LogRecord("GameLogger", logging.WARNING, __file__, 1, "hit %d", (3,), None)
+    record.caller = "lib.Scheduler"
+    record.fields = {"damage": 3, "message": "ignored"}
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["level"] == "WARNING"
+    assert entry["module"] == "lib.Scheduler"
+    assert entry["message"] == "hit 3"
+    assert entry["damage"] == 3
+    assert level_number(entry["level"]) == logging.WARNING
+
+
+def test_structured_logger_output_is_indexable(tmp_path):
+    log = Logger(str(tmp_path), name="TestStructuredLogger")
+    try:
+        log.set_structured(True)
+        log.info("structured %s", "line", room=4)
+        assert log.flush(5)
+        [path] = tmp_path.glob("LOG__*.jsonl")
+        index = LogIndex(str(path))
+        index.update()
+        [record] = index.read(index.query("INFO"))
+        assert record["message"] == "structured line"
+        assert record["room"] == 4
+    finally:
+        log.set_mode(NULL_MODE)
@@ -0,0 +1,110 @@
+import gzip
+import logging
+import os
+import subprocess
+import sys
+import time
+
+from lib.LogIndex import INDEX_SUFFIX, META_SUFFIX
+from lib.logs.LogArchiver import PID_SUFFIX, STALE_AFTER, LogArchiver
+from lib.logs.LogHandlers import RotatingBatchFileHandler
+
+
+def touch(path, age: float = 0.0, text: str = "") -> str:
+    """Create a file last modified age seconds ago"""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    modified = time.time() - age
+    os.utime(path, (modified, modified))
+    return str(path)
+
+
+def dead_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def wait_for(predicate, timeout: float = 5.0) -> bool:
+    """Poll for the result of a job on the archiver thread"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+
+def test_handler_rotates_by_size_into_archives(tmp_path):
+    handler = RotatingBatchFileHandler(str(tmp_path), LogArchiver(str(tmp_path)), max_bytes=100, interval=0)
+    first = handler.baseFilename
+    assert os.path.exists(first + PID_SUFFIX)
+    for i in range(10):
+        handler.emit(record(f"record {i:02d} " + "x" * 20))
+    handler.close()
+
+    assert handler.baseFilename != first
+    assert not os.path.exists(first + PID_SUFFIX)
+    assert not os.path.exists(handler.baseFilename + PID_SUFFIX)
+    assert wait_for(lambda: os.path.exists(first + ".gz") and not os.path.exists(first))
+    with gzip.open(first + ".gz", "rt", encoding="utf-8") as f:
+        assert f.read().startswith("record 00")
+
+
+def test_prune_keeps_the_newest_archives(tmp_path):
+    for age in range(5):
+        touch(tmp_path / f"LOG__{age}__.log.gz", age=age * 100)
+    touch(tmp_path / "notes.log.gz", age=1000)
+    LogArchiver(str(tmp_path), backup_count=2)._prune()
+    assert sorted(os.listdir(tmp_path)) == ["LOG__0__.log.gz", "LOG__1__.log.gz", "notes.log.gz"]
+
+
+def test_prune_compresses_stale_logs_and_drops_their_index(tmp_path):
+    stale = touch(tmp_path / "LOG__old__.log", age=STALE_AFTER * 2, text="old run")
+    touch(stale + INDEX_SUFFIX)
+    touch(stale + META_SUFFIX)
+    fresh = touch(tmp_path / "LOG__new__.log")
+    LogArchiver(str(tmp_path))._prune()
+
+    assert sorted(os.listdir(tmp_path)) == ["LOG__new__.log", "LOG__old__.log.gz"]
+    with gzip.open(stale + ".gz", "rt") as f:
+        assert f.read() == "old run"
+    assert os.path.exists(fresh)
+
+
+def test_logs_of_running_processes_are_left_alone(tmp_path):
+    live = touch(tmp_path / "LOG__live__.log", age=STALE_AFTER * 2)
+    touch(live + PID_SUFFIX, text=str(os.getpid()))
+    excluded = touch(tmp_path / "LOG__mine__.log", age=STALE_AFTER * 2)
+    LogArchiver(str(tmp_path))._prune(exclude=os.path.abspath(excluded))
+    assert os.path.exists(live) and os.path.exists(live + PID_SUFFIX)
+    assert os.path.exists(excluded)
+
+
+def test_markers_of_dead_processes_are_dropped(tmp_path):
+    pid = dead_pid()
+    crashed = touch(tmp_path / "LOG__crashed__.log", age=STALE_AFTER * 2)
+    touch(crashed + PID_SUFFIX, text=str(pid))
+    orphan = str(tmp_path / "LOG__gone__.log")
+    touch(orphan + PID_SUFFIX, text=str(pid))
+    LogArchiver(str(tmp_path))._prune()
+    assert sorted(os.listdir(tmp_path)) == ["LOG__crashed__.log.gz"]
+
+
+def test_stale_partial_archives_are_removed(tmp_path):
+    touch(tmp_path / "LOG__a__.log.gz.part", age=STALE_AFTER * 2)
+    recent = touch(tmp_path / "LOG__b__.log.gz.part")
+    LogArchiver(str(tmp_path))._prune()
+    assert os.listdir(tmp_path) == [os.path.basename(recent)]
+
+
+def test_errors_are_reported_not_raised(tmp_path):
+    messages = []
+    archiver = LogArchiver(str(tmp_path / "missing"), on_error=messages.append)
+    archiver.compress(str(tmp_path / "missing" / "LOG__x__.log"))
+    assert wait_for(lambda: archiver.errors == 1)
+    assert messages[0].startswith("Log archiver: ")
@@ -0,0 +1,164 @@
+import itertools
+import os
+import pathlib
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from lib.Logger import CRITICAL, DEBUG, FILE_MODE, INFO, MEMORY_MODE, NULL_MODE, Logger
+
+_names = itertools.count()
+
+
+@pytest.fixture
+def make_logger(tmp_path):
+    """Loggers writing under tmp_path, closed after the test"""
+    created = []
+
+    def make(mode: str = FILE_MODE, **kwargs) -> Logger:
+        log = Logger(str(tmp_path / "LOG"), name=f"TestLogger{next(_names)}", mode=mode, **kwargs)
+        created.append(log)
+        return log
+
+    yield make
+    for log in created:
+        log.set_mode(NULL_MODE)
+
+
+def log_text(log: Logger) -> str:
+    """Text of the uncompressed logs written so far"""
+    paths = sorted(pathlib.Path(log.log_folder).glob("LOG__*.log"))
+    return "".join(path.read_text(encoding="utf-8") for path in paths)
+
+
+def test_records_are_written_by_the_writer_thread(make_logger):
+    log = make_logger()
+    log.info("first %d", 1)
+    writer = log._listener._thread
+    assert writer is not None and writer is not threading.current_thread()
+    assert log.flush(5)
+    assert "first 1" in log_text(log)
+
+    # flush leaves the writer running
+    log.warning("second")
+    assert log.flush(5)
+    assert log._listener._thread is writer
+    assert "second" in log_text(log)
+
+
+def test_shutdown_drains_the_queue(make_logger):
+    log = make_logger()
+    for i in range(100):
+        log.info("record %d", i)
+    log.shutdown()
+    assert log._listener is None
+    assert "record 99" in log_text(log)
+    # Later records go straight to the file
+    log.info("after shutdown")
+    assert log.flush()
+    for handler in log.logger.handlers:
+        handler.flush()
+    assert "after shutdown" in log_text(log)
+
+
+def test_caller_is_the_module_of_the_logging_code(make_logger):
+    log = make_logger(MEMORY_MODE)
+    log.root_dir = str(pathlib.Path(__file__).parent.parent)
+    log.info("hello")
+    [line] = log.records()
+    assert " - INFO - tests.test_logger : hello" in line
+    assert __file__ in log._callers
+
+
+def test_caller_names_drop_parent_directories(make_logger):
+    log = make_logger(MEMORY_MODE)
+    log.root_dir = "/game/Assets"
+    assert log._caller_name("/game/lib/widgets/MenuWidget.py") == "lib.widgets.MenuWidget"
+    assert log._caller_name("/game/Assets/main.py") == "main"
+    assert log._caller_name("<stdin>") == "Unknown File"
+
+
+class Counted:
+    """Log argument counting how often it is formatted"""
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "counted"
+
+
+def test_messages_below_the_level_are_never_formatted(make_logger):
+    log = make_logger(MEMORY_MODE)
+    log.set_levels("WARNING")
+    argument = Counted()
+    log.info("skipped %s", argument)
+    assert log.records() == []
+    assert argument.formatted == 0
+    assert not log.isEnabledFor(INFO)
+
+    log.warning("kept %s", argument)
+    [line] = log.records()
+    assert line.endswith("kept counted")
+
+
+def test_module_levels_use_the_longest_matching_path(make_logger):
+    log = make_logger(MEMORY_MODE)
+    log.root_dir = str(pathlib.Path(__file__).parent.parent)
+    log.set_levels("WARNING", {"tests": "DEBUG", "tests.test_logger": "ERROR"})
+    log.warning("hidden")
+    log.error("shown", exc_info=False)
+    assert [line.rsplit(" : ", 1)[1] for line in log.records()] == ["shown"]
+
+    log.set_levels("WARNING", {"tests": "DEBUG"})
+    log.debug("debug from tests")
+    assert log.isEnabledFor(DEBUG)
+    assert log.records()[-1].endswith("debug from tests")
+
+
+def test_unknown_level_is_rejected(make_logger):
+    with pytest.raises(ValueError):
+        make_logger(MEMORY_MODE).set_levels("LOUD")
+
+
+def test_nothing_is_created_before_the_first_message(make_logger):
+    log = make_logger()
+    folder = pathlib.Path(log.log_folder)
+    log.set_levels("WARNING")
+    log.info("filtered")
+    assert not folder.exists()
+    assert log._listener is None
+
+    log.warning("first")
+    assert log.flush(5)
+    assert folder.exists()
+    assert "first" in log_text(log)
+
+
+def test_importing_the_logger_creates_no_folder(tmp_path):
+    root = pathlib.Path(__file__).parent.parent
+    env = dict(os.environ, GAME_LOG_MODE=FILE_MODE, PYTHONPATH=str(root))
+    subprocess.run([sys.executable, "-c", "import lib.Logger"], cwd=str(tmp_path), env=env, check=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_null_mode_drops_everything(make_logger):
+    log = make_logger(NULL_MODE)
+    log.critical("dropped")
+    assert not log.isEnabledFor(CRITICAL)
+    assert log.records() == []
+    assert not pathlib.Path(log.log_folder).exists()
+
+
+def test_switching_modes_writes_the_queued_records_first(make_logger):
+    log = make_logger()
+    log.info("to the file")
+    log.set_mode(MEMORY_MODE)
+    assert "to the file" in log_text(log)
+    log.info("to memory")
+    assert log.records()[-1].endswith("to memory")
+    assert "to memory" not in log_text(log)
+    with pytest.raises(ValueError):
+        log.set_mode("stdout")
@@ -0,0 +1,66 @@
+import curses
+import threading
+import time
+
+from lib.InputController import InputController
+from lib.MainLoop import MainLoop
+from lib.Scheduler import Scheduler
+
+
+def make_loop(win, scheduler=None):
+    controller = InputController()
+    keys = []
+    controller.add_key_listener(keys.append)
+    return MainLoop(win, controller, scheduler or Scheduler()), keys
+
+
+def test_pending_keys_are_dispatched_in_order(headless):
+    loop, keys = make_loop(headless)
+    headless.push_keys("abc")
+    loop._running = True
+    loop.run_once()
+    assert keys == [ord("a"), ord("b"), ord("c")]
+
+
+def test_frame_callbacks_run_before_waiting(headless):
+    loop, keys = make_loop(headless)
+    seen = []
+    loop.add_frame_callback(lambda: seen.append(list(keys)))
+    headless.push_keys("x")
+    loop._running = True
+    loop.run_once()
+    assert seen == [[]]
+    assert keys == [ord("x")]
+
+
+def test_sleeps_until_the_next_timer(headless):
+    scheduler = Scheduler()
+    loop, _ = make_loop(headless, scheduler)
+    fired = []
+    began = time.monotonic()
+    scheduler.call_later(0.05, lambda: (fired.append(time.monotonic()), loop.stop()))
+    loop.run()
+    assert fired and fired[0] - began >= 0.05
+    assert not loop.running
+
+
+def test_stop_wakes_a_loop_waiting_for_input(headless):
+    loop, _ = make_loop(headless)
+    thread = threading.Thread(target=loop.run)
+    thread.start()
+    time.sleep(0.05)
+    loop.stop()
+    thread.join(2)
+    assert not thread.is_alive()
+
+
+def test_resize_goes_to_resize_callbacks_not_input(headless):
+    loop, keys = make_loop(headless)
+    sizes = []
+    loop.add_resize_callback(lambda lines, cols: sizes.append((lines, cols)))
+    headless.resize(30, 100)
+    headless.push_keys([curses.KEY_RESIZE, "q"])
+    loop._running = True
+    loop.run_once()
+    assert sizes == [(30, 100)]
+    assert keys == [ord("q")]
@@ -0,0 +1,78 @@
+import pytest
+
+from Assets.data.LevelMap import Levels
+from lib.ChunkedLevel import ChunkedLevel, convert_level
+from lib.PassabilityGrid import ChunkedPassability, PassabilityGrid
+from tests.levels import OpenFieldLevel
+
+
+class SmallLevel(Levels.BaseLevel):
+    def __init__(self):
+        super().__init__(1, "Small", "")
+        self.level_map = [
+            "*****",
+            "* ʘ #",
+            "*  ",
+            "*****",
+        ]
+
+
+def reference(level, x, y):
+    """Passability the way the widget used to check it, tile by tile"""
+    tile = level.get_tile(x, y)
+    return tile is not None and tile not in "*#"
+
+
+def test_grid_matches_the_tiles():
+    level = SmallLevel()
+    grid = PassabilityGrid.from_level(level)
+    for y in range(-1, 5):
+        for x in range(-1, 6):
+            assert grid.is_passable(x, y) == reference(level, x, y), (x, y)
+    # Past the end of a short row is blocked
+    assert not grid.is_passable(4, 2)
+    assert grid.count_passable() == 5
+
+
+def test_set_passable_and_lookups():
+    grid = PassabilityGrid.from_level(SmallLevel())
+    grid.set_passable(4, 1, True)
+    assert grid.is_passable(4, 1)
+    assert grid.find_passable() == (1, 1)
+    assert grid.find_passable(4, 1) == (4, 1)
+    assert sorted(grid.passable_neighbours(1, 2)) == [(1, 1), (2, 1), (2, 2)]
+    assert grid.are_passable([(0, 0), (1, 1)]) == [False, True]
+    assert bytes(grid.row(1)) == b"\x00\x01\x01\x01\x01"
+
+
+@pytest.fixture
+def chunked(tmp_path):
+    level = OpenFieldLevel(150, 90)
+    path = str(tmp_path / "field.lvl")
+    convert_level(level, path, chunk_size=32)
+    with ChunkedLevel(path) as chunked_level:
+        yield level, chunked_level
+
+
+def test_chunked_levels_get_a_chunked_grid(chunked):
+    level, chunked_level = chunked
+    grid = PassabilityGrid.for_level(chunked_level)
+    assert isinstance(grid, ChunkedPassability)
+    assert isinstance(PassabilityGrid.for_level(level), PassabilityGrid)
+
+
+def test_chunked_grid_matches_the_full_grid(chunked):
+    level, chunked_level = chunked
+    full = PassabilityGrid.from_level(level)
+    grid = ChunkedPassability(chunked_level)
+    assert grid.is_passable(75, 45)
+    # Only the chunk of the checked tile is built
+    assert len(grid._chunks) == 1
+    for y in range(-1, 91, 3):
+        for x in range(-1, 151, 2):
+            assert grid.is_passable(x, y) == full.is_passable(x, y), (x, y)
+    assert grid.count_passable() == full.count_passable()
+    assert grid.find_passable(149, 0) == full.find_passable(149, 0)
+    assert bytes(grid.row(2)) == bytes(full.row(2))
+    grid.set_passable(1, 1, False)
+    assert not grid.is_passable(1, 1)
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+from tests.levels import OpenFieldLevel
+
+MOVES = ["_move_up", "_move_down", "_move_left", "_move_right",
+         "_move_up_left", "_move_up_right", "_move_down_left", "_move_down_right"]
+
+
+@pytest.fixture
+def small_map(consolas):
+    widget = consolas.create_player_map(level_map=OpenFieldLevel(30, 12))
+    consolas.flush()
+    yield widget
+    widget.stop()
+
+
+@pytest.fixture
+def big_map(consolas):
+    widget = consolas.create_player_map(level_map=OpenFieldLevel(400, 300))
+    consolas.flush()
+    yield widget
+    widget.stop()
+
+
+def full_draw_lines(widget, consolas, headless):
+    """Screen after repainting the whole viewport"""
+    widget.draw()
+    consolas.flush()
+    return headless.lines()
+
+
+def test_walls_block_moves(small_map):
+    small_map.set_player_position(1, 1)
+    small_map._move_up()
+    small_map._move_left()
+    assert small_map.get_player_position() == (1, 1)
+    assert not small_map.set_player_position(0, 0)
+
+
+def test_move_repaints_only_the_two_cells(small_map, consolas, headless):
+    small_map.set_player_position(5, 6)
+    consolas.flush()
+    headless.reset_counters()
+    small_map._move_right()
+    consolas.flush()
+    assert small_map.get_player_position() == (6, 6)
+    assert headless.cells_written <= 2
+    moved = headless.lines()
+    assert full_draw_lines(small_map, consolas, headless) == moved
+
+
+def test_camera_keeps_the_player_in_view(big_map):
+    rng = random.Random(1)
+    for _ in range(500):
+        getattr(big_map, rng.choice(MOVES[2:4]))()
+        info = big_map.get_map_info()
+        assert info["camera_x"] <= info["player_x"] < info["camera_x"] + info["view_width"]
+        assert info["camera_y"] <= info["player_y"] < info["camera_y"] + info["view_height"]
+
+
+def test_scrolled_view_matches_a_full_draw(big_map, consolas, headless):
+    rng = random.Random(7)
+    scrolls = 0
+    for _ in range(400):
+        camera = (big_map.camera_x, big_map.camera_y)
+        # Long runs in one direction so the camera has to scroll
+        move = rng.choice(MOVES)
+        for _ in range(rng.randint(1, 12)):
+            getattr(big_map, move)()
+        consolas.flush()
+        if (big_map.camera_x, big_map.camera_y) != camera:
+            scrolls += 1
+            assert full_draw_lines(big_map, consolas, headless) == headless.lines()
+    assert scrolls > 20
+
+
+def test_scroll_writes_less_than_the_viewport(big_map, consolas, headless):
+    big_map.set_player_position(200, 150)
+    consolas.flush()
+    start_x = big_map.camera_x
+    headless.reset_counters()
+    while big_map.camera_x == start_x:
+        big_map._move_right()
+    consolas.flush()
+    assert headless.cells_written < big_map.view_width * big_map.view_height
@@ -0,0 +1,152 @@
+import json
+import os
+import threading
+
+import pytest
+
+from lib.SaveManager import SNAPSHOT_CHUNK, SaveCancelledError, SaveManager, snapshot_to_json, take_snapshot
+
+
+class Results:
+    """Save callback collecting (save name, error) pairs"""
+    def __init__(self):
+        self.calls = []
+        self.threads = []
+        self._condition = threading.Condition()
+
+    def __call__(self, save_name, error):
+        with self._condition:
+            self.calls.append((save_name, error))
+            self.threads.append(threading.current_thread())
+            self._condition.notify_all()
+
+    def wait(self, count: int) -> bool:
+        """Callbacks run after flush() returns, wait for them"""
+        with self._condition:
+            return self._condition.wait_for(lambda: len(self.calls) >= count, 5)
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setenv("LOCALAPPDATA", str(tmp_path))
+    manager = SaveManager()
+    yield manager
+    assert manager.flush(5)
+
+
+@pytest.fixture
+def gate(manager):
+    """Holds the writer inside its first write until set"""
+    gate = threading.Event()
+    gate.writing = threading.Event()
+    write_files = manager._write_files
+
+    def blocked_write(save_name, text):
+        gate.writing.set()
+        gate.wait(5)
+        write_files(save_name, text)
+
+    manager._write_files = blocked_write
+    yield gate
+    gate.set()
+
+
+def saved_json(manager, save_name):
+    with open(f"{manager.save_dir}/{save_name}.json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.mark.parametrize("data", [
+    {"name": "hero", "hp": 10, "pos": [1.5, -2], "flags": {"a": True, "b": None}},
+    {"tiles": list(range(SNAPSHOT_CHUNK * 3 + 7)), "empty": [], "nested": {"list": [[1, 2]] * 300}},
+    {str(i): i for i in range(SNAPSHOT_CHUNK * 2 + 1)},
+    {1: "int key", "text": "é ✓ \"quoted\""},
+    [{"id": i} for i in range(600)],
+    "plain string",
+])
+def test_snapshot_serializes_like_json_dumps(data):
+    assert snapshot_to_json(take_snapshot(data)) == json.dumps(data)
+
+
+def test_snapshot_is_independent_of_later_changes():
+    data = {"inventory": ["sword"], "stats": {"hp": 10}}
+    snapshot = take_snapshot(data)
+    data["inventory"].append("shield")
+    data["stats"]["hp"] = 0
+    assert json.loads(snapshot_to_json(snapshot)) == {"inventory": ["sword"], "stats": {"hp": 10}}
+
+
+def test_snapshot_of_unmarshallable_data_falls_back_to_json():
+    class Tag(str):
+        pass
+
+    assert take_snapshot({"tag": Tag("x")}) == ['{"tag": "x"}']
+
+
+def test_save_round_trip(manager):
+    class Loaded:
+        data = None
+
+        @classmethod
+        def from_dict(cls, data):
+            cls.data = data
+
+    manager.save_data({"level": 3, "name": "slot"}, "slot1", wait=True)
+    assert saved_json(manager, "slot1") == {"level": 3, "name": "slot"}
+    manager.load_data("slot1", Loaded)
+    assert Loaded.data == {"level": 3, "name": "slot"}
+    assert manager.list_saves() == ["slot1"]
+    assert not any(name.endswith(".tmp") for name in os.listdir(manager.save_dir))
+
+
+def test_repeated_saves_of_a_slot_are_written_once(manager, gate):
+    results = Results()
+    manager.save_data({"v": 0}, "other", results)
+    assert gate.writing.wait(5)
+    for version in range(1, 4):
+        manager.save_data({"v": version}, "slot", results)
+    assert manager.writer.coalesced == 2
+    assert manager.writer.is_pending("slot")
+    assert not manager.flush(0.05)
+
+    gate.set()
+    assert manager.flush(5)
+    assert manager.writer.written == 2
+    assert saved_json(manager, "slot") == {"v": 3}
+    assert results.wait(4)
+    assert results.calls == [("other", None)] + [("slot", None)] * 3
+    assert all(thread is manager.writer._thread for thread in results.threads)
+
+
+def test_deleting_a_queued_save_cancels_it(manager, gate):
+    manager.save_data({"v": 0}, "other")
+    assert gate.writing.wait(5)
+    results = Results()
+    manager.save_data({"v": 1}, "slot", results)
+
+    assert manager.writer.cancel("slot")
+    assert not manager.writer.cancel("slot")
+    [(save_name, error)] = results.calls
+    assert save_name == "slot" and isinstance(error, SaveCancelledError)
+    assert results.threads == [threading.current_thread()]
+
+    gate.set()
+    manager.delete_save("other")
+    assert manager.list_saves() == []
+    assert manager.writer.written == 1
+
+
+def test_write_errors_reach_the_callback(manager):
+    results = Results()
+    manager.save_data({"raw": b"bytes"}, "broken", results, wait=True)
+    assert results.wait(1)
+    [(save_name, error)] = results.calls
+    assert save_name == "broken" and isinstance(error, TypeError)
+    assert manager.list_saves() == []
+
+
+def test_flush_from_a_callback_does_not_wait_for_itself(manager):
+    results = Results()
+    manager.save_data({"v": 1}, "slot", lambda name, error: results(name, manager.flush()))
+    assert results.wait(1)
+    assert results.calls == [("slot", True)]
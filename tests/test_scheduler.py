@@ -0,0 +1,133 @@
+import pytest
+
+from lib.Scheduler import Scheduler
+
+
+def test_timers_run_in_deadline_order(clock):
+    scheduler = Scheduler(clock)
+    calls = []
+    scheduler.call_later(0.2, lambda: calls.append("late"))
+    scheduler.call_later(0.1, lambda: calls.append("early"))
+    assert scheduler.tick() == 0
+    assert scheduler.time_until_next() == pytest.approx(0.1)
+    clock.advance(0.25)
+    assert scheduler.tick() == 2
+    assert calls == ["early", "late"]
+    assert not scheduler.has_pending()
+
+
+def test_cancelled_timer_is_dropped(clock):
+    scheduler = Scheduler(clock)
+    calls = []
+    timer = scheduler.call_later(0.1, lambda: calls.append(1))
+    timer.cancel()
+    clock.advance(1)
+    scheduler.tick()
+    assert calls == []
+    assert scheduler.time_until_next() is None
+
+
+def test_repeating_timer_skips_missed_intervals(clock):
+    scheduler = Scheduler(clock)
+    calls = []
+    scheduler.call_every(0.1, lambda: calls.append(clock()))
+    clock.advance(0.55)
+    scheduler.tick()
+    assert len(calls) == 1
+    assert scheduler.time_until_next() == pytest.approx(0.1)
+
+
+def test_timer_scheduled_while_ticking_waits_for_the_next_tick(clock):
+    scheduler = Scheduler(clock)
+    calls = []
+
+    def again():
+        calls.append(1)
+        scheduler.call_later(0, again)
+
+    scheduler.call_later(0, again)
+    assert scheduler.tick() == 1
+    assert scheduler.tick() == 1
+    assert calls == [1, 1]
+
+
+def test_task_steps_follow_their_delays(clock):
+    scheduler = Scheduler(clock)
+    steps = []
+
+    def task():
+        steps.append(1)
+        yield 0.5
+        steps.append(2)
+        yield None
+        steps.append(3)
+
+    handle = scheduler.spawn(task())
+    assert steps == [1]
+    clock.advance(0.4)
+    scheduler.tick()
+    assert steps == [1]
+    clock.advance(0.1)
+    scheduler.tick()
+    assert steps == [1, 2]
+    scheduler.tick()
+    assert steps == [1, 2, 3]
+    assert handle.done and not handle.cancelled
+
+
+def test_finish_runs_the_remaining_steps_at_once(clock):
+    scheduler = Scheduler(clock)
+    steps = []
+
+    def task():
+        for i in range(3):
+            steps.append(i)
+            yield 10
+
+    handle = scheduler.spawn(task())
+    handle.finish()
+    assert steps == [0, 1, 2]
+    assert handle.done
+    assert not scheduler.has_pending()
+
+
+def test_task_cancelled_during_its_own_step_is_not_rescheduled(clock):
+    scheduler = Scheduler(clock)
+    steps = []
+    done = []
+
+    def task():
+        steps.append(1)
+        yield 0.1
+        steps.append(2)
+        handle.cancel()
+        yield 0.1
+        steps.append(3)
+
+    handle = scheduler.spawn(task())
+    handle.add_done_callback(lambda: done.append(1))
+    clock.advance(0.1)
+    scheduler.tick()
+    assert handle.done and handle.cancelled
+    assert not scheduler.has_pending()
+    clock.advance(1)
+    scheduler.tick()
+    assert steps == [1, 2]
+    assert done == [1]
+
+
+def test_failing_task_finishes_and_calls_back(clock):
+    scheduler = Scheduler(clock)
+    done = []
+
+    def task():
+        yield 0
+        raise RuntimeError("boom")
+
+    handle = scheduler.spawn(task())
+    handle.add_done_callback(lambda: done.append(1))
+    scheduler.tick()
+    assert handle.done and done == [1]
+    # Callbacks added afterwards run right away
+    handle.add_done_callback(lambda: done.append(2))
+    assert done == [1, 2]
@@ -0,0 +1,103 @@
+import pytest
+
+from lib.ScreenBuffer import ScreenBuffer
+
+
+@pytest.fixture
+def screen(headless):
+    return ScreenBuffer(headless)
+
+
+def test_only_changed_cells_are_written(screen, headless):
+    win = screen.newwin(5, 20, 2, 3)
+    win.addstr(0, 0, "hello world")
+    win.refresh()
+    assert screen.flush()
+    assert headless.find("hello world") == (2, 3)
+
+    headless.reset_counters()
+    win.addstr(0, 0, "jello world")
+    win.refresh()
+    screen.flush()
+    assert headless.cells_written == 1
+    assert headless.find("jello world") == (2, 3)
+
+
+def test_flush_without_changes_writes_nothing(screen, headless):
+    screen.root.addstr(0, 0, "text")
+    screen.root.refresh()
+    screen.flush()
+    screen.root.addstr(0, 0, "text")
+    screen.root.refresh()
+    headless.reset_counters()
+    assert screen.flush()
+    assert headless.cells_written == 0
+    assert not screen.flush()
+
+
+def test_attributes_count_as_changes(screen, headless):
+    screen.root.addstr(1, 1, "abc")
+    screen.root.refresh()
+    screen.flush()
+    screen.root.addstr(1, 1, "abc", 512)
+    screen.root.refresh()
+    screen.flush()
+    assert headless.attr_at(1, 1) == 512
+
+
+def test_clear_repaints_every_cell(screen, headless):
+    screen.root.addstr(0, 0, "abc")
+    screen.root.refresh()
+    screen.flush()
+    headless.reset_counters()
+    screen.root.clear()
+    screen.root.refresh()
+    screen.flush()
+    lines, cols = headless.getmaxyx()
+    assert headless.cells_written == lines * cols
+    assert headless.find("abc") is None
+
+
+def test_pad_copies_the_requested_region(screen, headless):
+    pad = screen.newpad(10, 40)
+    for y in range(10):
+        pad.addstr(y, 0, f"row {y}")
+    pad.refresh(4, 0, 1, 2, 3, 20)
+    screen.flush()
+    assert headless.find("row 4") == (1, 2)
+    assert headless.find("row 6") == (3, 2)
+    assert headless.find("row 7") is None
+
+
+def test_shift_moves_contents_and_blanks_the_exposed_cells(screen, headless):
+    win = screen.newwin(4, 7)
+    for y, text in enumerate(["abcdef", "ghijkl", "mnopqr", "stuvwx"]):
+        win.addstr(y, 0, text)
+    # The 3x4 area at (1, 1) moves one row up and two columns right
+    win.shift(-1, 2, 1, 1, 3, 4)
+    win.refresh()
+    screen.flush()
+    assert headless.lines()[:4] == [line.ljust(80) for line in ["abcdef", "g  nol", "m  tur", "s    x"]]
+
+
+def test_resize_keeps_fitting_cells_and_repaints(screen, headless):
+    screen.root.addstr(0, 0, "top left")
+    screen.root.refresh()
+    screen.flush()
+
+    headless.resize(30, 100)
+    screen.resize(30, 100)
+    assert screen.getmaxyx() == (30, 100)
+    assert screen.root.getmaxyx() == (30, 100)
+    headless.reset_counters()
+    screen.root.addstr(29, 90, "corner")
+    screen.root.refresh()
+    screen.flush()
+    assert headless.cells_written == 30 * 100
+    assert headless.find("top left") == (0, 0)
+    assert headless.find("corner") == (29, 90)
+
+    headless.resize(5, 10)
+    screen.resize(5, 10)
+    screen.flush()
+    assert headless.lines() == ["top left  "] + [" " * 10] * 4
@@ -0,0 +1,113 @@
+import time
+
+import pytest
+
+from lib.EventSystem import EventSystem
+from lib.InputController import InputController
+from lib.Scheduler import Scheduler
+from lib.SessionRecorder import (
+    HEADER, MAGIC, SessionFormatError, SessionPlayer, SessionRecorder, VirtualClock, read_session)
+
+
+def record(path, keys=(ord("a"), ord("b")), pause: float = 0.0):
+    """Record a session where every key also emits an event named after it"""
+    controller = InputController()
+    system = EventSystem()
+    for key in set(keys):
+        controller.add_input_event(key, lambda key=key: system.emit(f"key.{chr(key)}"))
+    with SessionRecorder(str(path)) as recorder:
+        recorder.start(controller, system)
+        for key in keys:
+            controller.handle_key(key)
+            time.sleep(pause)
+    return recorder
+
+
+def test_recording_round_trip(tmp_path):
+    path = tmp_path / "session.rec"
+    recorder = record(path, keys=(ord("a"), ord("b"), ord("a")))
+    assert not recorder.recording
+    assert (recorder.keys, recorder.events) == (3, 3)
+
+    entries = list(read_session(str(path)))
+    assert [(entry.kind, entry.value) for entry in entries] == [
+        ("key", ord("a")), ("event", "key.a"),
+        ("key", ord("b")), ("event", "key.b"),
+        ("key", ord("a")), ("event", "key.a"),
+    ]
+    times = [entry.time for entry in entries]
+    assert times == sorted(times)
+
+
+def test_replay_matches_the_recorded_events(tmp_path):
+    path = tmp_path / "session.rec"
+    record(path)
+
+    controller = InputController()
+    system = EventSystem()
+    calls = []
+    for key in (ord("a"), ord("b")):
+        controller.add_input_event(key, lambda key=key: system.emit(f"key.{chr(key)}"))
+    system.subscribe("key.a", lambda e: calls.append(e.event_name))
+
+    stats = SessionPlayer(str(path)).replay(controller, system)
+    assert (stats.keys, stats.events, stats.event_mismatches) == (2, 2, 0)
+    assert calls == ["key.a"]
+
+
+def test_replay_reports_diverging_events(tmp_path):
+    path = tmp_path / "session.rec"
+    record(path)
+    controller = InputController()
+    system = EventSystem()
+    controller.add_input_event("a", lambda: system.emit("other"))
+    stats = SessionPlayer(str(path)).replay(controller, system)
+    assert stats.event_mismatches == 2
+
+
+def test_replay_events_without_the_game(tmp_path):
+    path = tmp_path / "session.rec"
+    record(path)
+    system = EventSystem()
+    calls = []
+    system.subscribe("key.*", lambda e: calls.append(e.event_name))
+    stats = SessionPlayer(str(path)).replay(event_system=system, replay_events=True)
+    assert calls == ["key.a", "key.b"]
+    assert stats.events == 2
+
+
+def test_virtual_clock_fires_timers_between_keys(tmp_path):
+    path = tmp_path / "session.rec"
+    record(path, pause=0.05)
+    player = SessionPlayer(str(path))
+
+    clock = VirtualClock()
+    scheduler = Scheduler(clock)
+    controller = InputController()
+    calls = []
+    controller.add_input_event("a", lambda: calls.append("a"))
+    controller.add_input_event("b", lambda: calls.append("b"))
+    scheduler.call_later(0.025, lambda: calls.append("timer"))
+
+    started = time.perf_counter()
+    stats = player.replay(controller, scheduler=scheduler, clock=clock)
+    assert calls == ["a", "timer", "b"]
+    assert clock() == pytest.approx(player.duration)
+    assert time.perf_counter() - started < player.duration
+    assert stats.frames == 3
+
+
+def test_invalid_recordings_are_rejected(tmp_path):
+    path = tmp_path / "session.rec"
+    path.write_bytes(b"nope")
+    with pytest.raises(SessionFormatError):
+        list(read_session(str(path)))
+
+    path.write_bytes(HEADER.pack(MAGIC, 1, 0.0))
+    with pytest.raises(SessionFormatError):
+        list(read_session(str(path)))
+
+    record(path)
+    path.write_bytes(path.read_bytes()[:-2])
+    with pytest.raises(SessionFormatError):
+        list(read_session(str(path)))
@@ -0,0 +1,52 @@
+FRAMES = ["#" * 10, "=" * 10, "*" * 10]
+
+
+def test_animation_draws_one_frame_per_delay(consolas, headless, clock, scheduler):
+    widget = consolas.create_animation(FRAMES, delay=0.1, audio=False)
+    consolas.flush()
+    assert headless.find("#" * 10) is not None
+    assert headless.find("=" * 10) is None
+
+    clock.advance(0.1)
+    scheduler.tick()
+    consolas.flush()
+    assert headless.find("=" * 10) is not None
+    assert not widget.animation.done
+
+    clock.advance(0.1)
+    scheduler.tick()
+    consolas.flush()
+    assert headless.find("*" * 10) is not None
+    # The last frame is shown for its delay too
+    assert not widget.animation.done
+    clock.advance(0.1)
+    scheduler.tick()
+    assert widget.animation.done
+
+
+def test_animation_without_delay_is_drawn_at_once(consolas, headless):
+    widget = consolas.create_animation(FRAMES, delay=0, audio=False)
+    consolas.flush()
+    assert all(headless.find(frame) for frame in FRAMES)
+    assert widget.animation.done
+
+
+def test_clearing_the_screen_cancels_running_animations(consolas, headless, clock, scheduler):
+    first = consolas.create_animation(FRAMES, delay=0.1, audio=False)
+    second = consolas.create_animation(["+" * 4], delay=0.1, audio=False)
+    assert first.animation.cancelled
+    assert not second.animation.cancelled
+
+    clock.advance(1)
+    scheduler.tick()
+    consolas.flush()
+    assert headless.find("=" * 10) is None
+    assert headless.find("+" * 4) is not None
+
+
+def test_player_map_cancels_the_previous_screen(consolas):
+    from tests.levels import OpenFieldLevel
+
+    animation = consolas.create_animation(FRAMES, delay=0.1, audio=False)
+    consolas.create_player_map(level_map=OpenFieldLevel(30, 12))
+    assert animation.animation.cancelled
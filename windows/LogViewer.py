@@ -0,0 +1,154 @@
+import dearpygui.dearpygui as dpg
+import datetime
+import os
+import threading
+from lib.Logger import logger
+from lib.LogIndex import LogIndex, parse_time
+
+PAGE_SIZE = 200
+LEVELS = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+
+
+class LogViewer:
+    """
+    Window for browsing the structured game logs (Config.structuredLog)
+
+    The selected LOG__*.jsonl file gets a sidecar index (lib.LogIndex),
+    built on a background thread and extended when the log grows. Filters
+    only scan the index, and only the shown page is read from the log.
+    """
+    def __init__(self):
+        self.window_id = None
+        self.log_folder = os.path.join(os.path.dirname(os.path.dirname(__file__)), "Assets", "LOG")
+        self.index = None
+        self.page_number = 0
+        self.has_more = False
+        self.indexing = False
+        # Matches of the shown filter: (filter, indexed lines, LogIndex.select result)
+        self.selection = None
+
+    def show(self):
+        if self.window_id and dpg.does_item_exist(self.window_id):
+            dpg.show_item(self.window_id)
+            return
+
+        self._create_window()
+
+    def _create_window(self):
+        with dpg.window(label="Log Viewer", width=900, height=600, pos=[420, 50]) as self.window_id:
+            with dpg.group(horizontal=True):
+                dpg.add_combo(self._log_files(), label="Log", width=360, tag="log_viewer_file",
+                              callback=self._select_file)
+                dpg.add_button(label="Refresh", callback=self._refresh_files)
+                dpg.add_button(label="Update Index", callback=self._build_index)
+
+            with dpg.group(horizontal=True):
+                dpg.add_combo(LEVELS, label="Min level", default_value="DEBUG", width=100,
+                              tag="log_viewer_level")
+                dpg.add_input_text(label="Modules", hint="lib.widgets, controller", width=200,
+                                   tag="log_viewer_modules")
+                dpg.add_input_text(label="From", hint="YYYY-MM-DD HH:MM:SS", width=150,
+                                   tag="log_viewer_from")
+                dpg.add_input_text(label="To", hint="HH:MM:SS", width=150, tag="log_viewer_to")
+                dpg.add_button(label="Apply", callback=self._apply_filter)
+
+            with dpg.group(horizontal=True):
+                dpg.add_button(label="< Prev", callback=self._previous_page)
+                dpg.add_button(label="Next >", callback=self._next_page)
+                dpg.add_text("No log selected", tag="log_viewer_status")
+
+            dpg.add_separator()
+
+            with dpg.table(header_row=True, resizable=True, scrollY=True, height=-1,
+                           borders_innerH=True, tag="log_viewer_table"):
+                dpg.add_table_column(label="Time", width_fixed=True)
+                dpg.add_table_column(label="Level", width_fixed=True)
+                dpg.add_table_column(label="Module", width_fixed=True)
+                dpg.add_table_column(label="Message")
+
+    def _log_files(self):
+        """Structured logs, newest first"""
+        if not os.path.isdir(self.log_folder):
+            return []
+        return sorted((name for name in os.listdir(self.log_folder) if name.endswith(".jsonl")), reverse=True)
+
+    def _refresh_files(self):
+        dpg.configure_item("log_viewer_file", items=self._log_files())
+
+    def _select_file(self, sender, app_data):
+        self.index = LogIndex(os.path.join(self.log_folder, app_data))
+        self.selection = None
+        self._build_index()
+
+    def _build_index(self):
+        if self.index is None or self.indexing:
+            return
+        self.indexing = True
+        threading.Thread(target=self._index_worker, daemon=True).start()
+
+    def _index_worker(self):
+        try:
+            added = self.index.update(progress=self._show_progress)
+            logger.info("Log index updated: %s (%d new lines)", self.index.path, added)
+        except OSError as e:
+            logger.error(f"Error indexing log: {e}")
+            self._set_status(f"Index failed: {e}")
+            return
+        finally:
+            self.indexing = False
+        self.page_number = 0
+        self._show_page()
+
+    def _show_progress(self, done, total):
+        percent = done * 100 // total if total else 100
+        self._set_status(f"Indexing... {percent}%")
+
+    def _apply_filter(self):
+        self.page_number = 0
+        self._show_page()
+
+    def _previous_page(self):
+        if self.page_number > 0:
+            self.page_number -= 1
+            self._show_page()
+
+    def _next_page(self):
+        if self.has_more:
+            self.page_number += 1
+            self._show_page()
+
+    def _filter(self):
+        modules = [module.strip() for module in dpg.get_value("log_viewer_modules").split(",") if module.strip()]
+        return (dpg.get_value("log_viewer_level"), modules or None,
+                parse_time(dpg.get_value("log_viewer_from")), parse_time(dpg.get_value("log_viewer_to")))
+
+    def _show_page(self):
+        if self.index is None or self.indexing:
+            return
+        try:
+            level, modules, start, end = self._filter()
+        except ValueError as e:
+            self._set_status(str(e))
+            return
+
+        key = ((level, modules, start, end), len(self.index))
+        if self.selection is None or self.selection[:2] != key:
+            self.selection = key + (self.index.select(level, modules, start, end),)
+        records, self.has_more = self.index.page(self.selection[2], self.page_number * PAGE_SIZE, PAGE_SIZE)
+
+        dpg.delete_item("log_viewer_table", children_only=True, slot=1)
+        for record in records:
+            moment = datetime.datetime.fromtimestamp(record.get("time", 0.0))
+            with dpg.table_row(parent="log_viewer_table"):
+                dpg.add_text(moment.strftime("%Y-%m-%d %H:%M:%S"))
+                dpg.add_text(record.get("level", ""))
+                dpg.add_text(record.get("module", ""))
+                dpg.add_text(record.get("message", ""))
+
+        first = self.page_number * PAGE_SIZE
+        self._set_status(f"Lines {first + 1}-{first + len(records)}{'+' if self.has_more else ''} "
+                         f"of {len(self.index)} indexed")
+
+    def _set_status(self, message):
+        if dpg.does_item_exist("log_viewer_status"):
+            dpg.set_value("log_viewer_status", message)